@@ -0,0 +1,42 @@
+"""add_entrega_unique_key
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-19 22:00:00.000000
+
+Uma entrega por aluno e atividade, chave do lançamento de notas em lote
+(upsert). Entregas duplicadas são removidas, mantendo a mais recente; a
+restrição única substitui o índice ix_entregas_atividade_aluno.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a3b4c5d6e7f8"
+down_revision = "f2a3b4c5d6e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM entregas_atividades e
+        USING entregas_atividades mais_recente
+        WHERE e.atividade_id = mais_recente.atividade_id
+          AND e.aluno_id = mais_recente.aluno_id
+          AND e.id < mais_recente.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_entrega_atividade_aluno", "entregas_atividades", ["atividade_id", "aluno_id"]
+    )
+    op.drop_index("ix_entregas_atividade_aluno", table_name="entregas_atividades")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_entregas_atividade_aluno", "entregas_atividades", ["atividade_id", "aluno_id"]
+    )
+    op.drop_constraint("uq_entrega_atividade_aluno", "entregas_atividades", type_="unique")
@@ -0,0 +1,116 @@
+"""create_arquivo_mensagens_notificacoes
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mensagens_arquivadas",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("remetente_id", sa.Integer(), nullable=False),
+        sa.Column("destinatario_id", sa.Integer(), nullable=False),
+        sa.Column("assunto", sa.String(), nullable=False),
+        sa.Column("conteudo", sa.Text(), nullable=False),
+        sa.Column(
+            "tipo_midia",
+            postgresql.ENUM("TEXTO", "AUDIO", "VIDEO", "IMAGEM", name="tipomidia", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("midia_url", sa.String(), nullable=True),
+        sa.Column("enviada_em", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("lida_em", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("confirmacao_leitura", sa.Boolean(), nullable=True),
+        sa.Column(
+            "arquivada_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["destinatario_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["remetente_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_mensagens_arquivadas_destinatario",
+        "mensagens_arquivadas",
+        ["destinatario_id", "enviada_em"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_mensagens_arquivadas_remetente",
+        "mensagens_arquivadas",
+        ["remetente_id", "enviada_em"],
+        unique=False,
+    )
+
+    op.create_table(
+        "notificacoes_arquivadas",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("usuario_id", sa.Integer(), nullable=False),
+        sa.Column("titulo", sa.String(), nullable=False),
+        sa.Column("mensagem", sa.Text(), nullable=False),
+        sa.Column(
+            "tipo",
+            postgresql.ENUM(
+                "AVISO", "LEMBRETE", "ALERTA", "INFORMACAO", name="tiponotificacao", create_type=False
+            ),
+            nullable=True,
+        ),
+        sa.Column("link_referencia", sa.String(), nullable=True),
+        sa.Column("lida", sa.Boolean(), nullable=True),
+        sa.Column("criada_em", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("lida_em", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "arquivada_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["usuario_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_notificacoes_arquivadas_usuario",
+        "notificacoes_arquivadas",
+        ["usuario_id", "criada_em"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    # Devolve os itens arquivados às tabelas de origem antes de removê-las
+    op.execute("""
+        INSERT INTO mensagens (id, remetente_id, destinatario_id, assunto, conteudo, tipo_midia,
+                               midia_url, enviada_em, lida_em, confirmacao_leitura)
+        SELECT id, remetente_id, destinatario_id, assunto, conteudo, tipo_midia,
+               midia_url, enviada_em, lida_em, confirmacao_leitura
+        FROM mensagens_arquivadas
+        ON CONFLICT (id) DO NOTHING
+    """)
+    op.execute("""
+        INSERT INTO notificacoes (id, usuario_id, titulo, mensagem, tipo, link_referencia,
+                                  lida, criada_em, lida_em)
+        SELECT id, usuario_id, titulo, mensagem, tipo, link_referencia, lida, criada_em, lida_em
+        FROM notificacoes_arquivadas
+        ON CONFLICT (id) DO NOTHING
+    """)
+    op.drop_index("ix_notificacoes_arquivadas_usuario", table_name="notificacoes_arquivadas")
+    op.drop_table("notificacoes_arquivadas")
+    op.drop_index("ix_mensagens_arquivadas_remetente", table_name="mensagens_arquivadas")
+    op.drop_index("ix_mensagens_arquivadas_destinatario", table_name="mensagens_arquivadas")
+    op.drop_table("mensagens_arquivadas")
@@ -0,0 +1,50 @@
+"""create_eventos_dominio
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-19 23:00:00.000000
+
+Fila (outbox) de eventos de domínio distribuídos em notificações por uma
+tarefa de fundo. ``chave`` é a chave de idempotência da publicação.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b4c5d6e7f8a9"
+down_revision = "a3b4c5d6e7f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "eventos_dominio",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tipo", sa.String(length=50), nullable=False),
+        sa.Column("chave", sa.String(length=200), nullable=False),
+        sa.Column("dados", sa.JSON(), nullable=False),
+        sa.Column(
+            "criado_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("processado_em", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("ultimo_usuario_id", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("destinatarios", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("tentativas", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("erro", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("chave"),
+    )
+    op.create_index(
+        op.f("ix_eventos_dominio_processado_em"), "eventos_dominio", ["processado_em"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_eventos_dominio_processado_em"), table_name="eventos_dominio")
+    op.drop_table("eventos_dominio")
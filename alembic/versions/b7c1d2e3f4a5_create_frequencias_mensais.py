@@ -0,0 +1,61 @@
+"""create_frequencias_mensais
+
+Revision ID: b7c1d2e3f4a5
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b7c1d2e3f4a5"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per student/turma/month; days are bits in dias_letivos/presencas
+    op.create_table(
+        "frequencias_mensais",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("turma_id", sa.Integer(), nullable=False),
+        sa.Column("ano", sa.SmallInteger(), nullable=False),
+        sa.Column("mes", sa.SmallInteger(), nullable=False),
+        sa.Column("dias_letivos", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("presencas", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_aulas", sa.SmallInteger(), nullable=False, server_default="0"),
+        sa.Column("total_presencas", sa.SmallInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["aluno_id"], ["alunos.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["turma_id"], ["turmas.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "aluno_id", "turma_id", "ano", "mes", name="uq_frequencia_aluno_turma_mes"
+        ),
+    )
+    op.create_index(
+        op.f("ix_frequencias_mensais_id"), "frequencias_mensais", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_frequencias_mensais_aluno_id"),
+        "frequencias_mensais",
+        ["aluno_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_frequencias_mensais_turma_periodo",
+        "frequencias_mensais",
+        ["turma_id", "ano", "mes"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_frequencias_mensais_turma_periodo", table_name="frequencias_mensais")
+    op.drop_index(op.f("ix_frequencias_mensais_aluno_id"), table_name="frequencias_mensais")
+    op.drop_index(op.f("ix_frequencias_mensais_id"), table_name="frequencias_mensais")
+    op.drop_table("frequencias_mensais")
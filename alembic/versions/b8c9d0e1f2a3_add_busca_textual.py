@@ -0,0 +1,43 @@
+"""add_busca_textual
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19 17:00:00.000000
+
+Colunas tsvector geradas (configuração 'portuguese', título com peso A e
+corpo com peso B) e índices GIN para a busca em /api/busca. Adicionar uma
+coluna STORED reescreve a tabela: em bases grandes, rode fora do horário de uso.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+# tabela -> (coluna de título, coluna de corpo)
+TABELAS = {
+    "mensagens": ("assunto", "conteudo"),
+    "atividades": ("titulo", "descricao"),
+    "eventos_escolares": ("titulo", "descricao"),
+}
+
+
+def upgrade() -> None:
+    for tabela, (titulo, corpo) in TABELAS.items():
+        op.execute(f"""
+            ALTER TABLE {tabela} ADD COLUMN busca tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('portuguese', coalesce({titulo}, '')), 'A') ||
+                setweight(to_tsvector('portuguese', coalesce({corpo}, '')), 'B')
+            ) STORED
+        """)
+        op.create_index(f"ix_{tabela}_busca", tabela, ["busca"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    for tabela in TABELAS:
+        op.drop_index(f"ix_{tabela}_busca", table_name=tabela)
+        op.drop_column(tabela, "busca")
@@ -0,0 +1,44 @@
+"""add_avaliacao_unique_key
+
+Revision ID: c3d4e5f6a7b8
+Revises: b7c1d2e3f4a5
+Create Date: 2026-10-19 10:00:00.000000
+
+Avaliações duplicadas (mesmo aluno, disciplina, título e data) são removidas
+antes da restrição, mantendo a mais recente.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c3d4e5f6a7b8"
+down_revision = "b7c1d2e3f4a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM avaliacoes a
+        USING avaliacoes mais_recente
+        WHERE a.aluno_id = mais_recente.aluno_id
+          AND a.disciplina_id = mais_recente.disciplina_id
+          AND a.titulo = mais_recente.titulo
+          AND a.data_avaliacao = mais_recente.data_avaliacao
+          AND a.id < mais_recente.id
+        """
+    )
+    # Natural key used by the bulk grade upsert (one grade per student per assessment)
+    op.create_unique_constraint(
+        "uq_avaliacao_aluno_disciplina_titulo_data",
+        "avaliacoes",
+        ["aluno_id", "disciplina_id", "titulo", "data_avaliacao"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_avaliacao_aluno_disciplina_titulo_data", "avaliacoes", type_="unique"
+    )
@@ -0,0 +1,41 @@
+"""add_notificacoes_agrupamento
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-20 00:00:00.000000
+
+Resumos de notificações: as do mesmo tipo e turma, dentro de uma janela,
+são reunidas em uma linha (``quantidade`` itens).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5d6e7f8a9b0"
+down_revision = "b4c5d6e7f8a9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("notificacoes", sa.Column("chave_agrupamento", sa.String(length=60), nullable=True))
+    op.add_column("notificacoes", sa.Column("agrupada_desde", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "notificacoes",
+        sa.Column("quantidade", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.create_index(
+        "ix_notificacoes_usuario_agrupamento",
+        "notificacoes",
+        ["usuario_id", "chave_agrupamento"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notificacoes_usuario_agrupamento", table_name="notificacoes")
+    op.drop_column("notificacoes", "quantidade")
+    op.drop_column("notificacoes", "agrupada_desde")
+    op.drop_column("notificacoes", "chave_agrupamento")
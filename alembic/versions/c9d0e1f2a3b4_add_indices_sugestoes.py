@@ -0,0 +1,42 @@
+"""add_indices_sugestoes
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19 18:00:00.000000
+
+Índices do autocompletar (/api/busca/sugestoes): trigramas em
+users.nome_completo para ILIKE '%termo%' e índices de prefixo em
+lower(matricula) e cpf para LIKE 'termo%'.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c9d0e1f2a3b4"
+down_revision = "b8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_users_nome_completo_trgm ON users USING gin (nome_completo gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_alunos_matricula_prefixo ON alunos (lower(matricula) text_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_professores_matricula_prefixo ON professores (lower(matricula) text_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_responsaveis_cpf_prefixo ON responsaveis (cpf varchar_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_responsaveis_cpf_prefixo", table_name="responsaveis")
+    op.drop_index("ix_professores_matricula_prefixo", table_name="professores")
+    op.drop_index("ix_alunos_matricula_prefixo", table_name="alunos")
+    op.drop_index("ix_users_nome_completo_trgm", table_name="users")
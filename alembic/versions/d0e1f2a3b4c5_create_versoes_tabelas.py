@@ -0,0 +1,37 @@
+"""create_versoes_tabelas
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19 19:00:00.000000
+
+Contador de alterações por tabela usado nos ETags das rotas de leitura
+(app/utils/cache_http.py). Incrementado pela aplicação na mesma transação
+da escrita.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d0e1f2a3b4c5"
+down_revision = "c9d0e1f2a3b4"
+branch_labels = None
+depends_on = None
+
+TABELAS = ("escolas", "disciplinas", "turmas", "peis")
+
+
+def upgrade() -> None:
+    versoes = op.create_table(
+        "versoes_tabelas",
+        sa.Column("tabela", sa.String(length=63), nullable=False),
+        sa.Column("versao", sa.BigInteger(), nullable=False),
+        sa.Column("atualizado_em", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("tabela"),
+    )
+    op.bulk_insert(versoes, [{"tabela": tabela, "versao": 1} for tabela in TABELAS])
+
+
+def downgrade() -> None:
+    op.drop_table("versoes_tabelas")
@@ -0,0 +1,89 @@
+"""create_medias_disciplinas
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6a7b8c9"
+down_revision = "c3d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "medias_disciplinas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("aluno_id", sa.Integer(), nullable=False),
+        sa.Column("disciplina_id", sa.Integer(), nullable=False),
+        sa.Column("ano", sa.SmallInteger(), nullable=False),
+        sa.Column("periodo", sa.SmallInteger(), nullable=False),
+        sa.Column("soma_ponderada", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("soma_pesos", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("total_avaliacoes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("media", sa.Float(), nullable=True),
+        sa.Column(
+            "atualizado_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["aluno_id"], ["alunos.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["disciplina_id"], ["disciplinas.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "aluno_id", "disciplina_id", "ano", "periodo",
+            name="uq_media_aluno_disciplina_periodo",
+        ),
+    )
+    op.create_index(
+        op.f("ix_medias_disciplinas_id"), "medias_disciplinas", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_medias_disciplinas_aluno_id"),
+        "medias_disciplinas",
+        ["aluno_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_medias_disciplinas_ranking",
+        "medias_disciplinas",
+        ["disciplina_id", "ano", "periodo", "media"],
+        unique=False,
+    )
+
+    # Backfill from existing grades (period = quarter of the year)
+    op.execute(
+        """
+        INSERT INTO medias_disciplinas
+            (aluno_id, disciplina_id, ano, periodo,
+             soma_ponderada, soma_pesos, total_avaliacoes, media)
+        SELECT aluno_id,
+               disciplina_id,
+               EXTRACT(YEAR FROM data_avaliacao)::int,
+               (EXTRACT(MONTH FROM data_avaliacao)::int - 1) / 3 + 1,
+               SUM(nota * COALESCE(peso, 1.0)),
+               SUM(COALESCE(peso, 1.0)),
+               COUNT(*),
+               CASE WHEN SUM(COALESCE(peso, 1.0)) > 0
+                    THEN SUM(nota * COALESCE(peso, 1.0)) / SUM(COALESCE(peso, 1.0))
+               END
+        FROM avaliacoes
+        WHERE nota IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_medias_disciplinas_ranking", table_name="medias_disciplinas")
+    op.drop_index(op.f("ix_medias_disciplinas_aluno_id"), table_name="medias_disciplinas")
+    op.drop_index(op.f("ix_medias_disciplinas_id"), table_name="medias_disciplinas")
+    op.drop_table("medias_disciplinas")
@@ -0,0 +1,35 @@
+"""add_agrupamento_notificacoes_arquivadas
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-20 01:00:00.000000
+
+Resumos arquivados preservam ``quantidade`` e ``chave_agrupamento``
+(o arquivamento copia as colunas em comum com ``notificacoes``).
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d6e7f8a9b0c1"
+down_revision = "c5d6e7f8a9b0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notificacoes_arquivadas",
+        sa.Column("chave_agrupamento", sa.String(length=60), nullable=True),
+    )
+    op.add_column(
+        "notificacoes_arquivadas",
+        sa.Column("quantidade", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("notificacoes_arquivadas", "quantidade")
+    op.drop_column("notificacoes_arquivadas", "chave_agrupamento")
@@ -0,0 +1,52 @@
+"""add_escola_id_escopo
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19 20:00:00.000000
+
+Escopo por escola (app/utils/escopo_escola.py): alunos, atividades e
+eventos_escolares passam a guardar o escola_id da turma, e as tabelas
+consultadas por escola ganham índices compostos começando por escola_id.
+O índice simples ix_turmas_escola_id fica coberto por ix_turmas_escola_ano.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e1f2a3b4c5d6"
+down_revision = "d0e1f2a3b4c5"
+branch_labels = None
+depends_on = None
+
+# tabela -> (índice, colunas após escola_id)
+INDICES = {
+    "alunos": ("ix_alunos_escola_turma", ["turma_id"]),
+    "atividades": ("ix_atividades_escola_entrega", ["data_entrega"]),
+    "eventos_escolares": ("ix_eventos_escolares_escola_data", ["data_evento"]),
+}
+
+
+def upgrade() -> None:
+    for tabela, (indice, colunas) in INDICES.items():
+        op.add_column(tabela, sa.Column("escola_id", sa.Integer(), nullable=True))
+        op.create_foreign_key(f"fk_{tabela}_escola_id_escolas", tabela, "escolas", ["escola_id"], ["id"])
+        op.execute(
+            f"UPDATE {tabela} SET escola_id = turmas.escola_id "
+            f"FROM turmas WHERE {tabela}.turma_id = turmas.id"
+        )
+        op.create_index(indice, tabela, ["escola_id", *colunas])
+
+    op.create_index("ix_turmas_escola_ano", "turmas", ["escola_id", "ano_letivo"])
+    op.drop_index("ix_turmas_escola_id", table_name="turmas")
+
+
+def downgrade() -> None:
+    op.create_index("ix_turmas_escola_id", "turmas", ["escola_id"])
+    op.drop_index("ix_turmas_escola_ano", table_name="turmas")
+
+    for tabela, (indice, _) in INDICES.items():
+        op.drop_index(indice, table_name=tabela)
+        op.drop_constraint(f"fk_{tabela}_escola_id_escolas", tabela, type_="foreignkey")
+        op.drop_column(tabela, "escola_id")
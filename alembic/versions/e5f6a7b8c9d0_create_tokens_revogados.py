@@ -0,0 +1,47 @@
+"""create_tokens_revogados
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tokens_revogados",
+        sa.Column("jti", sa.String(length=32), nullable=False),
+        sa.Column("expira_em", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "revogado_em",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index(
+        op.f("ix_tokens_revogados_expira_em"), "tokens_revogados", ["expira_em"], unique=False
+    )
+    op.create_index(
+        op.f("ix_tokens_revogados_revogado_em"),
+        "tokens_revogados",
+        ["revogado_em"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tokens_revogados_revogado_em"), table_name="tokens_revogados")
+    op.drop_index(op.f("ix_tokens_revogados_expira_em"), table_name="tokens_revogados")
+    op.drop_table("tokens_revogados")
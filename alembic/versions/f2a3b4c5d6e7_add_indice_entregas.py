@@ -0,0 +1,29 @@
+"""add_indice_entregas
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-19 21:00:00.000000
+
+Índice (atividade_id, aluno_id) em entregas_atividades para o LEFT JOIN da
+matriz de entregas da turma, o NOT EXISTS das atividades pendentes do aluno
+e a listagem de entregas de uma atividade.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f2a3b4c5d6e7"
+down_revision = "e1f2a3b4c5d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_entregas_atividade_aluno", "entregas_atividades", ["atividade_id", "aluno_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entregas_atividade_aluno", table_name="entregas_atividades")
@@ -0,0 +1,135 @@
+"""partition_metricas_engajamento
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-19 15:00:00.000000
+
+Converte metricas_engajamento em tabela particionada por mês (RANGE em
+"timestamp"). A chave primária passa a ser (id, timestamp), exigência do
+particionamento; o id continua vindo da mesma sequence. As partições futuras
+são criadas pela manutenção periódica (ParticionamentoService).
+"""
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+COLUNAS = (
+    'id, usuario_id, acao, categoria, referencia_id, referencia_tipo, '
+    'tempo_sessao, "timestamp", dispositivo, navegador'
+)
+INDICES = ["acao", "categoria", "id", "timestamp", "usuario_id"]
+MESES_ADIANTE = 3
+MESES_ATRAS = 24  # METRICAS_RETENCAO_MESES padrão: aceita cargas retroativas
+
+
+def _somar_meses(mes: date, meses: int) -> date:
+    anos, indice = divmod(mes.month - 1 + meses, 12)
+    return date(mes.year + anos, indice + 1, 1)
+
+
+def _criar_indices(tabela: str):
+    for coluna in INDICES:
+        op.create_index(f"ix_metricas_engajamento_{coluna}", tabela, [coluna], unique=False)
+
+
+def _remover_indices(tabela: str):
+    for coluna in INDICES:
+        op.drop_index(f"ix_metricas_engajamento_{coluna}", table_name=tabela)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE metricas_engajamento RENAME TO metricas_engajamento_antiga")
+    op.execute(
+        "ALTER TABLE metricas_engajamento_antiga "
+        "RENAME CONSTRAINT metricas_engajamento_pkey TO metricas_engajamento_antiga_pkey"
+    )
+    _remover_indices("metricas_engajamento_antiga")
+    op.execute("ALTER SEQUENCE metricas_engajamento_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE metricas_engajamento (
+            id integer NOT NULL DEFAULT nextval('metricas_engajamento_id_seq'),
+            usuario_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            acao varchar NOT NULL,
+            categoria varchar,
+            referencia_id integer,
+            referencia_tipo varchar,
+            tempo_sessao double precision,
+            "timestamp" timestamptz NOT NULL DEFAULT now(),
+            dispositivo varchar,
+            navegador varchar,
+            CONSTRAINT metricas_engajamento_pkey PRIMARY KEY (id, "timestamp")
+        ) PARTITION BY RANGE ("timestamp")
+    """)
+    op.execute("ALTER SEQUENCE metricas_engajamento_id_seq OWNED BY metricas_engajamento.id")
+    _criar_indices("metricas_engajamento")
+
+    # Uma partição por mês, do início da janela de retenção (ou do registro mais
+    # antigo, se anterior) até alguns meses à frente
+    minimo, maximo = op.get_bind().execute(
+        sa.text('SELECT min("timestamp"), max("timestamp") FROM metricas_engajamento_antiga')
+    ).one()
+    mes_atual = datetime.now(timezone.utc).date().replace(day=1)
+    mes = _somar_meses(mes_atual, -MESES_ATRAS)
+    if minimo:
+        mes = min(mes, minimo.astimezone(timezone.utc).date().replace(day=1))
+    fim = _somar_meses(mes_atual, MESES_ADIANTE)
+    if maximo:
+        fim = max(fim, maximo.astimezone(timezone.utc).date().replace(day=1))
+    while mes <= fim:
+        op.execute(
+            f"CREATE TABLE metricas_engajamento_p{mes:%Y%m} PARTITION OF metricas_engajamento "
+            f"FOR VALUES FROM ('{mes.isoformat()} 00:00:00+00') "
+            f"TO ('{_somar_meses(mes, 1).isoformat()} 00:00:00+00')"
+        )
+        mes = _somar_meses(mes, 1)
+
+    op.execute(f"""
+        INSERT INTO metricas_engajamento ({COLUNAS})
+        SELECT id, usuario_id, acao, categoria, referencia_id, referencia_tipo,
+               tempo_sessao, COALESCE("timestamp", now()), dispositivo, navegador
+        FROM metricas_engajamento_antiga
+    """)
+    op.drop_table("metricas_engajamento_antiga")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE metricas_engajamento RENAME TO metricas_engajamento_particionada")
+    op.execute(
+        "ALTER TABLE metricas_engajamento_particionada "
+        "RENAME CONSTRAINT metricas_engajamento_pkey TO metricas_engajamento_particionada_pkey"
+    )
+    _remover_indices("metricas_engajamento_particionada")
+    op.execute("ALTER SEQUENCE metricas_engajamento_id_seq OWNED BY NONE")
+
+    op.execute("""
+        CREATE TABLE metricas_engajamento (
+            id integer NOT NULL DEFAULT nextval('metricas_engajamento_id_seq'),
+            usuario_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            acao varchar NOT NULL,
+            categoria varchar,
+            referencia_id integer,
+            referencia_tipo varchar,
+            tempo_sessao double precision,
+            "timestamp" timestamptz DEFAULT now(),
+            dispositivo varchar,
+            navegador varchar,
+            CONSTRAINT metricas_engajamento_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("ALTER SEQUENCE metricas_engajamento_id_seq OWNED BY metricas_engajamento.id")
+    op.execute(f"""
+        INSERT INTO metricas_engajamento ({COLUNAS})
+        SELECT {COLUNAS} FROM metricas_engajamento_particionada
+    """)
+    op.execute("DROP TABLE metricas_engajamento_particionada CASCADE")
+    _criar_indices("metricas_engajamento")
@@ -10,8 +10,16 @@ engine = create_engine(
     echo=settings.ENVIRONMENT == "development"
 )
 
-# Session factory
+# Optional read replica (see app/utils/replica.py)
+replica_engine = create_engine(
+    settings.DATABASE_REPLICA_URL,
+    pool_pre_ping=True,
+    echo=settings.ENVIRONMENT == "development"
+) if settings.DATABASE_REPLICA_URL else None
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
 
 # Base class for models
 Base = declarative_base()
@@ -1,6 +1,18 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.datastructures import Default
 from app.config import settings
+from app.utils.password_pool import password_pool
+from app.utils.revogacao import revogacao_tokens
+from app.utils.instrumentacao import InstrumentacaoMiddleware
+from app.utils.compressao import CompressaoMiddleware
+from app.utils.respostas import RespostaJSON
+from app.utils.prometheus import registro_metricas
+from app.utils.saude import verificacao_prontidao
+from app.services.particoes import manutencao_particoes
+from app.services.arquivamento import arquivamento_mensagens
+from app.services.eventos_dominio import distribuicao_eventos
 from app.routers import (
     auth,
     users,
@@ -17,6 +29,9 @@ from app.routers import (
     relatorios,
     upload,
     alunos,
+    frequencias,
+    importacao,
+    busca,
 )
 
 app = FastAPI(
@@ -25,6 +40,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # Default(): rotas com response_model mantêm a serialização direta do Pydantic
+    default_response_class=Default(RespostaJSON),
 )
 
 # Configuração CORS
@@ -34,8 +51,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag"],
 )
 
+# Latência, número de queries e tempo de banco por request
+app.add_middleware(InstrumentacaoMiddleware)
+
+# Compressão gzip/brotli (adicionado por último = mais externo)
+app.add_middleware(CompressaoMiddleware)
+
 # Inclusão dos routers
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -52,6 +76,60 @@ app.include_router(avaliacoes.router)
 app.include_router(metricas.router)
 app.include_router(relatorios.router)
 app.include_router(upload.router)
+app.include_router(frequencias.router)
+app.include_router(importacao.router)
+app.include_router(busca.router)
+
+
+@app.on_event("startup")
+def startup_revogacao_tokens():
+    """Carrega a lista de tokens revogados e inicia sua sincronização"""
+    revogacao_tokens.iniciar()
+
+
+@app.on_event("startup")
+def startup_manutencao_particoes():
+    """Cria as partições futuras de métricas e aplica a retenção periodicamente"""
+    manutencao_particoes.iniciar()
+
+
+@app.on_event("startup")
+def startup_arquivamento_mensagens():
+    """Move periodicamente mensagens e notificações lidas antigas para o arquivo"""
+    arquivamento_mensagens.iniciar()
+
+
+@app.on_event("startup")
+def startup_distribuicao_eventos():
+    """Transforma os eventos de domínio pendentes em notificações"""
+    distribuicao_eventos.iniciar()
+
+
+@app.on_event("shutdown")
+def shutdown_password_pool():
+    """Encerra o pool de processos de hashing de senhas"""
+    password_pool.shutdown()
+
+
+@app.on_event("shutdown")
+def shutdown_revogacao_tokens():
+    """Persiste as revogações pendentes"""
+    revogacao_tokens.parar()
+
+
+@app.on_event("shutdown")
+def shutdown_manutencao_particoes():
+    manutencao_particoes.parar()
+
+
+@app.on_event("shutdown")
+def shutdown_arquivamento_mensagens():
+    arquivamento_mensagens.parar()
+
+
+@app.on_event("shutdown")
+def shutdown_distribuicao_eventos():
+    distribuicao_eventos.parar()
 
 
 @app.get("/")
@@ -61,6 +139,26 @@ def read_root():
 
 
 @app.get("/health")
+@app.get("/health/live")
 def health_check():
-    """Endpoint de health check"""
+    """Liveness: o processo está de pé e respondendo"""
     return {"status": "healthy"}
+
+
+@app.get("/health/ready")
+def readiness_check():
+    """Readiness: banco, pool, migrações e volume de uploads (resultado em cache por alguns segundos)"""
+    resultado = verificacao_prontidao.verificar()
+    codigo = status.HTTP_200_OK if resultado["status"] == "ready" else status.HTTP_503_SERVICE_UNAVAILABLE
+    return JSONResponse(resultado, status_code=codigo)
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics(authorization: str = Header(None)):
+    """Métricas operacionais no formato de exposição do Prometheus"""
+    if settings.METRICS_TOKEN and authorization != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Não autorizado")
+    return PlainTextResponse(
+        registro_metricas.exportar(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -9,10 +9,15 @@ from app.models.escola import Escola
 from app.models.avaliacao import Avaliacao
 from app.models.atividade import Atividade, EntregaAtividade
 from app.models.pei import PEI, IntervencaoPedagogica
-from app.models.mensagem import Mensagem, TipoMidia
-from app.models.notificacao import Notificacao, TipoNotificacao
+from app.models.mensagem import Mensagem, MensagemArquivada, TipoMidia
+from app.models.notificacao import Notificacao, NotificacaoArquivada, TipoNotificacao
 from app.models.evento import EventoEscolar, TipoEvento
 from app.models.metrica import MetricaEngajamento
+from app.models.frequencia import FrequenciaMensal
+from app.models.media import MediaDisciplina
+from app.models.token_revogado import TokenRevogado
+from app.models.versao_tabela import VersaoTabela, TABELAS_VERSIONADAS
+from app.models.evento_dominio import EventoDominio
 
 __all__ = [
     "User",
@@ -32,12 +37,20 @@ __all__ = [
     "PEI",
     "IntervencaoPedagogica",
     "Mensagem",
+    "MensagemArquivada",
     "TipoMidia",
     "Notificacao",
+    "NotificacaoArquivada",
     "TipoNotificacao",
     "EventoEscolar",
     "TipoEvento",
     "MetricaEngajamento",
+    "FrequenciaMensal",
+    "MediaDisciplina",
+    "TokenRevogado",
+    "VersaoTabela",
+    "TABELAS_VERSIONADAS",
+    "EventoDominio",
     "professor_disciplina",
     "professor_turma",
 ]
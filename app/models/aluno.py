@@ -1,15 +1,20 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Text, Index, event
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.turma import escola_da_turma, sincronizar_escola
 
 
 class Aluno(Base):
     __tablename__ = "alunos"
+    __table_args__ = (
+        Index("ix_alunos_escola_turma", "escola_id", "turma_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     responsavel_id = Column(Integer, ForeignKey("responsaveis.id", ondelete="SET NULL"), nullable=True)
     turma_id = Column(Integer, ForeignKey("turmas.id", ondelete="SET NULL"), nullable=True)
+    escola_id = Column(Integer, ForeignKey("escolas.id"), nullable=True, default=escola_da_turma)  # da turma
     
     matricula = Column(String, unique=True, index=True, nullable=False)
     data_nascimento = Column(Date)
@@ -24,3 +29,5 @@ class Aluno(Base):
     peis = relationship("PEI", back_populates="aluno")
     avaliacoes = relationship("Avaliacao", back_populates="aluno")
 
+
+event.listen(Aluno, "before_update", sincronizar_escola)
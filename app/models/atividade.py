@@ -1,14 +1,20 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Boolean, Index, UniqueConstraint, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.turma import escola_da_turma, sincronizar_escola
 
 
 class Atividade(Base):
     __tablename__ = "atividades"
+    __table_args__ = (
+        Index("ix_atividades_escola_entrega", "escola_id", "data_entrega"),
+    )
+    # No PostgreSQL há ainda a coluna gerada "busca" (tsvector), fora do ORM
     
     id = Column(Integer, primary_key=True, index=True)
     turma_id = Column(Integer, ForeignKey("turmas.id", ondelete="CASCADE"), nullable=False)
+    escola_id = Column(Integer, ForeignKey("escolas.id"), nullable=True, default=escola_da_turma)  # da turma
     disciplina_id = Column(Integer, ForeignKey("disciplinas.id", ondelete="CASCADE"), nullable=False)
     professor_id = Column(Integer, ForeignKey("professores.id", ondelete="SET NULL"), nullable=True)
     
@@ -29,6 +35,10 @@ class Atividade(Base):
 
 class EntregaAtividade(Base):
     __tablename__ = "entregas_atividades"
+    __table_args__ = (
+        # Uma entrega por aluno e atividade; chave do lançamento de notas em lote (upsert)
+        UniqueConstraint("atividade_id", "aluno_id", name="uq_entrega_atividade_aluno"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     atividade_id = Column(Integer, ForeignKey("atividades.id", ondelete="CASCADE"), nullable=False)
@@ -44,3 +54,5 @@ class EntregaAtividade(Base):
     atividade = relationship("Atividade", back_populates="entregas")
     aluno = relationship("Aluno")
 
+
+event.listen(Atividade, "before_update", sincronizar_escola)
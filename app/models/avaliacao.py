@@ -1,10 +1,17 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class Avaliacao(Base):
     __tablename__ = "avaliacoes"
+    __table_args__ = (
+        # Chave natural usada pelo lançamento de notas em lote (upsert)
+        UniqueConstraint(
+            "aluno_id", "disciplina_id", "titulo", "data_avaliacao",
+            name="uq_avaliacao_aluno_disciplina_titulo_data"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     aluno_id = Column(Integer, ForeignKey("alunos.id", ondelete="CASCADE"), nullable=False)
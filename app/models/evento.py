@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Text, Index, event, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
+from app.models.turma import escola_da_turma, sincronizar_escola
 
 
 class TipoEvento(str, enum.Enum):
@@ -15,9 +16,14 @@ class TipoEvento(str, enum.Enum):
 
 class EventoEscolar(Base):
     __tablename__ = "eventos_escolares"
+    __table_args__ = (
+        Index("ix_eventos_escolares_escola_data", "escola_id", "data_evento"),
+    )
+    # No PostgreSQL há ainda a coluna gerada "busca" (tsvector), fora do ORM
     
     id = Column(Integer, primary_key=True, index=True)
     turma_id = Column(Integer, ForeignKey("turmas.id", ondelete="CASCADE"), nullable=True)
+    escola_id = Column(Integer, ForeignKey("escolas.id"), nullable=True, default=escola_da_turma)  # da turma; nulo = rede toda
     criado_por_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     
     titulo = Column(String, nullable=False, index=True)
@@ -36,3 +42,5 @@ class EventoEscolar(Base):
     turma = relationship("Turma", back_populates="eventos")
     criado_por = relationship("User")
 
+
+event.listen(EventoEscolar, "before_update", sincronizar_escola)
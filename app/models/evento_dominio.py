@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class EventoDominio(Base):
+    """Fila (outbox) de eventos de domínio que geram notificações.
+
+    Gravado na mesma transação da escrita que o origina; a distribuição às
+    notificações acontece depois, fora do request (ver EventosDominioService).
+    """
+    __tablename__ = "eventos_dominio"
+
+    id = Column(Integer, primary_key=True)
+    tipo = Column(String(50), nullable=False)  # atividade_criada, notas_lancadas, ...
+    chave = Column(String(200), nullable=False, unique=True)  # chave de idempotência
+    dados = Column(JSON, nullable=False)  # textos da notificação e público (turma, escola ou alunos)
+
+    criado_em = Column(DateTime(timezone=True), server_default=func.now())
+    processado_em = Column(DateTime(timezone=True), nullable=True, index=True)
+    ultimo_usuario_id = Column(Integer, nullable=False, default=0)  # progresso da distribuição em lotes
+    destinatarios = Column(Integer, nullable=False, default=0)
+    tentativas = Column(Integer, nullable=False, default=0)
+    erro = Column(Text, nullable=True)
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class FrequenciaMensal(Base):
+    """Frequência de um aluno em um mês, armazenada como bitmap de dias.
+
+    O bit ``dia - 1`` de ``dias_letivos`` indica que houve chamada naquele dia e o
+    mesmo bit em ``presencas`` indica que o aluno estava presente. Os contadores
+    são mantidos junto com os bitmaps para que as taxas sejam simples SUMs.
+    """
+    __tablename__ = "frequencias_mensais"
+    __table_args__ = (
+        UniqueConstraint("aluno_id", "turma_id", "ano", "mes", name="uq_frequencia_aluno_turma_mes"),
+        Index("ix_frequencias_mensais_turma_periodo", "turma_id", "ano", "mes"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    aluno_id = Column(Integer, ForeignKey("alunos.id", ondelete="CASCADE"), nullable=False, index=True)
+    turma_id = Column(Integer, ForeignKey("turmas.id", ondelete="CASCADE"), nullable=False)
+
+    ano = Column(SmallInteger, nullable=False)
+    mes = Column(SmallInteger, nullable=False)
+    dias_letivos = Column(Integer, nullable=False, default=0)  # bitmap de dias com chamada
+    presencas = Column(Integer, nullable=False, default=0)  # bitmap de dias presentes
+    total_aulas = Column(SmallInteger, nullable=False, default=0)
+    total_presencas = Column(SmallInteger, nullable=False, default=0)
+
+    # Relationships
+    aluno = relationship("Aluno")
+    turma = relationship("Turma")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, SmallInteger, Float, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class MediaDisciplina(Base):
+    """Média ponderada (por Avaliacao.peso) de um aluno em uma disciplina e período.
+
+    Mantida incrementalmente pelas rotas de avaliações; as somas ficam
+    armazenadas para que cada alteração de nota seja um simples delta.
+    """
+    __tablename__ = "medias_disciplinas"
+    __table_args__ = (
+        UniqueConstraint("aluno_id", "disciplina_id", "ano", "periodo", name="uq_media_aluno_disciplina_periodo"),
+        Index("ix_medias_disciplinas_ranking", "disciplina_id", "ano", "periodo", "media"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    aluno_id = Column(Integer, ForeignKey("alunos.id", ondelete="CASCADE"), nullable=False, index=True)
+    disciplina_id = Column(Integer, ForeignKey("disciplinas.id", ondelete="CASCADE"), nullable=False)
+
+    ano = Column(SmallInteger, nullable=False)
+    periodo = Column(SmallInteger, nullable=False)  # trimestre do ano (1-4)
+    soma_ponderada = Column(Float, nullable=False, default=0)  # soma de nota * peso
+    soma_pesos = Column(Float, nullable=False, default=0)
+    total_avaliacoes = Column(Integer, nullable=False, default=0)
+    media = Column(Float)  # NULL enquanto não houver nota lançada
+    atualizado_em = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    aluno = relationship("Aluno")
+    disciplina = relationship("Disciplina")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -14,6 +14,7 @@ class TipoMidia(str, enum.Enum):
 
 class Mensagem(Base):
     __tablename__ = "mensagens"
+    # No PostgreSQL há ainda a coluna gerada "busca" (tsvector), fora do ORM
     
     id = Column(Integer, primary_key=True, index=True)
     remetente_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -32,3 +33,30 @@ class Mensagem(Base):
     remetente = relationship("User", foreign_keys=[remetente_id])
     destinatario = relationship("User", foreign_keys=[destinatario_id])
 
+
+class MensagemArquivada(Base):
+    """Mensagens lidas antigas, movidas de ``mensagens`` pelo arquivamento.
+
+    Mantêm o id original; consultadas apenas pelos endpoints de arquivo.
+    """
+    __tablename__ = "mensagens_arquivadas"
+    __table_args__ = (
+        Index("ix_mensagens_arquivadas_destinatario", "destinatario_id", "enviada_em"),
+        Index("ix_mensagens_arquivadas_remetente", "remetente_id", "enviada_em"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    remetente_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    destinatario_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    assunto = Column(String, nullable=False)
+    conteudo = Column(Text, nullable=False)
+    tipo_midia = Column(SQLEnum(TipoMidia), default=TipoMidia.TEXTO)
+    midia_url = Column(String)
+
+    enviada_em = Column(DateTime(timezone=True))
+    lida_em = Column(DateTime(timezone=True), nullable=True)
+    confirmacao_leitura = Column(Boolean, default=True)
+    arquivada_em = Column(DateTime(timezone=True), server_default=func.now())
+
+    remetente = relationship("User", foreign_keys=[remetente_id])
@@ -5,6 +5,8 @@ from app.database import Base
 
 
 class MetricaEngajamento(Base):
+    # Particionada por mês em "timestamp" no PostgreSQL (PK real: id + timestamp);
+    # consultas devem sempre filtrar por timestamp para aproveitar o pruning
     __tablename__ = "metricas_engajamento"
     
     id = Column(Integer, primary_key=True, index=True)
@@ -16,7 +18,7 @@ class MetricaEngajamento(Base):
     referencia_tipo = Column(String)  # tipo do objeto (mensagem, atividade, etc.)
     
     tempo_sessao = Column(Float)  # tempo em segundos
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     
     # Metadados adicionais
     dispositivo = Column(String)  # mobile, desktop, tablet
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -14,6 +14,10 @@ class TipoNotificacao(str, enum.Enum):
 
 class Notificacao(Base):
     __tablename__ = "notificacoes"
+    __table_args__ = (
+        # Resumo aberto do usuário para um tipo e turma (ver NotificacoesService)
+        Index("ix_notificacoes_usuario_agrupamento", "usuario_id", "chave_agrupamento"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     usuario_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -26,7 +30,34 @@ class Notificacao(Base):
     lida = Column(Boolean, default=False)
     criada_em = Column(DateTime(timezone=True), server_default=func.now())
     lida_em = Column(DateTime(timezone=True), nullable=True)
+
+    # Resumos: notificações do mesmo tipo e turma reunidas em uma linha
+    chave_agrupamento = Column(String(60), nullable=True)  # "<tipo>:<turma_id>"
+    agrupada_desde = Column(DateTime(timezone=True), nullable=True)  # início da janela do resumo
+    quantidade = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Relationships
     usuario = relationship("User")
 
+
+class NotificacaoArquivada(Base):
+    """Notificações lidas antigas, movidas de ``notificacoes`` pelo arquivamento"""
+    __tablename__ = "notificacoes_arquivadas"
+    __table_args__ = (
+        Index("ix_notificacoes_arquivadas_usuario", "usuario_id", "criada_em"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    usuario_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    titulo = Column(String, nullable=False)
+    mensagem = Column(Text, nullable=False)
+    tipo = Column(SQLEnum(TipoNotificacao), default=TipoNotificacao.INFORMACAO)
+    link_referencia = Column(String)
+
+    lida = Column(Boolean, default=True)
+    criada_em = Column(DateTime(timezone=True))
+    lida_em = Column(DateTime(timezone=True), nullable=True)
+    chave_agrupamento = Column(String(60), nullable=True)
+    quantidade = Column(Integer, nullable=False, default=1, server_default="1")
+    arquivada_em = Column(DateTime(timezone=True), server_default=func.now())
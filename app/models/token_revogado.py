@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class TokenRevogado(Base):
+    """Refresh tokens (ou famílias de tokens) revogados, até expirarem"""
+    __tablename__ = "tokens_revogados"
+
+    jti = Column(String(32), primary_key=True)  # uuid4 hex do token ou da família
+    expira_em = Column(DateTime(timezone=True), nullable=False, index=True)
+    revogado_em = Column(DateTime(timezone=True), server_default=func.now(), index=True)
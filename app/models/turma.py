@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, Enum as SQLEnum, ForeignKey, Index, event, inspect, select
 from sqlalchemy.orm import relationship
 import enum
 from app.database import Base
@@ -13,9 +13,12 @@ class Turno(str, enum.Enum):
 
 class Turma(Base):
     __tablename__ = "turmas"
+    __table_args__ = (
+        Index("ix_turmas_escola_ano", "escola_id", "ano_letivo"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    escola_id = Column(Integer, ForeignKey("escolas.id"), nullable=True, index=True)
+    escola_id = Column(Integer, ForeignKey("escolas.id"), nullable=True)
     nome = Column(String, nullable=False, index=True)  # ex: 7º Ano A
     codigo = Column(String, unique=True, index=True)
     ano_letivo = Column(Integer, nullable=False)
@@ -31,3 +34,33 @@ class Turma(Base):
     )
     atividades = relationship("Atividade", back_populates="turma")
     eventos = relationship("EventoEscolar", back_populates="turma")
+
+
+# Tabelas com turma_id guardam também o escola_id da turma (escopo por escola,
+# ver app/utils/escopo_escola.py). As funções abaixo o mantêm em dia.
+
+def escola_da_turma(context):
+    """Default de ``escola_id``: a escola da turma inserida na mesma linha"""
+    turma_id = context.get_current_parameters().get("turma_id")
+    if turma_id is None:
+        return None
+    return context.connection.scalar(select(Turma.escola_id).where(Turma.id == turma_id))
+
+
+def sincronizar_escola(mapper, connection, target):
+    """before_update: acompanha a troca de turma"""
+    if inspect(target).attrs.turma_id.history.has_changes():
+        target.escola_id = connection.scalar(
+            select(Turma.escola_id).where(Turma.id == target.turma_id)
+        ) if target.turma_id else None
+
+
+@event.listens_for(Turma, "after_update")
+def _propagar_escola(mapper, connection, target):
+    if not inspect(target).attrs.escola_id.history.has_changes():
+        return
+    for tabela in Base.metadata.sorted_tables:
+        if tabela is not Turma.__table__ and {"turma_id", "escola_id"} <= set(tabela.c.keys()):
+            connection.execute(
+                tabela.update().where(tabela.c.turma_id == target.id).values(escola_id=target.escola_id)
+            )
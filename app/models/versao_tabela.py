@@ -0,0 +1,52 @@
+from sqlalchemy import Column, String, BigInteger, DateTime, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.database import Base
+
+# Tabelas cujas alterações incrementam a versão (usada nos ETags de coleção)
+TABELAS_VERSIONADAS = frozenset({"escolas", "disciplinas", "turmas", "peis"})
+
+
+class VersaoTabela(Base):
+    """Contador de alterações por tabela.
+
+    Incrementado na mesma transação da escrita (eventos abaixo), permite
+    responder 304 para uma coleção inteira consultando só esta tabela.
+    """
+    __tablename__ = "versoes_tabelas"
+
+    tabela = Column(String(63), primary_key=True)
+    versao = Column(BigInteger, nullable=False, default=0)
+    atualizado_em = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+def _incrementar(session: Session, tabelas):
+    conn = session.connection()
+    dialeto = sqlite if conn.dialect.name == "sqlite" else postgresql
+    for tabela in sorted(tabelas):
+        stmt = dialeto.insert(VersaoTabela).values(tabela=tabela, versao=1)
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["tabela"],
+            set_={"versao": VersaoTabela.versao + 1, "atualizado_em": func.now()},
+        ))
+
+
+@event.listens_for(Session, "after_flush")
+def _versionar_flush(session, flush_context):
+    alteradas = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if getattr(obj, "__table__", None) is not None
+    } & TABELAS_VERSIONADAS
+    if alteradas:
+        _incrementar(session, alteradas)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _versionar_execucao(orm_execute_state):
+    # update()/delete()/insert() em massa não passam pelo flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        tabela = getattr(orm_execute_state.statement, "table", None)
+        if tabela is not None and tabela.name in TABELAS_VERSIONADAS:
+            _incrementar(orm_execute_state.session, {tabela.name})
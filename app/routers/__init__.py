@@ -15,6 +15,9 @@ from app.routers import (
     metricas,
     relatorios,
     upload,
+    frequencias,
+    importacao,
+    busca,
 )
 
 __all__ = [
@@ -33,4 +36,7 @@ __all__ = [
     "metricas",
     "relatorios",
     "upload",
+    "frequencias",
+    "importacao",
+    "busca",
 ]
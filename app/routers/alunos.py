@@ -2,12 +2,16 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
-from app.models import Aluno, User, TipoUsuario, Responsavel
-from app.schemas import AlunoCreate, AlunoUpdate, AlunoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.models import Aluno, User, TipoUsuario
+from app.schemas import AlunoCreate, AlunoUpdate, AlunoResponse, UserResponse
+from app.utils.dependencies import require_role, get_actor_context, ActorContext, get_read_db
+from app.utils.projecao import Projecao
+from app.utils.respostas import RespostaJSON
 
 router = APIRouter(prefix="/api/alunos", tags=["Alunos"])
 
+projecao_alunos = Projecao(Aluno, AlunoResponse, {"user": (User, Aluno.user_id == User.id, UserResponse)})
+
 
 @router.post("/", response_model=AlunoResponse, status_code=status.HTTP_201_CREATED)
 async def create_aluno(
@@ -37,37 +41,32 @@ async def create_aluno(
 async def list_alunos(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    campos: List[str] = Depends(projecao_alunos.campos),
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context),
 ):
-    """Lista alunos - filtrados por responsável se for o tipo de usuário"""
+    """Lista alunos - filtrados por responsável se for o tipo de usuário
+    (``fields`` restringe as colunas devolvidas)"""
+    query = projecao_alunos.consulta(db, campos) if campos else db.query(Aluno)
+
     # If user is responsavel, only show their students
-    if current_user.tipo_usuario == TipoUsuario.RESPONSAVEL:
-        responsavel = (
-            db.query(Responsavel).filter(Responsavel.user_id == current_user.id).first()
-        )
-        if not responsavel:
+    if ator.user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+        if not ator.filhos_ids:
             return []
-
-        alunos = (
-            db.query(Aluno)
-            .filter(Aluno.responsavel_id == responsavel.id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return alunos
+        query = query.filter(Aluno.id.in_(ator.filhos_ids))
 
     # Otherwise show all alunos (for gestor/professor)
-    alunos = db.query(Aluno).offset(skip).limit(limit).all()
+    alunos = query.offset(skip).limit(limit).all()
+    if campos:
+        return RespostaJSON(projecao_alunos.montar(alunos, campos))
     return alunos
 
 
 @router.get("/{aluno_id}", response_model=AlunoResponse)
 async def get_aluno(
     aluno_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context),
 ):
     """Retorna os detalhes de um aluno"""
     aluno = db.query(Aluno).filter(Aluno.id == aluno_id).first()
@@ -78,11 +77,8 @@ async def get_aluno(
         )
 
     # If user is responsavel, check if they own this student
-    if current_user.tipo_usuario == TipoUsuario.RESPONSAVEL:
-        responsavel = (
-            db.query(Responsavel).filter(Responsavel.user_id == current_user.id).first()
-        )
-        if not responsavel or aluno.responsavel_id != responsavel.id:
+    if ator.user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+        if aluno.id not in ator.filhos_ids:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Acesso negado a este aluno",
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.database import get_db
-from app.models import Atividade, EntregaAtividade, User, TipoUsuario, Aluno, Professor
+from app.models import Atividade, EntregaAtividade, User, TipoUsuario, Turma, Aluno
 from app.schemas import (
     AtividadeCreate, AtividadeUpdate, AtividadeResponse,
-    EntregaAtividadeCreate, EntregaAtividadeResponse
+    EntregaAtividadeCreate, EntregaAtividadeResponse, AtividadePendenteResponse,
+    AvaliacaoEntregasLote, TokenData
 )
-from app.utils.dependencies import get_current_active_user, require_role
+from app.services.entregas import EntregasService
+from app.services.eventos_dominio import EventosDominioService
+from app.utils.dependencies import (
+    get_current_active_user, require_role, require_role_claims, get_actor_context, ActorContext,
+    get_read_db, get_chave_idempotencia
+)
+from app.utils.respostas import RespostaJSON
 
 router = APIRouter(prefix="/api/atividades", tags=["Atividades"])
 
@@ -16,18 +23,20 @@ router = APIRouter(prefix="/api/atividades", tags=["Atividades"])
 async def create_atividade(
     atividade_data: AtividadeCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)),
+    ator: ActorContext = Depends(get_actor_context),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Cria uma nova atividade/tarefa"""
     db_atividade = Atividade(**atividade_data.model_dump())
     
     # Se não especificado, define o professor atual
-    if not db_atividade.professor_id and current_user.tipo_usuario == TipoUsuario.PROFESSOR:
-        professor = db.query(Professor).filter(Professor.user_id == current_user.id).first()
-        if professor:
-            db_atividade.professor_id = professor.id
+    if not db_atividade.professor_id and ator.professor_id:
+        db_atividade.professor_id = ator.professor_id
     
     db.add(db_atividade)
+    db.flush()
+    EventosDominioService.atividade(db, db_atividade, criada=True, chave_requisicao=chave_idempotencia)
     db.commit()
     db.refresh(db_atividade)
     
@@ -40,8 +49,8 @@ async def list_atividades(
     limit: int = 100,
     turma_id: Optional[int] = None,
     disciplina_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
 ):
     """Lista atividades com filtros opcionais"""
     query = db.query(Atividade)
@@ -53,10 +62,8 @@ async def list_atividades(
         query = query.filter(Atividade.disciplina_id == disciplina_id)
     
     # Se for aluno, filtra pelas atividades da turma dele
-    if current_user.tipo_usuario == TipoUsuario.ALUNO:
-        aluno = db.query(Aluno).filter(Aluno.user_id == current_user.id).first()
-        if aluno and aluno.turma_id:
-            query = query.filter(Atividade.turma_id == aluno.turma_id)
+    if ator.user.tipo_usuario == TipoUsuario.ALUNO and ator.aluno_turma_id:
+        query = query.filter(Atividade.turma_id == ator.aluno_turma_id)
     
     atividades = query.order_by(Atividade.data_entrega.desc()).offset(skip).limit(limit).all()
     return atividades
@@ -65,7 +72,7 @@ async def list_atividades(
 @router.get("/{atividade_id}", response_model=AtividadeResponse)
 async def get_atividade(
     atividade_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Retorna os detalhes de uma atividade"""
@@ -85,7 +92,8 @@ async def update_atividade(
     atividade_id: int,
     atividade_update: AtividadeUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Atualiza uma atividade"""
     atividade = db.query(Atividade).filter(Atividade.id == atividade_id).first()
@@ -97,9 +105,14 @@ async def update_atividade(
         )
     
     update_data = atividade_update.model_dump(exclude_unset=True)
+    alterados = {field for field, value in update_data.items() if getattr(atividade, field) != value}
     for field, value in update_data.items():
         setattr(atividade, field, value)
     
+    db.flush()
+    EventosDominioService.atividade(
+        db, atividade, criada=False, alterados=alterados, chave_requisicao=chave_idempotencia
+    )
     db.commit()
     db.refresh(atividade)
     return atividade
@@ -110,7 +123,7 @@ async def create_entrega(
     atividade_id: int,
     entrega_data: EntregaAtividadeCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    ator: ActorContext = Depends(get_actor_context)
 ):
     """Registra a entrega de uma atividade por um aluno"""
     # Verifica se a atividade existe
@@ -122,9 +135,8 @@ async def create_entrega(
         )
     
     # Se for aluno, só pode entregar para si mesmo
-    if current_user.tipo_usuario == TipoUsuario.ALUNO:
-        aluno = db.query(Aluno).filter(Aluno.user_id == current_user.id).first()
-        if not aluno or entrega_data.aluno_id != aluno.id:
+    if ator.user.tipo_usuario == TipoUsuario.ALUNO:
+        if entrega_data.aluno_id != ator.aluno_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Você só pode registrar suas próprias entregas"
@@ -153,8 +165,8 @@ async def create_entrega(
 @router.get("/{atividade_id}/entregas", response_model=List[EntregaAtividadeResponse])
 async def list_entregas(
     atividade_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
 ):
     """Lista todas as entregas de uma atividade"""
     # Verifica se a atividade existe
@@ -171,3 +183,120 @@ async def list_entregas(
     
     return entregas
 
+
+@router.post("/{atividade_id}/entregas/notas")
+async def avaliar_entregas_lote(
+    atividade_id: int,
+    avaliacao: AvaliacaoEntregasLote,
+    db: Session = Depends(get_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Lança nota e observações de várias entregas de uma vez, avisando alunos e responsáveis"""
+    if ator.user.tipo_usuario not in (TipoUsuario.PROFESSOR, TipoUsuario.GESTOR):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não tem permissão para acessar este recurso"
+        )
+
+    atividade = db.query(Atividade).filter(Atividade.id == atividade_id).first()
+    if not atividade:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Atividade não encontrada"
+        )
+    if ator.user.tipo_usuario == TipoUsuario.PROFESSOR and atividade.turma_id not in ator.turma_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não leciona nesta turma"
+        )
+
+    aluno_ids = [n.aluno_id for n in avaliacao.notas]
+    if len(set(aluno_ids)) != len(aluno_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aluno repetido na lista de notas"
+        )
+
+    if atividade.pontuacao_maxima is not None:
+        acima = [n.aluno_id for n in avaliacao.notas if n.nota is not None and n.nota > atividade.pontuacao_maxima]
+        if acima:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Nota acima da pontuação máxima ({atividade.pontuacao_maxima}) para os alunos: {acima}"
+            )
+
+    da_turma = {
+        aluno_id for (aluno_id,) in db.query(Aluno.id).filter(
+            Aluno.id.in_(aluno_ids), Aluno.turma_id == atividade.turma_id
+        )
+    }
+    fora = [aluno_id for aluno_id in aluno_ids if aluno_id not in da_turma]
+    if fora:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Alunos que não pertencem à turma da atividade: {fora}"
+        )
+
+    avaliadas, notificacoes = EntregasService.avaliar_lote(
+        db, atividade, avaliacao.notas, notificar=avaliacao.notificar
+    )
+    return {
+        "mensagem": "Notas lançadas com sucesso",
+        "total_avaliadas": avaliadas,
+        "notificacoes_criadas": notificacoes,
+    }
+
+
+@router.get("/turma/{turma_id}/matriz")
+async def matriz_entregas_turma(
+    turma_id: int,
+    disciplina_id: Optional[int] = None,
+    formato: str = Query("completo", pattern="^(completo|compacto)$"),
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Matriz alunos x atividades da turma: status, nota e atraso de cada entrega.
+
+    ``formato=compacto`` codifica cada aluno como uma string com um caractere
+    por atividade (ver ``legenda``), para turmas grandes.
+    """
+    if ator.user.tipo_usuario not in (TipoUsuario.PROFESSOR, TipoUsuario.GESTOR):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não tem permissão para acessar este recurso"
+        )
+    if ator.user.tipo_usuario == TipoUsuario.PROFESSOR and turma_id not in ator.turma_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não leciona nesta turma"
+        )
+    if not db.query(Turma.id).filter(Turma.id == turma_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Turma não encontrada"
+        )
+
+    return RespostaJSON(
+        EntregasService.matriz_turma(db, turma_id, disciplina_id, compacto=formato == "compacto")
+    )
+
+
+@router.get("/pendentes/aluno/{aluno_id}", response_model=List[AtividadePendenteResponse])
+async def list_atividades_pendentes(
+    aluno_id: int,
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Atividades que o aluno ainda não entregou (responsáveis veem apenas os filhos)"""
+    if not ator.pode_ver_aluno(aluno_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso negado a este aluno"
+        )
+    if not db.query(Aluno.id).filter(Aluno.id == aluno_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Aluno não encontrado"
+        )
+
+    return EntregasService.pendentes_aluno(db, aluno_id)
@@ -1,16 +1,73 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+import time
 from datetime import timedelta
 from app.database import get_db
-from app.models import User, Professor, Responsavel, GestorEscolar, TipoUsuario
-from app.schemas import UserCreate, UserResponse, Token
-from app.utils.security import verify_password, get_password_hash, create_access_token
+from app.models import (
+    User, Professor, Responsavel, GestorEscolar, TipoUsuario, Aluno, Turma, professor_turma
+)
+from app.schemas import UserCreate, UserResponse, Token, RefreshRequest
+from app.utils.security import create_access_token, create_refresh_token, decode_refresh_token
+from app.utils.password_pool import password_pool
+from app.utils.revogacao import revogacao_tokens
 from app.config import settings
 
 router = APIRouter(prefix="/api/auth", tags=["Autenticação"])
 
 
+def _escolas_do_usuario(db: Session, user: User) -> list:
+    """Escolas às quais o usuário está vinculado (claim ``escolas`` do token)"""
+    if user.tipo_usuario == TipoUsuario.PROFESSOR:
+        query = db.query(Turma.escola_id).join(
+            professor_turma, professor_turma.c.turma_id == Turma.id
+        ).join(
+            Professor, Professor.id == professor_turma.c.professor_id
+        ).filter(Professor.user_id == user.id)
+    elif user.tipo_usuario == TipoUsuario.ALUNO:
+        query = db.query(Turma.escola_id).join(
+            Aluno, Aluno.turma_id == Turma.id
+        ).filter(Aluno.user_id == user.id)
+    elif user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+        query = db.query(Turma.escola_id).join(
+            Aluno, Aluno.turma_id == Turma.id
+        ).join(
+            Responsavel, Responsavel.id == Aluno.responsavel_id
+        ).filter(Responsavel.user_id == user.id)
+    else:
+        # Gestores não têm vínculo com escola no modelo atual
+        return []
+
+    return sorted({r.escola_id for r in query.distinct() if r.escola_id is not None})
+
+
+def _expiracao_familia() -> int:
+    """Uma família revogada precisa durar tanto quanto o refresh token mais novo dela"""
+    return int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+
+
+def _emitir_tokens(db: Session, user: User, familia: str = None) -> dict:
+    """Gera o par access/refresh token; o access token carrega papel e escolas"""
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.tipo_usuario.value,
+            "escolas": _escolas_do_usuario(db, user),
+        },
+        expires_delta=access_token_expires,
+    )
+    refresh_token, _, _ = create_refresh_token(user.id, familia)
+
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": int(access_token_expires.total_seconds()),
+    }
+
+
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
@@ -26,7 +83,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     # Cria o novo usuário
     db_user = User(
         email=user_data.email,
-        senha_hash=get_password_hash(user_data.senha),
+        senha_hash=password_pool.hash(user_data.senha),
         nome_completo=user_data.nome_completo,
         telefone=user_data.telefone,
         tipo_usuario=user_data.tipo_usuario,
@@ -75,7 +132,12 @@ def login(
     # Busca o usuário pelo email (username no form_data é o email)
     user = db.query(User).filter(User.email == form_data.username).first()
 
-    if not user or not verify_password(form_data.password, user.senha_hash):
+    senha_ok, novo_hash = (
+        password_pool.verify_and_update(form_data.password, user.senha_hash)
+        if user
+        else (False, None)
+    )
+    if not senha_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email ou senha incorretos",
@@ -87,11 +149,45 @@ def login(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Usuário inativo"
         )
 
-    # Cria o token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email},
-        expires_delta=access_token_expires,
+    # Custo do bcrypt mudou desde o último login: regrava o hash
+    if novo_hash:
+        user.senha_hash = novo_hash
+        db.commit()
+
+    return _emitir_tokens(db, user)
+
+
+@router.post("/refresh", response_model=Token)
+def refresh(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    """Troca um refresh token válido por um novo par de tokens (rotação)"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Refresh token inválido ou expirado",
+        headers={"WWW-Authenticate": "Bearer"},
     )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    payload = decode_refresh_token(refresh_data.refresh_token)
+    if payload is None:
+        raise credentials_exception
+
+    jti, familia, expira = payload["jti"], payload.get("fam", payload["jti"]), payload["exp"]
+    if revogacao_tokens.esta_revogado(jti, familia):
+        # Token já rotacionado sendo reapresentado: possível roubo, revoga a família inteira
+        revogacao_tokens.revogar(familia, _expiracao_familia())
+        raise credentials_exception
+
+    user = db.query(User).filter(User.id == int(payload["sub"]), User.ativo == True).first()
+    if user is None:
+        raise credentials_exception
+
+    revogacao_tokens.revogar(jti, expira)
+    return _emitir_tokens(db, user, familia)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(refresh_data: RefreshRequest):
+    """Revoga o refresh token (e seus sucessores) da sessão"""
+    payload = decode_refresh_token(refresh_data.refresh_token)
+    if payload is not None:
+        revogacao_tokens.revogar(payload.get("fam", payload["jti"]), _expiracao_familia())
+    return None
@@ -1,41 +1,196 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
-from app.models import Avaliacao, User, TipoUsuario, Aluno
-from app.schemas import AvaliacaoCreate, AvaliacaoUpdate, AvaliacaoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.models import Avaliacao, User, TipoUsuario, Aluno, Turma, Disciplina
+from app.schemas import (
+    AvaliacaoCreate, AvaliacaoUpdate, AvaliacaoResponse,
+    AvaliacaoLoteCreate, BoletimTurmaResponse, MediaDisciplinaResponse,
+    TokenData
+)
+from app.services.avaliacoes import AvaliacaoService
+from app.services.medias import MediaService
+from app.services.eventos_dominio import EventosDominioService
+from app.config import settings
+from app.utils.dependencies import (
+    get_current_active_user, require_role, require_role_claims, get_actor_context, ActorContext,
+    get_read_db, get_chave_idempotencia
+)
 
 router = APIRouter(prefix="/api/avaliacoes", tags=["Avaliações"])
 
 
+
+def _erro_integridade(db: Session, erro: IntegrityError) -> HTTPException:
+    """Desfaz a escrita e traduz a violação: chave natural repetida ou aluno/disciplina inexistente"""
+    db.rollback()
+    mensagem = str(erro.orig)
+    if "uq_avaliacao_aluno_disciplina_titulo_data" in mensagem or "UNIQUE" in mensagem:
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Já existe uma avaliação com este título e data para o aluno nesta disciplina"
+        )
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Aluno ou disciplina não encontrado"
+    )
+
+
 @router.post("/", response_model=AvaliacaoResponse, status_code=status.HTTP_201_CREATED)
 async def create_avaliacao(
     avaliacao_data: AvaliacaoCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Cria uma nova avaliação"""
     db_avaliacao = Avaliacao(**avaliacao_data.model_dump())
     db.add(db_avaliacao)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        raise _erro_integridade(db, e)
+
+    deltas = MediaService.novos_deltas()
+    MediaService.acumular(
+        deltas, db_avaliacao.aluno_id, db_avaliacao.disciplina_id,
+        db_avaliacao.data_avaliacao, db_avaliacao.nota, db_avaliacao.peso
+    )
+    MediaService.aplicar_deltas(db, deltas)
+    if db_avaliacao.nota is not None:
+        EventosDominioService.notas(
+            db, db_avaliacao.disciplina_id, db_avaliacao.titulo, db_avaliacao.data_avaliacao,
+            [db_avaliacao.aluno_id],
+            turma_id=db.query(Aluno.turma_id).filter(Aluno.id == db_avaliacao.aluno_id).scalar(),
+            chave_requisicao=chave_idempotencia
+        )
     db.commit()
     db.refresh(db_avaliacao)
     
     return db_avaliacao
 
 
+@router.post("/lote", status_code=status.HTTP_201_CREATED)
+async def lancar_notas_lote(
+    lote: AvaliacaoLoteCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)),
+    ator: ActorContext = Depends(get_actor_context),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
+):
+    """Lança (ou atualiza) as notas de uma avaliação para vários alunos da turma"""
+    turma = db.query(Turma).filter(Turma.id == lote.turma_id).first()
+    if not turma:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Turma não encontrada"
+        )
+    if not db.query(Disciplina.id).filter(Disciplina.id == lote.disciplina_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Disciplina não encontrada"
+        )
+
+    # Todos os alunos informados precisam pertencer à turma
+    alunos_turma = {
+        r.id for r in db.query(Aluno.id).filter(Aluno.turma_id == lote.turma_id).all()
+    }
+    aluno_ids = [n.aluno_id for n in lote.notas]
+    invalidos = sorted(set(aluno_ids) - alunos_turma)
+    if invalidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Alunos não pertencem à turma: {invalidos}"
+        )
+    if len(set(aluno_ids)) != len(aluno_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aluno informado mais de uma vez"
+        )
+
+    # Professores lançam sempre em nome próprio; só gestores informam o professor
+    if ator.user.tipo_usuario == TipoUsuario.PROFESSOR:
+        professor_id = ator.professor_id
+    else:
+        professor_id = lote.professor_id
+    ids = AvaliacaoService.lancar_notas_lote(db, lote, professor_id, chave_idempotencia)
+
+    return {
+        "mensagem": "Notas lançadas com sucesso",
+        "total_lancadas": len(ids)
+    }
+
+
+@router.get("/turma/{turma_id}/boletim", response_model=BoletimTurmaResponse)
+async def get_boletim_turma(
+    turma_id: int,
+    disciplina_id: int,
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Retorna a matriz alunos x avaliações da turma em uma disciplina"""
+    return AvaliacaoService.get_boletim_turma(db, turma_id, disciplina_id)
+
+
+@router.get("/turma/{turma_id}/ranking")
+async def get_ranking_turma(
+    turma_id: int,
+    disciplina_id: int,
+    ano: int,
+    periodo: int,
+    limit: int = 50,
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Classificação da turma por média ponderada em uma disciplina e período"""
+    return MediaService.get_ranking_turma(db, turma_id, disciplina_id, ano, periodo, limit)
+
+
+@router.get("/turma/{turma_id}/em-risco")
+async def get_alunos_em_risco(
+    turma_id: int,
+    ano: int,
+    periodo: int,
+    media_minima: float = None,
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Lista alunos da turma com média abaixo do mínimo em alguma disciplina"""
+    if media_minima is None:
+        media_minima = settings.MEDIA_MINIMA_APROVACAO
+    return MediaService.get_alunos_em_risco(db, turma_id, ano, periodo, media_minima)
+
+
+@router.get("/aluno/{aluno_id}/medias", response_model=List[MediaDisciplinaResponse])
+async def list_medias_aluno(
+    aluno_id: int,
+    ano: int = None,
+    periodo: int = None,
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Lista as médias ponderadas do aluno por disciplina e período (responsáveis veem apenas os filhos)"""
+    if not ator.pode_ver_aluno(aluno_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso negado a este aluno"
+        )
+
+    return MediaService.get_medias_aluno(db, aluno_id, ano, periodo)
+
+
 @router.get("/aluno/{aluno_id}", response_model=List[AvaliacaoResponse])
 async def list_avaliacoes_aluno(
     aluno_id: int,
     disciplina_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
 ):
     """Lista todas as avaliações de um aluno"""
     # Verifica permissões
-    if current_user.tipo_usuario == TipoUsuario.ALUNO:
-        aluno = db.query(Aluno).filter(Aluno.user_id == current_user.id).first()
-        if not aluno or aluno.id != aluno_id:
+    if ator.user.tipo_usuario == TipoUsuario.ALUNO:
+        if ator.aluno_id != aluno_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Você só pode acessar suas próprias avaliações"
@@ -53,7 +208,7 @@ async def list_avaliacoes_aluno(
 @router.get("/{avaliacao_id}", response_model=AvaliacaoResponse)
 async def get_avaliacao(
     avaliacao_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Retorna os detalhes de uma avaliação"""
@@ -73,7 +228,8 @@ async def update_avaliacao(
     avaliacao_id: int,
     avaliacao_update: AvaliacaoUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Atualiza uma avaliação (incluindo lançamento de nota)"""
     avaliacao = db.query(Avaliacao).filter(Avaliacao.id == avaliacao_id).first()
@@ -84,10 +240,34 @@ async def update_avaliacao(
             detail="Avaliação não encontrada"
         )
     
+    # A contribuição antiga sai e a nova entra (a data pode mudar o período)
+    deltas = MediaService.novos_deltas()
+    MediaService.acumular(
+        deltas, avaliacao.aluno_id, avaliacao.disciplina_id,
+        avaliacao.data_avaliacao, avaliacao.nota, avaliacao.peso, -1
+    )
+
     update_data = avaliacao_update.model_dump(exclude_unset=True)
+    nota_alterada = "nota" in update_data and update_data["nota"] != avaliacao.nota
     for field, value in update_data.items():
         setattr(avaliacao, field, value)
-    
+    try:
+        db.flush()
+    except IntegrityError as e:
+        raise _erro_integridade(db, e)
+
+    MediaService.acumular(
+        deltas, avaliacao.aluno_id, avaliacao.disciplina_id,
+        avaliacao.data_avaliacao, avaliacao.nota, avaliacao.peso
+    )
+    MediaService.aplicar_deltas(db, deltas)
+    if nota_alterada and avaliacao.nota is not None:
+        EventosDominioService.notas(
+            db, avaliacao.disciplina_id, avaliacao.titulo, avaliacao.data_avaliacao,
+            [avaliacao.aluno_id],
+            turma_id=db.query(Aluno.turma_id).filter(Aluno.id == avaliacao.aluno_id).scalar(),
+            chave_requisicao=chave_idempotencia
+        )
     db.commit()
     db.refresh(avaliacao)
     return avaliacao
@@ -108,6 +288,13 @@ async def delete_avaliacao(
             detail="Avaliação não encontrada"
         )
     
+    deltas = MediaService.novos_deltas()
+    MediaService.acumular(
+        deltas, avaliacao.aluno_id, avaliacao.disciplina_id,
+        avaliacao.data_avaliacao, avaliacao.nota, avaliacao.peso, -1
+    )
+    MediaService.aplicar_deltas(db, deltas)
+
     db.delete(avaliacao)
     db.commit()
     
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.models import TipoUsuario
+from app.schemas import ResultadoBusca, SugestaoUsuario, TokenData
+from app.services.busca import BuscaService, DOCUMENTOS
+from app.services.sugestoes import SugestoesService, TIPOS_POR_PERFIL, TAMANHO_MINIMO
+from app.utils.dependencies import get_read_db, get_actor_context, get_current_claims, ActorContext
+
+router = APIRouter(prefix="/api/busca", tags=["Busca"])
+
+
+@router.get("/", response_model=List[ResultadoBusca])
+async def buscar(
+    q: str = Query(..., min_length=2, max_length=200),
+    tipos: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Busca textual em mensagens, atividades e eventos visíveis ao usuário.
+
+    ``tipos`` é uma lista separada por vírgulas (padrão: todos). No PostgreSQL
+    aceita a sintaxe de busca web: "frase exata", -excluir, termo OR termo.
+    """
+    selecionados = [t.strip() for t in tipos.split(",") if t.strip()] if tipos else list(DOCUMENTOS)
+    desconhecidos = set(selecionados) - set(DOCUMENTOS)
+    if desconhecidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tipos de busca inválidos: {', '.join(sorted(desconhecidos))}"
+        )
+
+    return BuscaService.buscar(db, ator, q, selecionados, limit)
+
+
+@router.get("/sugestoes", response_model=List[SugestaoUsuario])
+async def sugerir_usuarios(
+    q: str = Query(..., min_length=TAMANHO_MINIMO, max_length=100),
+    tipo: str = "alunos",
+    escola_id: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(get_current_claims)
+):
+    """Autocompletar de alunos, professores ou responsáveis para seletores.
+
+    Procura no nome (qualquer parte) e, para professores e gestores, no
+    início da matrícula; gestores também pelo CPF de responsáveis. Restrito
+    às escolas do token, exceto para gestores.
+    """
+    if tipo not in TIPOS_POR_PERFIL[claims.tipo_usuario]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não tem permissão para acessar este recurso"
+        )
+
+    if claims.tipo_usuario == TipoUsuario.GESTOR:
+        escolas = [escola_id] if escola_id else None
+    elif escola_id:
+        if escola_id not in claims.escolas:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Você não tem permissão para acessar esta escola"
+            )
+        escolas = [escola_id]
+    else:
+        escolas = claims.escolas
+
+    if escolas == []:
+        return []
+
+    return SugestoesService.sugerir(db, tipo, q, claims.tipo_usuario, escolas, limit)
@@ -4,10 +4,15 @@ from typing import List
 from app.database import get_db
 from app.models import Disciplina, User, TipoUsuario
 from app.schemas import DisciplinaCreate, DisciplinaUpdate, DisciplinaResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.utils.dependencies import get_current_active_user, require_role, get_read_db
+from app.utils.cache_http import cache_condicional, CACHE_CATALOGO
+from app.utils.projecao import Projecao
+from app.utils.respostas import RespostaJSON
 
 router = APIRouter(prefix="/api/disciplinas", tags=["Disciplinas"])
 
+projecao_disciplinas = Projecao(Disciplina, DisciplinaResponse)
+
 
 @router.post("/", response_model=DisciplinaResponse, status_code=status.HTTP_201_CREATED)
 async def create_disciplina(
@@ -32,22 +37,34 @@ async def create_disciplina(
     return db_disciplina
 
 
-@router.get("/", response_model=List[DisciplinaResponse])
+@router.get(
+    "/",
+    response_model=List[DisciplinaResponse],
+    dependencies=[Depends(cache_condicional("disciplinas", cache_control=CACHE_CATALOGO))],
+)
 async def list_disciplinas(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    campos: List[str] = Depends(projecao_disciplinas.campos),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Lista todas as disciplinas"""
+    """Lista todas as disciplinas (``fields`` restringe as colunas devolvidas)"""
+    if campos:
+        linhas = projecao_disciplinas.consulta(db, campos).offset(skip).limit(limit).all()
+        return RespostaJSON(projecao_disciplinas.montar(linhas, campos))
     disciplinas = db.query(Disciplina).offset(skip).limit(limit).all()
     return disciplinas
 
 
-@router.get("/{disciplina_id}", response_model=DisciplinaResponse)
+@router.get(
+    "/{disciplina_id}",
+    response_model=DisciplinaResponse,
+    dependencies=[Depends(cache_condicional("disciplinas", cache_control=CACHE_CATALOGO))],
+)
 async def get_disciplina(
     disciplina_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Retorna os detalhes de uma disciplina"""
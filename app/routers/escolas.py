@@ -5,10 +5,15 @@ from app.database import get_db
 from app.models.escola import Escola
 from app.models import User, TipoUsuario
 from app.schemas.escola import EscolaCreate, EscolaUpdate, EscolaResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.utils.dependencies import get_current_active_user, require_role, get_read_db
+from app.utils.cache_http import cache_condicional, CACHE_CATALOGO
+from app.utils.projecao import Projecao
+from app.utils.respostas import RespostaJSON
 
 router = APIRouter(prefix="/api/escolas", tags=["Escolas"])
 
+projecao_escolas = Projecao(Escola, EscolaResponse)
+
 
 @router.post("/", response_model=EscolaResponse, status_code=status.HTTP_201_CREATED)
 async def create_escola(
@@ -33,22 +38,34 @@ async def create_escola(
     return db_escola
 
 
-@router.get("/", response_model=List[EscolaResponse])
+@router.get(
+    "/",
+    response_model=List[EscolaResponse],
+    dependencies=[Depends(cache_condicional("escolas", cache_control=CACHE_CATALOGO))],
+)
 async def list_escolas(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    campos: List[str] = Depends(projecao_escolas.campos),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """Lista todas as escolas"""
+    """Lista todas as escolas (``fields`` restringe as colunas devolvidas)"""
+    if campos:
+        linhas = projecao_escolas.consulta(db, campos).offset(skip).limit(limit).all()
+        return RespostaJSON(projecao_escolas.montar(linhas, campos))
     escolas = db.query(Escola).offset(skip).limit(limit).all()
     return escolas
 
 
-@router.get("/{escola_id}", response_model=EscolaResponse)
+@router.get(
+    "/{escola_id}",
+    response_model=EscolaResponse,
+    dependencies=[Depends(cache_condicional("escolas", cache_control=CACHE_CATALOGO))],
+)
 async def get_escola(
     escola_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Retorna os detalhes de uma escola"""
@@ -109,7 +126,7 @@ async def delete_escola(
 @router.get("/{escola_id}/turmas")
 async def list_turmas_by_escola(
     escola_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Lista todas as turmas de uma escola"""
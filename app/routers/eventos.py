@@ -5,7 +5,8 @@ from datetime import date
 from app.database import get_db
 from app.models import EventoEscolar, User, TipoUsuario
 from app.schemas import EventoCreate, EventoUpdate, EventoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.services.eventos_dominio import EventosDominioService
+from app.utils.dependencies import get_current_active_user, require_role, get_read_db, get_chave_idempotencia
 
 router = APIRouter(prefix="/api/eventos", tags=["Eventos"])
 
@@ -14,13 +15,16 @@ router = APIRouter(prefix="/api/eventos", tags=["Eventos"])
 async def create_evento(
     evento_data: EventoCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Cria um evento escolar"""
     db_evento = EventoEscolar(**evento_data.model_dump(exclude={"criado_por_id"}))
     db_evento.criado_por_id = current_user.id
     
     db.add(db_evento)
+    db.flush()
+    EventosDominioService.evento_escolar(db, db_evento, criado=True, chave_requisicao=chave_idempotencia)
     db.commit()
     db.refresh(db_evento)
     
@@ -34,7 +38,7 @@ async def list_eventos(
     turma_id: Optional[int] = None,
     data_inicio: Optional[date] = None,
     data_fim: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Lista eventos escolares com filtros opcionais"""
@@ -56,7 +60,7 @@ async def list_eventos(
 @router.get("/{evento_id}", response_model=EventoResponse)
 async def get_evento(
     evento_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Retorna os detalhes de um evento"""
@@ -76,7 +80,8 @@ async def update_evento(
     evento_id: int,
     evento_update: EventoUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)),
+    chave_idempotencia: Optional[str] = Depends(get_chave_idempotencia)
 ):
     """Atualiza um evento"""
     evento = db.query(EventoEscolar).filter(EventoEscolar.id == evento_id).first()
@@ -88,9 +93,14 @@ async def update_evento(
         )
     
     update_data = evento_update.model_dump(exclude_unset=True)
+    alterados = {field for field, value in update_data.items() if getattr(evento, field) != value}
     for field, value in update_data.items():
         setattr(evento, field, value)
     
+    db.flush()
+    EventosDominioService.evento_escolar(
+        db, evento, criado=False, alterados=alterados, chave_requisicao=chave_idempotencia
+    )
     db.commit()
     db.refresh(evento)
     return evento
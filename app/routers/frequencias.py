@@ -0,0 +1,101 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import date
+from app.database import get_db
+from app.models import Aluno, Turma, User, TipoUsuario
+from app.schemas import (
+    ChamadaCreate, ChamadaAlunoResponse, FrequenciaAlunoResumo, FrequenciaTurmaResumo,
+    TokenData
+)
+from app.services.frequencia import FrequenciaService
+from app.utils.dependencies import require_role, require_role_claims, get_actor_context, ActorContext, get_read_db
+
+router = APIRouter(prefix="/api/frequencias", tags=["Frequência"])
+
+
+@router.post("/turma/{turma_id}/chamada", status_code=status.HTTP_201_CREATED)
+async def registrar_chamada(
+    turma_id: int,
+    chamada: ChamadaCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Registra (ou refaz) a chamada de um dia para a turma inteira"""
+    turma = db.query(Turma).filter(Turma.id == turma_id).first()
+    if not turma:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Turma não encontrada"
+        )
+
+    # Todos os alunos informados precisam pertencer à turma
+    alunos_turma = {
+        r.id for r in db.query(Aluno.id).filter(Aluno.turma_id == turma_id).all()
+    }
+    invalidos = sorted({r.aluno_id for r in chamada.registros} - alunos_turma)
+    if invalidos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Alunos não pertencem à turma: {invalidos}"
+        )
+    aluno_ids = [r.aluno_id for r in chamada.registros]
+    if len(set(aluno_ids)) != len(aluno_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aluno informado mais de uma vez"
+        )
+
+    total = FrequenciaService.registrar_chamada(
+        db,
+        turma_id,
+        chamada.data,
+        [(r.aluno_id, r.presente) for r in chamada.registros]
+    )
+
+    return {
+        "mensagem": "Chamada registrada com sucesso",
+        "data": chamada.data,
+        "total_registrados": total
+    }
+
+
+@router.get("/turma/{turma_id}/chamada", response_model=List[ChamadaAlunoResponse])
+async def get_chamada(
+    turma_id: int,
+    data: date,
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Retorna a chamada de um dia da turma"""
+    return FrequenciaService.get_chamada(db, turma_id, data)
+
+
+@router.get("/turma/{turma_id}/resumo", response_model=FrequenciaTurmaResumo)
+async def get_resumo_turma(
+    turma_id: int,
+    ano: int = None,
+    mes: int = None,
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR))
+):
+    """Retorna a taxa de frequência da turma e de cada aluno"""
+    return FrequenciaService.get_resumo_turma(db, turma_id, ano, mes)
+
+
+@router.get("/aluno/{aluno_id}/resumo", response_model=FrequenciaAlunoResumo)
+async def get_resumo_aluno(
+    aluno_id: int,
+    ano: int = None,
+    mes: int = None,
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context)
+):
+    """Retorna a taxa de frequência de um aluno"""
+    if not ator.pode_ver_aluno(aluno_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Acesso negado a este aluno"
+        )
+
+    return FrequenciaService.get_resumo_aluno(db, aluno_id, ano, mes)
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.models import User, TipoUsuario
+from app.schemas import RelatorioImportacao
+from app.services.importacao import ImportacaoService
+from app.utils.dependencies import require_role
+
+router = APIRouter(prefix="/api/importacao", tags=["Importação"])
+
+
+@router.post("/matriculas", response_model=RelatorioImportacao)
+def importar_matriculas(
+    file: UploadFile = File(...),
+    dry_run: bool = True,
+    ignorar_erros: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+):
+    """
+    Importa alunos e responsáveis a partir de um CSV
+
+    - Por padrão apenas valida (dry_run=true) e retorna o relatório de erros por linha
+    - Com erros de validação nada é gravado, a menos que ignorar_erros=true
+    - Tamanho máximo: 20MB
+    """
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+
+    if file_size > 20 * 1024 * 1024:  # 20MB
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Arquivo muito grande. Tamanho máximo: 20MB"
+        )
+
+    try:
+        conteudo = file.file.read().decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O arquivo deve estar codificado em UTF-8"
+        )
+
+    return ImportacaoService.importar(db, conteudo, dry_run, ignorar_erros)
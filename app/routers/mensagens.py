@@ -4,9 +4,9 @@ from sqlalchemy import or_
 from typing import List
 from datetime import datetime
 from app.database import get_db
-from app.models import Mensagem, User, TipoUsuario
-from app.schemas import MensagemCreate, MensagemResponse, MensagemBroadcast
-from app.utils.dependencies import get_current_active_user, require_role
+from app.models import Mensagem, MensagemArquivada, User, TipoUsuario
+from app.schemas import MensagemCreate, MensagemResponse, MensagemBroadcast, MensagemArquivadaResponse
+from app.utils.dependencies import get_current_active_user, require_role, get_read_db
 
 router = APIRouter(prefix="/api/mensagens", tags=["Mensagens"])
 
@@ -75,7 +75,7 @@ async def list_mensagens_inbox(
     skip: int = 0,
     limit: int = 50,
     apenas_nao_lidas: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Lista mensagens recebidas (inbox)"""
@@ -92,7 +92,7 @@ async def list_mensagens_inbox(
 async def list_mensagens_enviadas(
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Lista mensagens enviadas"""
@@ -103,10 +103,51 @@ async def list_mensagens_enviadas(
     return mensagens
 
 
+@router.get("/arquivo", response_model=List[MensagemArquivadaResponse])
+async def list_mensagens_arquivadas(
+    skip: int = 0,
+    limit: int = 50,
+    enviadas: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Lista mensagens arquivadas (lidas há mais de ARQUIVAMENTO_DIAS), recebidas ou enviadas"""
+    coluna = MensagemArquivada.remetente_id if enviadas else MensagemArquivada.destinatario_id
+    mensagens = db.query(MensagemArquivada).filter(
+        coluna == current_user.id
+    ).order_by(MensagemArquivada.enviada_em.desc()).offset(skip).limit(limit).all()
+
+    return mensagens
+
+
+@router.get("/arquivo/{mensagem_id}", response_model=MensagemArquivadaResponse)
+async def get_mensagem_arquivada(
+    mensagem_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Retorna uma mensagem arquivada"""
+    mensagem = db.query(MensagemArquivada).filter(MensagemArquivada.id == mensagem_id).first()
+
+    if not mensagem:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Mensagem não encontrada"
+        )
+
+    if mensagem.remetente_id != current_user.id and mensagem.destinatario_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Você não tem permissão para acessar esta mensagem"
+        )
+
+    return mensagem
+
+
 @router.get("/{mensagem_id}", response_model=MensagemResponse)
 async def get_mensagem(
     mensagem_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Retorna os detalhes de uma mensagem"""
@@ -161,7 +202,7 @@ async def confirmar_leitura(
 
 @router.get("/stats/nao-lidas")
 async def count_mensagens_nao_lidas(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Conta o número de mensagens não lidas"""
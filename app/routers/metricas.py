@@ -2,9 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User, TipoUsuario
-from app.schemas import MetricaEngajamentoCreate, MetricaEngajamentoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.schemas import MetricaEngajamentoCreate, MetricaEngajamentoResponse, TokenData
+from app.utils.dependencies import get_current_active_user, require_role_claims, get_read_db
 from app.services.metrics import MetricsService
+from app.utils.password_pool import password_pool
+from app.utils.instrumentacao import metricas_requests
 
 router = APIRouter(prefix="/api/metricas", tags=["Métricas"])
 
@@ -33,8 +35,8 @@ async def registrar_metrica(
 @router.get("/engajamento/responsaveis")
 async def get_engajamento_responsaveis(
     dias: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
 ):
     """Retorna taxa de engajamento dos responsáveis"""
     return MetricsService.get_engajamento_responsaveis(db, dias)
@@ -43,8 +45,8 @@ async def get_engajamento_responsaveis(
 @router.get("/tempo-resposta/media")
 async def get_tempo_resposta_medio(
     dias: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
 ):
     """Retorna tempo médio de resposta a mensagens"""
     return MetricsService.get_tempo_resposta_medio(db, dias)
@@ -53,8 +55,8 @@ async def get_tempo_resposta_medio(
 @router.get("/uso-por-perfil")
 async def get_uso_por_perfil(
     dias: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
 ):
     """Retorna estatísticas de uso por tipo de usuário"""
     return MetricsService.get_uso_por_perfil(db, dias)
@@ -64,9 +66,25 @@ async def get_uso_por_perfil(
 async def get_acoes_mais_comuns(
     dias: int = 30,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
 ):
     """Retorna as ações mais comuns no período"""
     return MetricsService.get_acoes_mais_comuns(db, dias, limit)
 
+
+
+@router.get("/sistema/senhas")
+async def get_password_pool_stats(
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
+):
+    """Retorna a profundidade da fila e os contadores do pool de hashing de senhas"""
+    return password_pool.stats()
+
+
+@router.get("/sistema/requests")
+async def get_metricas_requests(
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
+):
+    """Retorna latência, queries por request e tempo de banco de cada rota"""
+    return metricas_requests.resumo()
@@ -3,9 +3,9 @@ from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 from app.database import get_db
-from app.models import Notificacao, User, TipoUsuario
-from app.schemas import NotificacaoCreate, NotificacaoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.models import Notificacao, NotificacaoArquivada, User, TipoUsuario
+from app.schemas import NotificacaoCreate, NotificacaoResponse, NotificacaoArquivadaResponse
+from app.utils.dependencies import get_current_active_user, require_role, get_read_db
 
 router = APIRouter(prefix="/api/notificacoes", tags=["Notificações"])
 
@@ -15,7 +15,7 @@ async def list_notificacoes(
     skip: int = 0,
     limit: int = 50,
     apenas_nao_lidas: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Lista notificações do usuário"""
@@ -30,6 +30,25 @@ async def list_notificacoes(
     return notificacoes
 
 
+@router.get("/arquivo", response_model=List[NotificacaoArquivadaResponse])
+async def list_notificacoes_arquivadas(
+    skip: int = 0,
+    limit: int = 50,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Lista notificações arquivadas (lidas há mais de ARQUIVAMENTO_DIAS)"""
+    notificacoes = (
+        db.query(NotificacaoArquivada)
+        .filter(NotificacaoArquivada.usuario_id == current_user.id)
+        .order_by(NotificacaoArquivada.criada_em.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return notificacoes
+
+
 @router.post(
     "/", response_model=NotificacaoResponse, status_code=status.HTTP_201_CREATED
 )
@@ -112,7 +131,7 @@ async def marcar_todas_como_lidas(
 
 @router.get("/nao-lidas/count")
 async def count_notificacoes_nao_lidas(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)
+    db: Session = Depends(get_read_db), current_user: User = Depends(get_current_active_user)
 ):
     """Retorna o número de notificações não lidas"""
     count = (
@@ -9,8 +9,10 @@ from app.schemas import (
     PEIResponse,
     IntervencaoPedagogicaCreate,
     IntervencaoPedagogicaResponse,
+    TokenData,
 )
-from app.utils.dependencies import get_current_active_user, require_role
+from app.utils.dependencies import get_current_active_user, require_role, require_role_claims, get_read_db
+from app.utils.cache_http import cache_condicional, CACHE_REVALIDAR
 
 router = APIRouter(prefix="/api/peis", tags=["PEI e Inclusão"])
 
@@ -52,10 +54,14 @@ async def create_pei(
     return db_pei
 
 
-@router.get("/aluno/{aluno_id}", response_model=PEIResponse)
+@router.get(
+    "/aluno/{aluno_id}",
+    response_model=PEIResponse,
+    dependencies=[Depends(cache_condicional("peis", cache_control=CACHE_REVALIDAR))],
+)
 async def get_pei_by_aluno(
     aluno_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Retorna o PEI ativo de um aluno"""
@@ -73,9 +79,9 @@ async def get_pei_by_aluno(
 @router.get("/aluno/{aluno_id}/historico", response_model=List[PEIResponse])
 async def get_pei_historico(
     aluno_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
-        require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(
+        require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
     ),
 ):
     """Retorna todos os PEIs (histórico) de um aluno"""
@@ -147,7 +153,7 @@ async def create_intervencao(
 )
 async def list_intervencoes(
     pei_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Lista todas as intervenções de um PEI"""
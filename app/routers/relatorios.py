@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import User, TipoUsuario
-from app.utils.dependencies import require_role
+from app.models import TipoUsuario
+from app.schemas import TokenData
+from app.utils.dependencies import require_role_claims, get_read_db
 from app.services.reports import ReportsService
+from app.utils.respostas import RespostaJSON
 
 router = APIRouter(prefix="/api/relatorios", tags=["Relatórios"])
 
@@ -12,61 +13,61 @@ router = APIRouter(prefix="/api/relatorios", tags=["Relatórios"])
 async def get_engajamento_geral(
     dias: int = 30,
     escola_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
 ):
     """Retorna métricas gerais de uso do sistema"""
-    return ReportsService.get_engajamento_geral(db, dias, escola_id)
+    return RespostaJSON(ReportsService.get_engajamento_geral(db, dias, escola_id))
 
 
 @router.get("/desempenho-alunos")
 async def get_desempenho_alunos(
     escola_id: int = None,
     turma_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
 ):
     """Retorna análise de desempenho por turma/aluno"""
-    return ReportsService.get_desempenho_alunos(db, escola_id, turma_id)
+    return RespostaJSON(ReportsService.get_desempenho_alunos(db, escola_id, turma_id))
 
 
 @router.get("/comunicacao")
 async def get_comunicacao_stats(
     dias: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
 ):
     """Retorna estatísticas de mensagens (enviadas, lidas, tempo resposta)"""
-    return ReportsService.get_comunicacao_stats(db, dias)
+    return RespostaJSON(ReportsService.get_comunicacao_stats(db, dias))
 
 
 @router.get("/eventos/participacao")
 async def get_eventos_participacao(
     dias: int = 30,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR))
 ):
     """Retorna taxa de participação em eventos"""
-    return ReportsService.get_eventos_participacao(db, dias)
+    return RespostaJSON(ReportsService.get_eventos_participacao(db, dias))
 
 
 @router.get("/atividades/conclusao")
 async def get_atividades_conclusao(
     dias: int = 30,
     turma_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
 ):
     """Retorna taxa de conclusão de atividades"""
-    return ReportsService.get_atividades_conclusao(db, dias, turma_id)
+    return RespostaJSON(ReportsService.get_atividades_conclusao(db, dias, turma_id))
 
 
 @router.get("/pei/acompanhamento")
 async def get_pei_acompanhamento(
     escola_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR))
 ):
     """Retorna progresso dos alunos com PEI"""
-    return ReportsService.get_pei_acompanhamento(db, escola_id)
+    return RespostaJSON(ReportsService.get_pei_acompanhamento(db, escola_id))
 
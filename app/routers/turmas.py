@@ -3,11 +3,18 @@ from sqlalchemy.orm import Session, joinedload
 from typing import List
 from app.database import get_db
 from app.models import Turma, Aluno, User, TipoUsuario, Professor, Escola
-from app.schemas import TurmaCreate, TurmaUpdate, TurmaResponse, AlunoResponse
-from app.utils.dependencies import get_current_active_user, require_role
+from app.schemas import TurmaCreate, TurmaUpdate, TurmaResponse, AlunoResponse, EscolaResponse, TokenData
+from app.utils.dependencies import get_current_active_user, require_role, require_role_claims, get_read_db
+from app.utils.cache_http import cache_condicional, CACHE_CURTO
+from app.utils.respostas import RespostaJSON
+from app.utils.projecao import Projecao
 
 router = APIRouter(prefix="/api/turmas", tags=["Turmas"])
 
+projecao_turmas = Projecao(
+    Turma, TurmaResponse, {"escola": (Escola, Turma.escola_id == Escola.id, EscolaResponse)}
+)
+
 
 @router.post("/", response_model=TurmaResponse, status_code=status.HTTP_201_CREATED)
 async def create_turma(
@@ -39,28 +46,42 @@ async def create_turma(
     return db_turma
 
 
-@router.get("/", response_model=List[TurmaResponse])
+@router.get(
+    "/",
+    response_model=List[TurmaResponse],
+    dependencies=[Depends(cache_condicional("turmas", "escolas", cache_control=CACHE_CURTO))],
+)
 async def list_turmas(
     skip: int = 0,
     limit: int = 100,
     ano_letivo: int = None,
-    db: Session = Depends(get_db),
+    campos: List[str] = Depends(projecao_turmas.campos),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """Lista todas as turmas"""
-    query = db.query(Turma).options(joinedload(Turma.escola))
+    """Lista todas as turmas (``fields`` restringe as colunas devolvidas)"""
+    if campos:
+        query = projecao_turmas.consulta(db, campos)
+    else:
+        query = db.query(Turma).options(joinedload(Turma.escola))
 
     if ano_letivo:
         query = query.filter(Turma.ano_letivo == ano_letivo)
 
     turmas = query.offset(skip).limit(limit).all()
+    if campos:
+        return RespostaJSON(projecao_turmas.montar(turmas, campos))
     return turmas
 
 
-@router.get("/{turma_id}", response_model=TurmaResponse)
+@router.get(
+    "/{turma_id}",
+    response_model=TurmaResponse,
+    dependencies=[Depends(cache_condicional("turmas", "escolas", cache_control=CACHE_CURTO))],
+)
 async def get_turma(
     turma_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Retorna os detalhes de uma turma"""
@@ -77,9 +98,9 @@ async def get_turma(
 @router.get("/{turma_id}/alunos", response_model=List[AlunoResponse])
 async def list_alunos_turma(
     turma_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
-        require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(
+        require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)
     ),
 ):
     """Lista todos os alunos de uma turma"""
@@ -209,7 +230,7 @@ async def remove_professor_from_turma(
 @router.get("/{turma_id}/professores")
 async def list_professores_turma(
     turma_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Lista todos os professores de uma turma"""
@@ -236,9 +257,9 @@ async def list_professores_turma(
 @router.get("/{turma_id}/responsaveis")
 async def list_responsaveis_turma(
     turma_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
-        require_role(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(
+        require_role_claims(TipoUsuario.PROFESSOR, TipoUsuario.GESTOR)
     ),
 ):
     """Lista todos os responsáveis (pais) dos alunos de uma turma"""
@@ -274,4 +295,4 @@ async def list_responsaveis_turma(
                 }
             )
 
-    return list(responsaveis_dict.values())
+    return RespostaJSON(list(responsaveis_dict.values()))
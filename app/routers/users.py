@@ -15,9 +15,17 @@ from app.schemas import (
     ResponsavelResponse,
     GestorCreate,
     GestorResponse,
+    TokenData,
 )
-from app.utils.dependencies import get_current_active_user, require_role
-from app.utils.security import get_password_hash
+from app.utils.dependencies import (
+    get_current_active_user,
+    require_role,
+    require_role_claims,
+    get_actor_context,
+    ActorContext,
+    get_read_db,
+)
+from app.utils.password_pool import password_pool
 
 router = APIRouter(prefix="/api/users", tags=["Usuários"])
 
@@ -42,7 +50,7 @@ async def update_current_user(
     if user_update.telefone is not None:
         current_user.telefone = user_update.telefone
     if user_update.senha is not None:
-        current_user.senha_hash = get_password_hash(user_update.senha)
+        current_user.senha_hash = password_pool.hash(user_update.senha)
 
     db.commit()
     db.refresh(current_user)
@@ -61,6 +69,7 @@ async def create_aluno(
     current_user: User = Depends(
         require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR, TipoUsuario.RESPONSAVEL)
     ),
+    ator: ActorContext = Depends(get_actor_context),
 ):
     """Cadastra um novo aluno"""
     # Verifica se a matrícula já existe
@@ -74,15 +83,12 @@ async def create_aluno(
 
     # Se o usuário é responsável, automaticamente vincula o aluno a ele
     if current_user.tipo_usuario == TipoUsuario.RESPONSAVEL:
-        responsavel = (
-            db.query(Responsavel).filter(Responsavel.user_id == current_user.id).first()
-        )
-        if not responsavel:
+        if not ator.responsavel_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Perfil de responsável não encontrado",
             )
-        aluno_data.responsavel_id = responsavel.id
+        aluno_data.responsavel_id = ator.responsavel_id
 
     db_aluno = Aluno(**aluno_data.model_dump())
     db.add(db_aluno)
@@ -95,8 +101,8 @@ async def create_aluno(
 @router.get("/alunos/{aluno_id}", response_model=AlunoResponse)
 async def get_aluno(
     aluno_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_read_db),
+    ator: ActorContext = Depends(get_actor_context),
 ):
     """Retorna os detalhes de um aluno"""
     aluno = db.query(Aluno).filter(Aluno.id == aluno_id).first()
@@ -106,11 +112,8 @@ async def get_aluno(
         )
 
     # Verifica permissões: responsável só pode ver seus próprios alunos
-    if current_user.tipo_usuario == TipoUsuario.RESPONSAVEL:
-        responsavel = (
-            db.query(Responsavel).filter(Responsavel.user_id == current_user.id).first()
-        )
-        if not responsavel or aluno.responsavel_id != responsavel.id:
+    if ator.user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+        if aluno.id not in ator.filhos_ids:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Você não tem permissão para acessar este aluno",
@@ -149,9 +152,9 @@ async def list_alunos(
     skip: int = 0,
     limit: int = 100,
     turma_id: int = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
-        require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(
+        require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
     ),
 ):
     """Lista todos os alunos"""
@@ -187,9 +190,9 @@ async def create_professor(
 
 @router.get("/professores", response_model=list[ProfessorResponse])
 async def list_professores(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
-        require_role(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
+    db: Session = Depends(get_read_db),
+    claims: TokenData = Depends(
+        require_role_claims(TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
     ),
 ):
     """Lista todos os professores cadastrados"""
@@ -202,7 +205,7 @@ async def list_professores(
 @router.get("/professores/{professor_id}", response_model=ProfessorResponse)
 async def get_professor(
     professor_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Retorna os detalhes de um professor"""
@@ -245,7 +248,7 @@ async def create_responsavel(
 @router.get("/responsaveis/{responsavel_id}", response_model=ResponsavelResponse)
 async def get_responsavel(
     responsavel_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Retorna os detalhes de um responsável"""
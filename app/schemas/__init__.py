@@ -1,4 +1,11 @@
-from app.schemas.user import UserCreate, UserUpdate, UserResponse, Token, TokenData
+from app.schemas.user import (
+    UserCreate,
+    UserUpdate,
+    UserResponse,
+    Token,
+    TokenData,
+    RefreshRequest,
+)
 from app.schemas.professor import ProfessorCreate, ProfessorUpdate, ProfessorResponse
 from app.schemas.responsavel import (
     ResponsavelCreate,
@@ -14,13 +21,26 @@ from app.schemas.disciplina import (
 )
 from app.schemas.turma import TurmaCreate, TurmaUpdate, TurmaResponse
 from app.schemas.escola import EscolaCreate, EscolaUpdate, EscolaResponse
-from app.schemas.avaliacao import AvaliacaoCreate, AvaliacaoUpdate, AvaliacaoResponse
+from app.schemas.avaliacao import (
+    AvaliacaoCreate,
+    AvaliacaoUpdate,
+    AvaliacaoResponse,
+    LancamentoNota,
+    AvaliacaoLoteCreate,
+    BoletimAvaliacao,
+    BoletimAluno,
+    BoletimTurmaResponse,
+    MediaDisciplinaResponse,
+)
 from app.schemas.atividade import (
     AtividadeCreate,
     AtividadeUpdate,
     AtividadeResponse,
     EntregaAtividadeCreate,
     EntregaAtividadeResponse,
+    AtividadePendenteResponse,
+    NotaEntrega,
+    AvaliacaoEntregasLote,
 )
 from app.schemas.pei import (
     PEICreate,
@@ -29,10 +49,19 @@ from app.schemas.pei import (
     IntervencaoPedagogicaCreate,
     IntervencaoPedagogicaResponse,
 )
-from app.schemas.mensagem import MensagemCreate, MensagemResponse, MensagemBroadcast
-from app.schemas.notificacao import NotificacaoCreate, NotificacaoResponse
+from app.schemas.mensagem import MensagemCreate, MensagemResponse, MensagemBroadcast, MensagemArquivadaResponse
+from app.schemas.notificacao import NotificacaoCreate, NotificacaoResponse, NotificacaoArquivadaResponse
 from app.schemas.evento import EventoCreate, EventoUpdate, EventoResponse
 from app.schemas.metrica import MetricaEngajamentoCreate, MetricaEngajamentoResponse
+from app.schemas.importacao import LinhaMatricula, ErroLinha, RelatorioImportacao
+from app.schemas.frequencia import (
+    RegistroChamada,
+    ChamadaCreate,
+    ChamadaAlunoResponse,
+    FrequenciaAlunoResumo,
+    FrequenciaTurmaResumo,
+)
+from app.schemas.busca import ResultadoBusca, SugestaoUsuario
 
 __all__ = [
     "UserCreate",
@@ -40,6 +69,7 @@ __all__ = [
     "UserResponse",
     "Token",
     "TokenData",
+    "RefreshRequest",
     "ProfessorCreate",
     "ProfessorUpdate",
     "ProfessorResponse",
@@ -64,11 +94,20 @@ __all__ = [
     "AvaliacaoCreate",
     "AvaliacaoUpdate",
     "AvaliacaoResponse",
+    "LancamentoNota",
+    "AvaliacaoLoteCreate",
+    "BoletimAvaliacao",
+    "BoletimAluno",
+    "BoletimTurmaResponse",
+    "MediaDisciplinaResponse",
     "AtividadeCreate",
     "AtividadeUpdate",
     "AtividadeResponse",
     "EntregaAtividadeCreate",
     "EntregaAtividadeResponse",
+    "AtividadePendenteResponse",
+    "NotaEntrega",
+    "AvaliacaoEntregasLote",
     "PEICreate",
     "PEIUpdate",
     "PEIResponse",
@@ -77,11 +116,23 @@ __all__ = [
     "MensagemCreate",
     "MensagemResponse",
     "MensagemBroadcast",
+    "MensagemArquivadaResponse",
     "NotificacaoCreate",
     "NotificacaoResponse",
+    "NotificacaoArquivadaResponse",
     "EventoCreate",
     "EventoUpdate",
     "EventoResponse",
     "MetricaEngajamentoCreate",
     "MetricaEngajamentoResponse",
+    "LinhaMatricula",
+    "ErroLinha",
+    "RelatorioImportacao",
+    "RegistroChamada",
+    "ChamadaCreate",
+    "ChamadaAlunoResponse",
+    "FrequenciaAlunoResumo",
+    "FrequenciaTurmaResumo",
+    "ResultadoBusca",
+    "SugestaoUsuario",
 ]
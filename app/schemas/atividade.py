@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date, datetime
 
 
@@ -55,3 +55,25 @@ class EntregaAtividadeResponse(EntregaAtividadeBase):
 
     class Config:
         from_attributes = True
+
+
+class AtividadePendenteResponse(BaseModel):
+    id: int
+    turma_id: int
+    disciplina_id: int
+    titulo: str
+    tipo: Optional[str] = None
+    data_entrega: Optional[date] = None
+    pontuacao_maxima: Optional[int] = None
+    atrasada: bool
+
+
+class NotaEntrega(BaseModel):
+    aluno_id: int
+    nota: Optional[int] = Field(None, ge=0)
+    observacoes: Optional[str] = None
+
+
+class AvaliacaoEntregasLote(BaseModel):
+    notas: List[NotaEntrega] = Field(..., min_length=1)
+    notificar: bool = True  # avisa alunos e responsáveis
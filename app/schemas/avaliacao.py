@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date
 
 
@@ -34,3 +34,53 @@ class AvaliacaoResponse(AvaliacaoBase):
     class Config:
         from_attributes = True
 
+
+
+class LancamentoNota(BaseModel):
+    aluno_id: int
+    nota: Optional[float] = None
+    observacoes: Optional[str] = None
+
+
+class AvaliacaoLoteCreate(BaseModel):
+    turma_id: int
+    disciplina_id: int
+    professor_id: Optional[int] = None
+    titulo: str
+    tipo: Optional[str] = None
+    peso: float = 1.0
+    data_avaliacao: date
+    notas: List[LancamentoNota] = Field(..., min_length=1)
+
+
+class BoletimAvaliacao(BaseModel):
+    titulo: str
+    tipo: Optional[str] = None
+    peso: Optional[float] = None
+    data_avaliacao: date
+
+
+class BoletimAluno(BaseModel):
+    aluno_id: int
+    nome: str
+    matricula: str
+    notas: List[Optional[float]]
+
+
+class BoletimTurmaResponse(BaseModel):
+    turma_id: int
+    disciplina_id: int
+    avaliacoes: List[BoletimAvaliacao]
+    alunos: List[BoletimAluno]
+
+
+class MediaDisciplinaResponse(BaseModel):
+    aluno_id: int
+    disciplina_id: int
+    ano: int
+    periodo: int
+    total_avaliacoes: int
+    media: Optional[float] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional, Union
+from datetime import date, datetime
+from app.models.user import TipoUsuario
+
+
+class ResultadoBusca(BaseModel):
+    tipo: str  # mensagens, atividades ou eventos
+    id: int
+    titulo: str  # HTML escapado, com os termos encontrados entre <mark></mark>
+    trecho: str  # idem
+    rank: float
+    data: Optional[Union[datetime, date]] = None
+
+
+class SugestaoUsuario(BaseModel):
+    user_id: int
+    nome_completo: str
+    tipo_usuario: TipoUsuario
+    referencia_id: int  # id do aluno, professor ou responsável
+    documento: Optional[str] = None  # matrícula ou CPF, para quem pode buscar por eles
+    turma_id: Optional[int] = None
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import date
+
+
+class RegistroChamada(BaseModel):
+    aluno_id: int
+    presente: bool = True
+
+
+class ChamadaCreate(BaseModel):
+    data: date
+    registros: List[RegistroChamada] = Field(..., min_length=1)
+
+
+class ChamadaAlunoResponse(BaseModel):
+    aluno_id: int
+    presente: bool
+
+
+class FrequenciaAlunoResumo(BaseModel):
+    aluno_id: int
+    total_aulas: int
+    total_presencas: int
+    taxa_frequencia: float
+
+
+class FrequenciaTurmaResumo(BaseModel):
+    turma_id: int
+    total_aulas: int
+    total_presencas: int
+    taxa_frequencia: float
+    alunos: List[FrequenciaAlunoResumo] = []
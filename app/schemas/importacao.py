@@ -0,0 +1,46 @@
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import List, Optional
+from datetime import date
+
+
+class LinhaMatricula(BaseModel):
+    """Uma linha do CSV de matrícula (aluno + responsável opcional)"""
+    aluno_nome: str = Field(..., min_length=1)
+    aluno_email: EmailStr
+    aluno_senha: str = Field(..., min_length=6)
+    matricula: str = Field(..., min_length=1)
+    turma_codigo: Optional[str] = None
+    data_nascimento: Optional[date] = None
+    necessidades_especiais: bool = False
+    descricao_necessidades: Optional[str] = None
+    responsavel_nome: Optional[str] = None
+    responsavel_email: Optional[EmailStr] = None
+    responsavel_senha: Optional[str] = Field(None, min_length=6)
+    responsavel_telefone: Optional[str] = None
+    responsavel_cpf: Optional[str] = None
+    parentesco: Optional[str] = None
+
+    @field_validator("necessidades_especiais", mode="before")
+    @classmethod
+    def parse_sim_nao(cls, v):
+        if isinstance(v, str):
+            valor = v.strip().lower()
+            if valor in ("sim", "s"):
+                return True
+            if valor in ("não", "nao", "n"):
+                return False
+        return False if v is None else v
+
+
+class ErroLinha(BaseModel):
+    linha: int
+    erros: List[str]
+
+
+class RelatorioImportacao(BaseModel):
+    dry_run: bool
+    total_linhas: int
+    linhas_validas: int
+    alunos_importados: int = 0
+    responsaveis_criados: int = 0
+    erros: List[ErroLinha] = []
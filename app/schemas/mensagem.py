@@ -44,3 +44,7 @@ class MensagemResponse(MensagemBase):
 
     class Config:
         from_attributes = True
+
+
+class MensagemArquivadaResponse(MensagemResponse):
+    arquivada_em: Optional[datetime] = None
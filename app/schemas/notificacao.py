@@ -21,7 +21,12 @@ class NotificacaoResponse(NotificacaoBase):
     lida: bool
     criada_em: datetime
     lida_em: Optional[datetime] = None
+    quantidade: int = 1  # > 1: resumo de várias notificações
     
     class Config:
         from_attributes = True
 
+
+class NotificacaoArquivadaResponse(NotificacaoResponse):
+    chave_agrupamento: Optional[str] = None
+    arquivada_em: Optional[datetime] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.models.user import TipoUsuario
 
@@ -33,9 +33,17 @@ class UserResponse(UserBase):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # segundos até expirar o access token
 
 
 class TokenData(BaseModel):
     user_id: Optional[int] = None
     email: Optional[str] = None
+    tipo_usuario: Optional[TipoUsuario] = None
+    escolas: List[int] = []
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
 
@@ -1,5 +1,16 @@
 # Services
 from app.services.metrics import MetricsService
 from app.services.reports import ReportsService
+from app.services.frequencia import FrequenciaService
+from app.services.avaliacoes import AvaliacaoService
+from app.services.medias import MediaService
+from app.services.importacao import ImportacaoService
+from app.services.particoes import ParticionamentoService
+from app.services.arquivamento import ArquivamentoService
+from app.services.busca import BuscaService
+from app.services.sugestoes import SugestoesService
+from app.services.entregas import EntregasService
+from app.services.notificacoes import NotificacoesService
+from app.services.eventos_dominio import EventosDominioService
 
-__all__ = ["MetricsService", "ReportsService"]
+__all__ = ["MetricsService", "ReportsService", "FrequenciaService", "AvaliacaoService", "MediaService", "ImportacaoService", "ParticionamentoService", "ArquivamentoService", "BuscaService", "SugestoesService", "EntregasService", "NotificacoesService", "EventosDominioService"]
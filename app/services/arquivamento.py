@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, insert, delete
+from sqlalchemy.engine import Connection
+from app.config import settings
+from app.database import engine
+from app.models import Mensagem, MensagemArquivada, Notificacao, NotificacaoArquivada
+from app.utils.prometheus import registro_metricas
+from app.utils.tarefas import TarefaPeriodica, lock_exclusivo
+
+# Chave do advisory lock do arquivamento (a das partições é 720_301)
+LOCK_ARQUIVAMENTO = 720_302
+
+itens_arquivados = registro_metricas.contador(
+    "incluapp_itens_arquivados_total", "Mensagens e notificações movidas para o arquivo", ("tabela",)
+)
+
+
+class ArquivamentoService:
+    """Move mensagens e notificações lidas antigas para as tabelas de arquivo.
+
+    As tabelas quentes (caixa de entrada e contadores) ficam só com o que é
+    recente ou ainda não foi lido; o arquivo é consultado por endpoints próprios.
+    """
+
+    @staticmethod
+    def mover(conn: Connection, origem, destino, filtros, lote: int) -> int:
+        """Copia para ``destino`` e remove de ``origem`` as linhas que atendem a
+        ``filtros``, em lotes de ``lote`` linhas (uma transação por lote).
+
+        Percorre a tabela pela chave primária, então cada execução lê a tabela
+        no máximo uma vez, mesmo com itens antigos que não podem ser arquivados.
+        """
+        colunas = [c.name for c in destino.__table__.columns if c.name != "arquivada_em"]
+        total = 0
+        ultimo_id = 0
+        while True:
+            ids = conn.execute(
+                select(origem.id)
+                .where(origem.id > ultimo_id, *filtros)
+                .order_by(origem.id)
+                .limit(lote)
+            ).scalars().all()
+            if not ids:
+                return total
+
+            conn.execute(
+                insert(destino).from_select(
+                    colunas,
+                    select(*[getattr(origem, c) for c in colunas]).where(origem.id.in_(ids)),
+                )
+            )
+            conn.execute(delete(origem).where(origem.id.in_(ids)))
+            conn.commit()
+
+            total += len(ids)
+            ultimo_id = ids[-1]
+            itens_arquivados.inc(len(ids), tabela=origem.__tablename__)
+
+    @staticmethod
+    def arquivar(conn: Connection, antes_de: datetime, lote: int):
+        """Arquiva as mensagens e notificações lidas criadas antes de ``antes_de``"""
+        return {
+            "mensagens": ArquivamentoService.mover(
+                conn, Mensagem, MensagemArquivada,
+                [Mensagem.confirmacao_leitura == True, Mensagem.enviada_em < antes_de],
+                lote,
+            ),
+            "notificacoes": ArquivamentoService.mover(
+                conn, Notificacao, NotificacaoArquivada,
+                [Notificacao.lida == True, Notificacao.criada_em < antes_de],
+                lote,
+            ),
+        }
+
+    @staticmethod
+    def executar():
+        """Arquiva o que passou de ARQUIVAMENTO_DIAS, em uma instância por vez"""
+        if not settings.ARQUIVAMENTO_DIAS:
+            return None
+
+        antes_de = datetime.now(timezone.utc) - timedelta(days=settings.ARQUIVAMENTO_DIAS)
+        with engine.connect() as conn, lock_exclusivo(conn, LOCK_ARQUIVAMENTO) as obtido:
+            if not obtido:
+                return None
+            resultado = ArquivamentoService.arquivar(conn, antes_de, settings.ARQUIVAMENTO_LOTE)
+
+        if resultado["mensagens"] or resultado["notificacoes"]:
+            print(
+                f"Arquivamento: {resultado['mensagens']} mensagens e "
+                f"{resultado['notificacoes']} notificações anteriores a {antes_de:%Y-%m-%d}"
+            )
+        return resultado
+
+
+arquivamento_mensagens = TarefaPeriodica(
+    "arquivamento-mensagens",
+    settings.MANUTENCAO_INTERVALO_HORAS * 3600,
+    ArquivamentoService.executar,
+)
@@ -0,0 +1,141 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.dialects.postgresql import insert
+from app.models import Avaliacao, Aluno, User
+from app.services.medias import MediaService
+from app.services.eventos_dominio import EventosDominioService
+
+
+class AvaliacaoService:
+    """Serviço para lançamento de notas em lote e montagem do boletim"""
+
+    @staticmethod
+    def lancar_notas_lote(db: Session, dados, professor_id: int = None, chave_requisicao: str = None):
+        """Aplica uma avaliação a vários alunos em um único upsert.
+
+        A chave natural é (aluno, disciplina, título, data): relançar a mesma
+        avaliação atualiza as notas existentes em vez de duplicá-las.
+        Alunos com nota nova ou alterada são notificados (EventosDominioService).
+        ``professor_id`` é o autor gravado (quem chama decide; ver o router).
+        Retorna os ids das avaliações afetadas.
+        """
+        aluno_ids = [n.aluno_id for n in dados.notas]
+
+        # Notas anteriores (se for um relançamento) saem das médias antes das novas entrarem
+        deltas = MediaService.novos_deltas()
+        anteriores = db.query(
+            Avaliacao.aluno_id, Avaliacao.nota, Avaliacao.peso
+        ).filter(
+            Avaliacao.aluno_id.in_(aluno_ids),
+            Avaliacao.disciplina_id == dados.disciplina_id,
+            Avaliacao.titulo == dados.titulo,
+            Avaliacao.data_avaliacao == dados.data_avaliacao
+        ).all()
+        for r in anteriores:
+            MediaService.acumular(
+                deltas, r.aluno_id, dados.disciplina_id, dados.data_avaliacao, r.nota, r.peso, -1
+            )
+        for n in dados.notas:
+            MediaService.acumular(
+                deltas, n.aluno_id, dados.disciplina_id, dados.data_avaliacao, n.nota, dados.peso
+            )
+
+        linhas = [
+            {
+                "aluno_id": n.aluno_id,
+                "disciplina_id": dados.disciplina_id,
+                "professor_id": professor_id,
+                "titulo": dados.titulo,
+                "tipo": dados.tipo,
+                "nota": n.nota,
+                "peso": dados.peso,
+                "data_avaliacao": dados.data_avaliacao,
+                "observacoes": n.observacoes,
+            }
+            for n in dados.notas
+        ]
+
+        stmt = insert(Avaliacao).values(linhas)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_avaliacao_aluno_disciplina_titulo_data",
+            set_={
+                "professor_id": stmt.excluded.professor_id,
+                "tipo": stmt.excluded.tipo,
+                "nota": stmt.excluded.nota,
+                "peso": stmt.excluded.peso,
+                "observacoes": stmt.excluded.observacoes,
+            },
+        ).returning(Avaliacao.id)
+
+        ids = [r.id for r in db.execute(stmt)]
+        MediaService.aplicar_deltas(db, deltas)
+        nota_anterior = {r.aluno_id: r.nota for r in anteriores}
+        alterados = [
+            n.aluno_id for n in dados.notas
+            if n.nota is not None and nota_anterior.get(n.aluno_id) != n.nota
+        ]
+        if alterados:
+            EventosDominioService.notas(
+                db, dados.disciplina_id, dados.titulo, dados.data_avaliacao, alterados,
+                turma_id=dados.turma_id, chave_requisicao=chave_requisicao
+            )
+        db.commit()
+        return ids
+
+    @staticmethod
+    def get_boletim_turma(db: Session, turma_id: int, disciplina_id: int):
+        """Matriz alunos x avaliações da turma em uma disciplina (uma única query)"""
+        linhas = db.query(
+            Aluno.id.label("aluno_id"),
+            Aluno.matricula,
+            User.nome_completo,
+            Avaliacao.titulo,
+            Avaliacao.tipo,
+            Avaliacao.peso,
+            Avaliacao.data_avaliacao,
+            Avaliacao.nota
+        ).join(
+            User, Aluno.user_id == User.id
+        ).outerjoin(
+            Avaliacao, and_(
+                Avaliacao.aluno_id == Aluno.id,
+                Avaliacao.disciplina_id == disciplina_id
+            )
+        ).filter(
+            Aluno.turma_id == turma_id
+        ).order_by(
+            User.nome_completo, Aluno.id
+        ).all()
+
+        # Colunas: cada avaliação distinta (título + data), em ordem cronológica
+        avaliacoes = {}
+        for r in linhas:
+            if r.titulo is not None:
+                avaliacoes.setdefault((r.data_avaliacao, r.titulo), {
+                    "titulo": r.titulo,
+                    "tipo": r.tipo,
+                    "peso": r.peso,
+                    "data_avaliacao": r.data_avaliacao
+                })
+        chaves = sorted(avaliacoes)
+        indice = {chave: i for i, chave in enumerate(chaves)}
+
+        alunos = {}
+        for r in linhas:
+            aluno = alunos.get(r.aluno_id)
+            if aluno is None:
+                aluno = alunos[r.aluno_id] = {
+                    "aluno_id": r.aluno_id,
+                    "nome": r.nome_completo,
+                    "matricula": r.matricula,
+                    "notas": [None] * len(chaves)
+                }
+            if r.titulo is not None:
+                aluno["notas"][indice[(r.data_avaliacao, r.titulo)]] = r.nota
+
+        return {
+            "turma_id": turma_id,
+            "disciplina_id": disciplina_id,
+            "avaliacoes": [avaliacoes[chave] for chave in chaves],
+            "alunos": list(alunos.values())
+        }
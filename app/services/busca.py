@@ -0,0 +1,144 @@
+import html
+from sqlalchemy import func, literal_column, or_, false
+from sqlalchemy.orm import Session
+from app.models import Mensagem, Atividade, EventoEscolar, TipoUsuario
+from app.utils.indice_invertido import IndiceInvertido, destacar
+
+# Configuração de texto usada nas colunas ``busca`` (ver migração) e nas consultas
+CONFIG_TEXTO = "portuguese"
+# Os termos são delimitados por caracteres de controle e só viram <mark> depois
+# que o texto (escrito por usuários) é escapado; ver _html_destacado
+INICIO_DESTAQUE, FIM_DESTAQUE = "\x02", "\x03"
+OPCOES_DESTAQUE = (
+    f'StartSel="{INICIO_DESTAQUE}", StopSel="{FIM_DESTAQUE}", MaxWords=35, MinWords=15, MaxFragments=2'
+)
+MARCADORES = (INICIO_DESTAQUE, FIM_DESTAQUE)
+
+# tipo -> (modelo, título, corpo, data usada na resposta)
+DOCUMENTOS = {
+    "mensagens": (Mensagem, Mensagem.assunto, Mensagem.conteudo, Mensagem.enviada_em),
+    "atividades": (Atividade, Atividade.titulo, Atividade.descricao, Atividade.data_entrega),
+    "eventos": (EventoEscolar, EventoEscolar.titulo, EventoEscolar.descricao, EventoEscolar.data_evento),
+}
+
+# Pesos do título e do corpo no índice em memória (tsvector usa 'A' e 'B')
+PESO_TITULO, PESO_CORPO = 1.0, 0.4
+
+
+def _html_destacado(fragmento: str) -> str:
+    """Escapa o fragmento como HTML e troca os delimitadores por <mark></mark>"""
+    return html.escape(fragmento or "").replace(INICIO_DESTAQUE, "<mark>").replace(FIM_DESTAQUE, "</mark>")
+
+
+def _sem_delimitadores(coluna):
+    # Delimitadores digitados no texto original não podem abrir um <mark>
+    return func.translate(coluna, INICIO_DESTAQUE + FIM_DESTAQUE, "")
+
+
+class BuscaService:
+    """Busca textual em mensagens, atividades e eventos visíveis ao usuário"""
+
+    @staticmethod
+    def filtros_visibilidade(tipo: str, ator):
+        """Condições que restringem ``tipo`` ao que ``ator`` pode ver.
+
+        Mensagens: enviadas ou recebidas. Atividades e eventos de turma: aluno
+        vê a própria turma e responsável as turmas dos filhos; eventos sem
+        turma são da escola toda. Professores e gestores veem tudo, como nas
+        listagens.
+        """
+        perfil = ator.user.tipo_usuario
+        if tipo == "mensagens":
+            return [or_(Mensagem.remetente_id == ator.user.id, Mensagem.destinatario_id == ator.user.id)]
+
+        if perfil == TipoUsuario.ALUNO:
+            turmas = {ator.aluno_turma_id} - {None}
+        elif perfil == TipoUsuario.RESPONSAVEL:
+            turmas = ator.filhos_turma_ids
+        else:
+            return []
+
+        if tipo == "atividades":
+            return [Atividade.turma_id.in_(turmas)] if turmas else [false()]
+        return [or_(EventoEscolar.turma_id.is_(None), EventoEscolar.turma_id.in_(turmas))]
+
+    @staticmethod
+    def _buscar_postgres(db: Session, tipo: str, consulta: str, filtros, limite: int):
+        modelo, titulo, corpo, data = DOCUMENTOS[tipo]
+        tsquery = func.websearch_to_tsquery(CONFIG_TEXTO, consulta)
+        vetor = literal_column(f"{modelo.__tablename__}.busca")
+        rank = func.ts_rank_cd(vetor, tsquery)
+
+        # Ranqueia e limita antes do ts_headline, que é caro
+        melhores = db.query(
+            modelo.id.label("id"),
+            titulo.label("titulo"),
+            corpo.label("corpo"),
+            data.label("data"),
+            rank.label("rank"),
+        ).filter(vetor.op("@@")(tsquery), *filtros).order_by(rank.desc()).limit(limite).subquery()
+
+        linhas = db.query(
+            melhores.c.id,
+            melhores.c.data,
+            melhores.c.rank,
+            func.ts_headline(CONFIG_TEXTO, _sem_delimitadores(melhores.c.titulo), tsquery, OPCOES_DESTAQUE),
+            func.ts_headline(CONFIG_TEXTO, _sem_delimitadores(melhores.c.corpo), tsquery, OPCOES_DESTAQUE),
+        ).order_by(melhores.c.rank.desc()).all()
+
+        return [
+            {
+                "tipo": tipo,
+                "id": id_,
+                "titulo": _html_destacado(titulo_),
+                "trecho": _html_destacado(trecho),
+                "rank": float(rank_),
+                "data": data_,
+            }
+            for id_, data_, rank_, titulo_, trecho in linhas
+        ]
+
+    @staticmethod
+    def _buscar_em_memoria(db: Session, tipo: str, consulta: str, filtros, limite: int):
+        """Indexa em memória os documentos visíveis e busca neles (bancos sem tsvector)"""
+        modelo, titulo, corpo, data = DOCUMENTOS[tipo]
+        documentos = {
+            id_: (titulo_, corpo_, data_)
+            for id_, titulo_, corpo_, data_ in db.query(modelo.id, titulo, corpo, data).filter(*filtros)
+        }
+
+        indice = IndiceInvertido()
+        for id_, (titulo_, corpo_, _) in documentos.items():
+            indice.adicionar(id_, [(titulo_, PESO_TITULO), (corpo_, PESO_CORPO)])
+
+        resultados = []
+        for id_, pontuacao in indice.buscar(consulta, limite):
+            titulo_, corpo_, data_ = documentos[id_]
+            resultados.append({
+                "tipo": tipo,
+                "id": id_,
+                "titulo": _html_destacado(destacar(titulo_, consulta, MARCADORES)),
+                "trecho": _html_destacado(destacar(corpo_, consulta, MARCADORES)),
+                "rank": round(pontuacao, 4),
+                "data": data_,
+            })
+        return resultados
+
+    @staticmethod
+    def buscar(db: Session, ator, consulta: str, tipos=None, limite: int = 20):
+        """Resultados de todos os ``tipos`` pedidos, ordenados por relevância.
+
+        Os ranks vêm de ts_rank_cd no PostgreSQL e de tf-idf no índice em
+        memória; só são comparáveis entre resultados da mesma busca.
+        """
+        buscar_tipo = (
+            BuscaService._buscar_postgres if db.bind.dialect.name == "postgresql"
+            else BuscaService._buscar_em_memoria
+        )
+        resultados = []
+        for tipo in tipos or DOCUMENTOS:
+            filtros = BuscaService.filtros_visibilidade(tipo, ator)
+            resultados.extend(buscar_tipo(db, tipo, consulta, filtros, limite))
+
+        resultados.sort(key=lambda r: r["rank"], reverse=True)
+        return resultados[:limite]
@@ -0,0 +1,227 @@
+from datetime import date, datetime, timezone
+from sqlalchemy import and_, exists, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models import (
+    Aluno, User, Responsavel, Atividade, EntregaAtividade, TipoNotificacao
+)
+from app.services.notificacoes import NotificacoesService
+
+# Status de cada célula da matriz e seu código na codificação compacta.
+# No formato compacto, entregas atrasadas usam o código em minúsculas.
+CODIGOS_STATUS = {
+    "entregue": "E",
+    "incompleta": "I",  # entrega registrada como não concluída
+    "pendente": "P",  # sem entrega, ainda no prazo
+    "nao_entregue": "N",  # sem entrega, prazo vencido
+}
+
+
+def _hoje() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class EntregasService:
+    """Acompanhamento de entregas de atividades por turma e por aluno"""
+
+    @staticmethod
+    def matriz_turma(db: Session, turma_id: int, disciplina_id: int = None, compacto: bool = False):
+        """Matriz alunos x atividades da turma com status, nota e atraso de cada entrega.
+
+        Uma única consulta: alunos da turma junto das atividades da turma e,
+        por LEFT JOIN, da entrega correspondente; célula sem entrega é
+        pendente (no prazo) ou não entregue (prazo vencido).
+        """
+        condicao_atividade = [Atividade.turma_id == Aluno.turma_id]
+        if disciplina_id:
+            condicao_atividade.append(Atividade.disciplina_id == disciplina_id)
+
+        linhas = db.query(
+            Aluno.id, User.nome_completo,
+            Atividade.id, Atividade.titulo, Atividade.data_entrega,
+            EntregaAtividade.nota, EntregaAtividade.concluida, EntregaAtividade.data_entrega,
+        ).select_from(Aluno).join(
+            User, User.id == Aluno.user_id
+        ).outerjoin(
+            Atividade, and_(*condicao_atividade)
+        ).outerjoin(
+            EntregaAtividade,
+            and_(EntregaAtividade.atividade_id == Atividade.id, EntregaAtividade.aluno_id == Aluno.id),
+        ).filter(Aluno.turma_id == turma_id).order_by(User.nome_completo, Aluno.id).all()
+
+        hoje = _hoje()
+        alunos, atividades, celulas = {}, {}, {}
+        for aluno_id, nome, atividade_id, titulo, prazo, nota, concluida, entregue_em in linhas:
+            alunos.setdefault(aluno_id, nome)
+            if atividade_id is None:
+                continue
+            atividades.setdefault(atividade_id, (titulo, prazo))
+            if entregue_em is None:
+                vencida = prazo is not None and prazo < hoje
+                celula = ("nao_entregue" if vencida else "pendente", None, vencida)
+            else:
+                atrasada = prazo is not None and entregue_em.date() > prazo
+                celula = ("entregue" if concluida else "incompleta", nota, atrasada)
+            celulas[(aluno_id, atividade_id)] = celula
+
+        ordem = sorted(atividades, key=lambda a: (atividades[a][1] or date.max, a))
+
+        if compacto:
+            def codigo(status, atrasada):
+                letra = CODIGOS_STATUS[status]
+                return letra.lower() if atrasada and status in ("entregue", "incompleta") else letra
+
+            return {
+                "turma_id": turma_id,
+                "legenda": CODIGOS_STATUS,
+                "atividades": [[a, atividades[a][0], atividades[a][1]] for a in ordem],
+                "alunos": [[aluno_id, nome] for aluno_id, nome in alunos.items()],
+                "matriz": [
+                    "".join(codigo(celulas[(aluno_id, a)][0], celulas[(aluno_id, a)][2]) for a in ordem)
+                    for aluno_id in alunos
+                ],
+                "notas": [[celulas[(aluno_id, a)][1] for a in ordem] for aluno_id in alunos],
+            }
+
+        resumo_atividades = {a: {"entregues": 0, "faltantes": 0} for a in ordem}
+        resultado_alunos = []
+        for aluno_id, nome in alunos.items():
+            entregas = []
+            totais = {"entregues": 0, "pendentes": 0, "atrasadas": 0}
+            for a in ordem:
+                status, nota, atrasada = celulas[(aluno_id, a)]
+                entregas.append({"atividade_id": a, "status": status, "nota": nota, "atrasada": atrasada})
+                if status == "entregue":
+                    totais["entregues"] += 1
+                    resumo_atividades[a]["entregues"] += 1
+                else:
+                    totais["pendentes"] += 1
+                    resumo_atividades[a]["faltantes"] += 1
+                totais["atrasadas"] += atrasada
+            resultado_alunos.append({"aluno_id": aluno_id, "nome": nome, **totais, "entregas": entregas})
+
+        return {
+            "turma_id": turma_id,
+            "atividades": [
+                {"id": a, "titulo": atividades[a][0], "data_entrega": atividades[a][1], **resumo_atividades[a]}
+                for a in ordem
+            ],
+            "alunos": resultado_alunos,
+        }
+
+    @staticmethod
+    def pendentes_aluno(db: Session, aluno_id: int):
+        """Atividades da turma do aluno sem entrega concluída, das mais antigas às mais novas"""
+        concluida = exists().where(
+            EntregaAtividade.atividade_id == Atividade.id,
+            EntregaAtividade.aluno_id == aluno_id,
+            EntregaAtividade.concluida == True,
+        )
+        atividades = db.query(Atividade).join(
+            Aluno, Aluno.turma_id == Atividade.turma_id
+        ).filter(Aluno.id == aluno_id, ~concluida).order_by(Atividade.data_entrega, Atividade.id).all()
+
+        hoje = _hoje()
+        return [
+            {
+                "id": a.id,
+                "turma_id": a.turma_id,
+                "disciplina_id": a.disciplina_id,
+                "titulo": a.titulo,
+                "tipo": a.tipo,
+                "data_entrega": a.data_entrega,
+                "pontuacao_maxima": a.pontuacao_maxima,
+                "atrasada": a.data_entrega is not None and a.data_entrega < hoje,
+            }
+            for a in atividades
+        ]
+
+    @staticmethod
+    def avaliar_lote(db: Session, atividade: Atividade, notas, notificar: bool = True):
+        """Grava nota e observações de várias entregas da atividade em um único upsert.
+
+        Aluno sem entrega registrada ganha uma (ex.: trabalho entregue em
+        papel). Observações omitidas preservam as existentes. Alunos cuja nota
+        ou observação mudou (e seus responsáveis) recebem uma notificação cada,
+        inseridas em lote na mesma transação e agrupadas nos resumos da turma;
+        reenviar o mesmo lote não avisa de novo. Retorna (entregas avaliadas,
+        notificações criadas).
+        """
+        anteriores = {
+            r.aluno_id: (r.nota, r.observacoes)
+            for r in db.query(
+                EntregaAtividade.aluno_id, EntregaAtividade.nota, EntregaAtividade.observacoes
+            ).filter(
+                EntregaAtividade.atividade_id == atividade.id,
+                EntregaAtividade.aluno_id.in_([n.aluno_id for n in notas]),
+            )
+        }
+        alterados = set()
+        for n in notas:
+            if n.aluno_id not in anteriores:
+                alterados.add(n.aluno_id)
+                continue
+            nota, observacoes = anteriores[n.aluno_id]
+            if nota != n.nota or (n.observacoes is not None and n.observacoes != observacoes):
+                alterados.add(n.aluno_id)
+
+        linhas = [
+            {
+                "atividade_id": atividade.id,
+                "aluno_id": n.aluno_id,
+                "nota": n.nota,
+                "observacoes": n.observacoes,
+            }
+            for n in notas
+        ]
+
+        tabela = EntregaAtividade.__table__
+        dialeto = sqlite if db.get_bind().dialect.name == "sqlite" else postgresql
+        stmt = dialeto.insert(EntregaAtividade).values(linhas)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["atividade_id", "aluno_id"],
+            set_={
+                "nota": stmt.excluded.nota,
+                "observacoes": func.coalesce(stmt.excluded.observacoes, tabela.c.observacoes),
+            },
+        ).returning(EntregaAtividade.aluno_id)
+        avaliados = [r.aluno_id for r in db.execute(stmt)]
+
+        criadas = 0
+        avisados = [aluno_id for aluno_id in avaliados if aluno_id in alterados]
+        if notificar and avisados:
+            nota_por_aluno = {n.aluno_id: n.nota for n in notas}
+            destinatarios = db.query(
+                Aluno.id, Aluno.user_id, User.nome_completo, Responsavel.user_id
+            ).join(
+                User, User.id == Aluno.user_id
+            ).outerjoin(
+                Responsavel, Responsavel.id == Aluno.responsavel_id
+            ).filter(Aluno.id.in_(avisados)).all()
+
+            link = f"/atividades/{atividade.id}"
+            notificacoes = []
+            for aluno_id, aluno_user_id, nome, responsavel_user_id in destinatarios:
+                nota = nota_por_aluno[aluno_id]
+                texto_nota = f"nota {nota}" if nota is not None else "um retorno"
+                notificacoes.append({
+                    "usuario_id": aluno_user_id,
+                    "titulo": f"Atividade avaliada: {atividade.titulo}",
+                    "mensagem": f"Você recebeu {texto_nota} na atividade \"{atividade.titulo}\".",
+                    "tipo": TipoNotificacao.INFORMACAO,
+                    "link_referencia": link,
+                    "turma_id": atividade.turma_id,
+                })
+                if responsavel_user_id is not None:
+                    notificacoes.append({
+                        "usuario_id": responsavel_user_id,
+                        "titulo": f"Atividade avaliada: {atividade.titulo}",
+                        "mensagem": f"{nome} recebeu {texto_nota} na atividade \"{atividade.titulo}\".",
+                        "tipo": TipoNotificacao.INFORMACAO,
+                        "link_referencia": link,
+                        "turma_id": atividade.turma_id,
+                    })
+            criadas = NotificacoesService.entregar(db, notificacoes) if notificacoes else 0
+
+        db.commit()
+        return len(avaliados), criadas
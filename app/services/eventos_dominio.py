@@ -0,0 +1,295 @@
+"""
+Eventos de domínio e notificações automáticas
+
+Criar ou alterar atividades, eventos escolares e notas grava um evento na
+tabela ``eventos_dominio`` na mesma transação da escrita (outbox): o evento
+existe se e somente se a escrita foi confirmada. A distribuição roda depois,
+em uma tarefa de fundo, e insere em lote uma notificação para cada aluno e
+responsável do público do evento.
+
+As notificações passam pelo agrupamento em resumos (NotificacoesService).
+
+Idempotência: a chave do evento identifica a escrita que o gerou (a chave
+``Idempotency-Key`` enviada pelo cliente ou, sem ela, um uuid por escrita),
+então uma requisição repetida com a mesma chave não notifica de novo, mas
+uma nova alteração sempre notifica, mesmo que volte a um valor anterior.
+A distribuição avança por id de usuário e grava o progresso na mesma
+transação de cada lote; uma falha no meio retoma do último lote confirmado,
+sem duplicar.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, delete, union, event, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import engine, SessionLocal
+from app.models import (
+    EventoDominio, TipoNotificacao, Aluno, Responsavel, User, Disciplina
+)
+from app.services.notificacoes import NotificacoesService
+from app.utils.prometheus import registro_metricas
+from app.utils.tarefas import TarefaPeriodica, lock_exclusivo
+
+# Chave do advisory lock da distribuição (as de manutenção são 720_301 e 720_302)
+LOCK_EVENTOS = 720_303
+
+# Eventos lidos da fila por consulta
+EVENTOS_POR_VARREDURA = 100
+
+# Alterações que geram notificação (as demais, como a descrição, não avisam ninguém)
+CAMPOS_ATIVIDADE = {"titulo", "data_entrega", "turma_id"}
+CAMPOS_EVENTO = {"titulo", "data_evento", "hora_inicio", "local", "turma_id"}
+
+notificacoes_eventos = registro_metricas.contador(
+    "incluapp_notificacoes_eventos_total", "Notificações criadas a partir de eventos de domínio", ("tipo",)
+)
+
+
+def _data(valor) -> str:
+    return valor.strftime("%d/%m/%Y")
+
+
+class EventosDominioService:
+    """Publicação de eventos de domínio e sua distribuição em notificações"""
+
+    @staticmethod
+    def publicar(db: Session, tipo: str, referencia: str, dados: dict, chave_requisicao: str = None):
+        """Enfileira um evento na transação de ``db`` (não faz commit).
+
+        ``dados`` traz os textos da notificação (``titulo``, ``mensagem``,
+        ``link``, ``tipo_notificacao``) e o público: ``aluno_ids``, ``turma_id``
+        ou ``escola_id``; sem nenhum deles, a rede toda. ``chave_requisicao``
+        (o Idempotency-Key do cliente) identifica a escrita; sem ela, cada
+        chamada é uma escrita nova. Eventos com a mesma chave são ignorados.
+        """
+        chave = f"{tipo}:{referencia}:{chave_requisicao or uuid.uuid4().hex}"
+
+        dialeto = sqlite if db.get_bind().dialect.name == "sqlite" else postgresql
+        db.execute(
+            dialeto.insert(EventoDominio)
+            .values(tipo=tipo, chave=chave, dados=dados)
+            .on_conflict_do_nothing(index_elements=["chave"])
+        )
+        db.info["eventos_publicados"] = True
+        return chave
+
+    @staticmethod
+    def atividade(db: Session, atividade, criada: bool = True, alterados=(), chave_requisicao: str = None):
+        """Avisa a turma de uma atividade nova ou alterada (``alterados``: campos que mudaram)"""
+        if not criada and not CAMPOS_ATIVIDADE & set(alterados):
+            return None
+        if criada:
+            titulo = f"Nova atividade: {atividade.titulo}"
+            mensagem = f"A atividade \"{atividade.titulo}\" foi publicada, com entrega até {_data(atividade.data_entrega)}."
+        else:
+            titulo = f"Atividade alterada: {atividade.titulo}"
+            mensagem = f"A atividade \"{atividade.titulo}\" foi alterada; a entrega é até {_data(atividade.data_entrega)}."
+
+        return EventosDominioService.publicar(
+            db,
+            "atividade_criada" if criada else "atividade_atualizada",
+            str(atividade.id),
+            {
+                "titulo": titulo,
+                "mensagem": mensagem,
+                "link": f"/atividades/{atividade.id}",
+                "tipo_notificacao": TipoNotificacao.LEMBRETE.value,
+                "turma_id": atividade.turma_id,
+            },
+            chave_requisicao,
+        )
+
+    @staticmethod
+    def evento_escolar(db: Session, evento, criado: bool = True, alterados=(), chave_requisicao: str = None):
+        """Avisa a turma, a escola ou a rede de um evento novo ou alterado (``alterados``: campos que mudaram)"""
+        if not criado and not CAMPOS_EVENTO & set(alterados):
+            return None
+        quando = _data(evento.data_evento)
+        if evento.hora_inicio:
+            quando += f" às {evento.hora_inicio:%H:%M}"
+        local = f", em {evento.local}" if evento.local else ""
+
+        if criado:
+            titulo = f"Novo evento: {evento.titulo}"
+            mensagem = f"{evento.titulo}: {quando}{local}."
+        else:
+            titulo = f"Evento alterado: {evento.titulo}"
+            mensagem = f"O evento \"{evento.titulo}\" foi alterado: {quando}{local}."
+
+        dados = {
+            "titulo": titulo,
+            "mensagem": mensagem,
+            "link": f"/eventos/{evento.id}",
+            "tipo_notificacao": TipoNotificacao.AVISO.value,
+        }
+        if evento.turma_id is not None:
+            dados["turma_id"] = evento.turma_id
+        elif evento.escola_id is not None:
+            dados["escola_id"] = evento.escola_id
+
+        return EventosDominioService.publicar(
+            db, "evento_criado" if criado else "evento_atualizado", str(evento.id), dados, chave_requisicao
+        )
+
+    @staticmethod
+    def notas(db: Session, disciplina_id: int, titulo: str, data_avaliacao, aluno_ids,
+              turma_id: int = None, chave_requisicao: str = None):
+        """Avisa alunos (e responsáveis) de notas lançadas ou corrigidas.
+
+        Quem chama passa só os alunos cuja nota mudou. ``turma_id`` só agrupa
+        as notificações em resumos da turma.
+        """
+        disciplina = db.query(Disciplina.nome).filter(Disciplina.id == disciplina_id).scalar()
+        return EventosDominioService.publicar(
+            db,
+            "notas_lancadas",
+            f"{disciplina_id}:{data_avaliacao}",
+            {
+                "titulo": f"Nota lançada: {titulo}",
+                "mensagem": f"A nota de \"{titulo}\" ({disciplina}, {_data(data_avaliacao)}) foi lançada.",
+                "link": "/avaliacoes",
+                "tipo_notificacao": TipoNotificacao.INFORMACAO.value,
+                "aluno_ids": sorted(aluno_ids),
+                "turma_id": turma_id,
+            },
+            chave_requisicao,
+        )
+
+    @staticmethod
+    def publico(dados: dict):
+        """Usuários ativos (alunos e seus responsáveis) que recebem o evento"""
+        if "aluno_ids" in dados:
+            filtro = Aluno.id.in_(dados["aluno_ids"])
+        elif dados.get("turma_id") is not None:
+            filtro = Aluno.turma_id == dados["turma_id"]
+        elif dados.get("escola_id") is not None:
+            filtro = Aluno.escola_id == dados["escola_id"]
+        else:
+            filtro = true()
+
+        usuarios = union(
+            select(Aluno.user_id.label("usuario_id")).where(filtro),
+            select(Responsavel.user_id.label("usuario_id")).join(
+                Aluno, Aluno.responsavel_id == Responsavel.id
+            ).where(filtro),
+        ).subquery()
+
+        return select(usuarios.c.usuario_id).join(
+            User, User.id == usuarios.c.usuario_id
+        ).where(User.ativo == True)
+
+    @staticmethod
+    def distribuir(conn: Connection, evento, lote: int) -> int:
+        """Cria as notificações de ``evento`` em lotes de ``lote`` destinatários,
+        uma transação por lote. Retorna quantas foram criadas."""
+        dados = evento.dados
+        publico = EventosDominioService.publico(dados)
+        tipo_notificacao = TipoNotificacao(dados["tipo_notificacao"])
+        ultimo = evento.ultimo_usuario_id
+        total = 0
+
+        while True:
+            usuarios = conn.execute(
+                publico.where(publico.selected_columns.usuario_id > ultimo)
+                .order_by(publico.selected_columns.usuario_id)
+                .limit(lote)
+            ).scalars().all()
+
+            if usuarios:
+                NotificacoesService.entregar(conn, [
+                    {
+                        "usuario_id": usuario_id,
+                        "titulo": dados["titulo"],
+                        "mensagem": dados["mensagem"],
+                        "tipo": tipo_notificacao,
+                        "link_referencia": dados.get("link"),
+                        "turma_id": dados.get("turma_id"),
+                    }
+                    for usuario_id in usuarios
+                ])
+                ultimo = usuarios[-1]
+                total += len(usuarios)
+
+            concluido = len(usuarios) < lote
+            valores = {
+                "ultimo_usuario_id": ultimo,
+                "destinatarios": EventoDominio.destinatarios + len(usuarios),
+            }
+            if concluido:
+                valores["processado_em"] = datetime.now(timezone.utc)
+            conn.execute(update(EventoDominio).where(EventoDominio.id == evento.id).values(**valores))
+            conn.commit()
+
+            notificacoes_eventos.inc(len(usuarios), tipo=evento.tipo)
+            if concluido:
+                return total
+
+    @staticmethod
+    def processar(conn: Connection, lote: int) -> int:
+        """Distribui os eventos pendentes, em ordem; falhas contam tentativa e seguem para o próximo"""
+        total = 0
+        ultimo_id = 0
+        while True:
+            eventos = conn.execute(
+                select(EventoDominio.id, EventoDominio.tipo, EventoDominio.dados, EventoDominio.ultimo_usuario_id)
+                .where(
+                    EventoDominio.id > ultimo_id,
+                    EventoDominio.processado_em.is_(None),
+                    EventoDominio.tentativas < settings.EVENTOS_MAX_TENTATIVAS,
+                )
+                .order_by(EventoDominio.id)
+                .limit(EVENTOS_POR_VARREDURA)
+            ).all()
+            conn.commit()
+            if not eventos:
+                return total
+
+            for evento in eventos:
+                try:
+                    total += EventosDominioService.distribuir(conn, evento, lote)
+                except Exception as e:
+                    conn.rollback()
+                    conn.execute(
+                        update(EventoDominio).where(EventoDominio.id == evento.id).values(
+                            tentativas=EventoDominio.tentativas + 1, erro=str(e)[:1000]
+                        )
+                    )
+                    conn.commit()
+                    print(f"Erro ao distribuir o evento {evento.id} ({evento.tipo}): {e}")
+            ultimo_id = eventos[-1].id
+
+    @staticmethod
+    def executar():
+        """Distribui os eventos pendentes e apaga os processados antigos, em uma instância por vez"""
+        with engine.connect() as conn, lock_exclusivo(conn, LOCK_EVENTOS) as obtido:
+            if not obtido:
+                return None
+            total = EventosDominioService.processar(conn, settings.EVENTOS_LOTE)
+
+            if settings.EVENTOS_RETENCAO_DIAS:
+                limite = datetime.now(timezone.utc) - timedelta(days=settings.EVENTOS_RETENCAO_DIAS)
+                conn.execute(delete(EventoDominio).where(EventoDominio.processado_em < limite))
+                conn.commit()
+        return total
+
+
+distribuicao_eventos = TarefaPeriodica(
+    "distribuicao-eventos",
+    settings.EVENTOS_INTERVALO_SEGUNDOS,
+    EventosDominioService.executar,
+)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _acordar_distribuicao(session):
+    # Eventos recém-confirmados são distribuídos sem esperar a próxima varredura
+    if session.info.pop("eventos_publicados", False):
+        distribuicao_eventos.despertar()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _descartar_eventos(session):
+    session.info.pop("eventos_publicados", None)
@@ -0,0 +1,151 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date
+from app.models import FrequenciaMensal
+
+
+def _taxa(presencas: int, aulas: int) -> float:
+    return round(presencas / aulas * 100, 2) if aulas else 0.0
+
+
+class FrequenciaService:
+    """Serviço de registro e consulta de frequência (chamada diária)"""
+
+    @staticmethod
+    def registrar_chamada(db: Session, turma_id: int, data: date, registros):
+        """Registra a chamada de um dia para vários alunos em um único upsert.
+
+        ``registros`` é uma lista de pares ``(aluno_id, presente)``. Refazer a
+        chamada do mesmo dia sobrescreve o bit do dia sem duplicar contadores.
+        """
+        if not registros:
+            return 0
+
+        mascara = 1 << (data.day - 1)
+        linhas = [
+            {
+                "aluno_id": aluno_id,
+                "turma_id": turma_id,
+                "ano": data.year,
+                "mes": data.month,
+                "dias_letivos": mascara,
+                "presencas": mascara if presente else 0,
+                "total_aulas": 1,
+                "total_presencas": 1 if presente else 0,
+            }
+            for aluno_id, presente in registros
+        ]
+
+        tabela = FrequenciaMensal.__table__
+        dia_registrado = tabela.c.dias_letivos.op("&")(mascara) != 0
+        estava_presente = tabela.c.presencas.op("&")(mascara) != 0
+
+        stmt = insert(FrequenciaMensal).values(linhas)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_frequencia_aluno_turma_mes",
+            set_={
+                "dias_letivos": tabela.c.dias_letivos.op("|")(mascara),
+                "presencas": tabela.c.presencas.op("&")(~mascara).op("|")(stmt.excluded.presencas),
+                "total_aulas": tabela.c.total_aulas + case((dia_registrado, 0), else_=1),
+                "total_presencas": (
+                    tabela.c.total_presencas
+                    - case((estava_presente, 1), else_=0)
+                    + stmt.excluded.total_presencas
+                ),
+            },
+        )
+        db.execute(stmt)
+        db.commit()
+        return len(linhas)
+
+    @staticmethod
+    def get_chamada(db: Session, turma_id: int, data: date):
+        """Retorna a chamada de um dia da turma a partir dos bitmaps mensais"""
+        mascara = 1 << (data.day - 1)
+        linhas = db.query(
+            FrequenciaMensal.aluno_id,
+            FrequenciaMensal.dias_letivos,
+            FrequenciaMensal.presencas
+        ).filter(
+            FrequenciaMensal.turma_id == turma_id,
+            FrequenciaMensal.ano == data.year,
+            FrequenciaMensal.mes == data.month
+        ).all()
+
+        return [
+            {"aluno_id": r.aluno_id, "presente": bool(r.presencas & mascara)}
+            for r in linhas
+            if r.dias_letivos & mascara
+        ]
+
+    @staticmethod
+    def get_resumo_aluno(db: Session, aluno_id: int, ano: int = None, mes: int = None):
+        """Taxa de frequência de um aluno no período"""
+        query = db.query(
+            func.coalesce(func.sum(FrequenciaMensal.total_aulas), 0).label("total_aulas"),
+            func.coalesce(func.sum(FrequenciaMensal.total_presencas), 0).label("total_presencas")
+        ).filter(FrequenciaMensal.aluno_id == aluno_id)
+
+        if ano:
+            query = query.filter(FrequenciaMensal.ano == ano)
+        if mes:
+            query = query.filter(FrequenciaMensal.mes == mes)
+
+        r = query.one()
+        return {
+            "aluno_id": aluno_id,
+            "total_aulas": r.total_aulas,
+            "total_presencas": r.total_presencas,
+            "taxa_frequencia": _taxa(r.total_presencas, r.total_aulas)
+        }
+
+    @staticmethod
+    def get_resumo_turma(db: Session, turma_id: int, ano: int = None, mes: int = None):
+        """Taxa de frequência da turma e de cada aluno no período"""
+        query = db.query(
+            FrequenciaMensal.aluno_id,
+            func.sum(FrequenciaMensal.total_aulas).label("total_aulas"),
+            func.sum(FrequenciaMensal.total_presencas).label("total_presencas")
+        ).filter(FrequenciaMensal.turma_id == turma_id)
+
+        if ano:
+            query = query.filter(FrequenciaMensal.ano == ano)
+        if mes:
+            query = query.filter(FrequenciaMensal.mes == mes)
+
+        resultados = query.group_by(FrequenciaMensal.aluno_id).all()
+
+        total_aulas = sum(r.total_aulas for r in resultados)
+        total_presencas = sum(r.total_presencas for r in resultados)
+
+        return {
+            "turma_id": turma_id,
+            "total_aulas": total_aulas,
+            "total_presencas": total_presencas,
+            "taxa_frequencia": _taxa(total_presencas, total_aulas),
+            "alunos": [
+                {
+                    "aluno_id": r.aluno_id,
+                    "total_aulas": r.total_aulas,
+                    "total_presencas": r.total_presencas,
+                    "taxa_frequencia": _taxa(r.total_presencas, r.total_aulas)
+                }
+                for r in resultados
+            ]
+        }
+
+    @staticmethod
+    def get_taxas_por_turma(db: Session, turma_ids=None):
+        """Mapa turma_id -> taxa de frequência, usado pelos relatórios"""
+        query = db.query(
+            FrequenciaMensal.turma_id,
+            func.sum(FrequenciaMensal.total_aulas).label("total_aulas"),
+            func.sum(FrequenciaMensal.total_presencas).label("total_presencas")
+        )
+
+        if turma_ids is not None:
+            query = query.filter(FrequenciaMensal.turma_id.in_(turma_ids))
+
+        resultados = query.group_by(FrequenciaMensal.turma_id).all()
+        return {r.turma_id: _taxa(r.total_presencas, r.total_aulas) for r in resultados}
@@ -0,0 +1,256 @@
+import csv
+import io
+from collections import defaultdict
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models import User, TipoUsuario, Responsavel, Aluno, Turma
+from app.schemas.importacao import LinhaMatricula
+from app.utils.password_pool import password_pool
+
+COLUNAS_OBRIGATORIAS = {"aluno_nome", "aluno_email", "aluno_senha", "matricula"}
+
+
+def hash_senhas(senhas):
+    """Gera os hashes bcrypt no pool de senhas compartilhado com os logins"""
+    return password_pool.hash_lote(senhas, settings.IMPORTACAO_WORKERS)
+
+
+class ImportacaoService:
+    """Importação em lote de alunos e responsáveis a partir de CSV"""
+
+    @staticmethod
+    def validar(db: Session, conteudo: str):
+        """Valida o CSV inteiro sem gravar nada.
+
+        Retorna ``(linhas, erros, plano)``: as linhas válidas como
+        ``(numero_linha, LinhaMatricula)``, os erros por linha e o que foi
+        resolvido no banco (turmas e responsáveis já existentes).
+        """
+        leitor = csv.DictReader(io.StringIO(conteudo))
+        faltando = COLUNAS_OBRIGATORIAS - set(leitor.fieldnames or [])
+        if faltando:
+            return [], {1: [f"Colunas obrigatórias ausentes: {sorted(faltando)}"]}, {}
+
+        erros = defaultdict(list)
+        linhas = []
+        for numero, bruta in enumerate(leitor, start=2):
+            dados = {k.strip(): (v or "").strip() or None for k, v in bruta.items() if k}
+            try:
+                linhas.append((numero, LinhaMatricula(**dados)))
+            except ValidationError as e:
+                for erro in e.errors():
+                    campo = ".".join(str(p) for p in erro["loc"])
+                    erros[numero].append(f"{campo}: {erro['msg']}")
+
+        # Duplicidades dentro do próprio arquivo
+        vistos_matricula, vistos_email = {}, {}
+        emails_responsaveis = {l.responsavel_email for _, l in linhas if l.responsavel_email}
+        for numero, l in linhas:
+            if l.matricula in vistos_matricula:
+                erros[numero].append(f"Matrícula repetida (linha {vistos_matricula[l.matricula]})")
+            vistos_matricula.setdefault(l.matricula, numero)
+            if l.aluno_email in vistos_email:
+                erros[numero].append(f"Email do aluno repetido (linha {vistos_email[l.aluno_email]})")
+            vistos_email.setdefault(l.aluno_email, numero)
+            if l.aluno_email in emails_responsaveis:
+                erros[numero].append("Email do aluno também usado como email de responsável")
+
+        # Conflitos com o banco, resolvidos com uma query por tipo de dado
+        matriculas_existentes = {
+            r.matricula for r in db.query(Aluno.matricula).filter(
+                Aluno.matricula.in_(list(vistos_matricula))
+            )
+        }
+        emails_existentes = {
+            r.email for r in db.query(User.email).filter(User.email.in_(list(vistos_email)))
+        }
+        codigos = {l.turma_codigo for _, l in linhas if l.turma_codigo}
+        turmas = {
+            r.codigo: r for r in db.query(Turma.codigo, Turma.id, Turma.escola_id).filter(Turma.codigo.in_(codigos))
+        }
+        responsaveis_existentes = {}
+        usuarios_nao_responsaveis = set()
+        for r in db.query(User.email, User.tipo_usuario, Responsavel.id).outerjoin(
+            Responsavel, Responsavel.user_id == User.id
+        ).filter(User.email.in_(emails_responsaveis)):
+            if r.tipo_usuario == TipoUsuario.RESPONSAVEL and r.id:
+                responsaveis_existentes[r.email] = r.id
+            else:
+                usuarios_nao_responsaveis.add(r.email)
+
+        # Um responsável novo pode aparecer em várias linhas (irmãos); basta uma com os dados
+        novos_responsaveis = {}
+        for _, l in linhas:
+            email = l.responsavel_email
+            if (email and email not in responsaveis_existentes
+                    and email not in usuarios_nao_responsaveis
+                    and l.responsavel_nome and l.responsavel_senha):
+                novos_responsaveis.setdefault(email, l)
+
+        cpfs = defaultdict(set)
+        for email, l in novos_responsaveis.items():
+            if l.responsavel_cpf:
+                cpfs[l.responsavel_cpf].add(email)
+        cpfs_existentes = {
+            r.cpf for r in db.query(Responsavel.cpf).filter(Responsavel.cpf.in_(list(cpfs)))
+        }
+
+        for numero, l in linhas:
+            if l.matricula in matriculas_existentes:
+                erros[numero].append("Matrícula já cadastrada")
+            if l.aluno_email in emails_existentes:
+                erros[numero].append("Email do aluno já cadastrado")
+            if l.turma_codigo and l.turma_codigo not in turmas:
+                erros[numero].append(f"Turma não encontrada: {l.turma_codigo}")
+
+            email = l.responsavel_email
+            if not email or email in responsaveis_existentes:
+                continue
+            if email in usuarios_nao_responsaveis:
+                erros[numero].append("Email do responsável pertence a outro tipo de usuário")
+            elif email not in novos_responsaveis:
+                erros[numero].append("Novo responsável exige responsavel_nome e responsavel_senha")
+            else:
+                cpf = novos_responsaveis[email].responsavel_cpf
+                if cpf in cpfs_existentes:
+                    erros[numero].append("CPF do responsável já cadastrado")
+                elif cpf and len(cpfs[cpf]) > 1:
+                    erros[numero].append("CPF do responsável repetido para emails diferentes")
+
+        validas = [(numero, l) for numero, l in linhas if not erros.get(numero)]
+        plano = {
+            "turmas": turmas,
+            "responsaveis_existentes": responsaveis_existentes,
+            "novos_responsaveis": novos_responsaveis,
+        }
+        return validas, {k: v for k, v in erros.items() if v}, plano
+
+    @staticmethod
+    def importar(db: Session, conteudo: str, dry_run: bool = True,
+                 ignorar_erros: bool = False, tamanho_lote: int = 500):
+        """Valida e, se não for dry-run, grava as linhas em transações por lote.
+
+        Com erros de validação nada é gravado, a menos que ``ignorar_erros``
+        seja verdadeiro (nesse caso apenas as linhas válidas são importadas).
+        """
+        validas, erros, plano = ImportacaoService.validar(db, conteudo)
+        total = len(validas) + len(erros)
+        relatorio = {
+            "dry_run": dry_run,
+            "total_linhas": total,
+            "linhas_validas": len(validas),
+            "alunos_importados": 0,
+            "responsaveis_criados": 0,
+        }
+
+        if dry_run or not validas or (erros and not ignorar_erros):
+            relatorio["erros"] = ImportacaoService._formatar_erros(erros)
+            return relatorio
+
+        # Apenas responsáveis referenciados por linhas válidas são criados
+        emails_usados = {l.responsavel_email for _, l in validas}
+        novos = {e: l for e, l in plano["novos_responsaveis"].items() if e in emails_usados}
+
+        # Todos os hashes de uma vez, fora das transações
+        senhas = [l.aluno_senha for _, l in validas] + [l.responsavel_senha for l in novos.values()]
+        hashes = hash_senhas(senhas)
+        hash_aluno = {l.matricula: h for (_, l), h in zip(validas, hashes)}
+        hash_responsavel = dict(zip(novos, hashes[len(validas):]))
+
+        responsaveis = dict(plano["responsaveis_existentes"])
+        for inicio in range(0, len(validas), tamanho_lote):
+            lote = validas[inicio:inicio + tamanho_lote]
+            try:
+                criados = ImportacaoService._gravar_lote(
+                    db, lote, plano["turmas"], responsaveis, novos, hash_aluno, hash_responsavel
+                )
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                for numero, _ in lote:
+                    erros[numero] = [f"Erro ao gravar lote: {e.__class__.__name__}"]
+                continue
+            responsaveis.update(criados)
+            relatorio["alunos_importados"] += len(lote)
+            relatorio["responsaveis_criados"] += len(criados)
+
+        relatorio["erros"] = ImportacaoService._formatar_erros(erros)
+        return relatorio
+
+    @staticmethod
+    def _gravar_lote(db: Session, lote, turmas, responsaveis, novos, hash_aluno, hash_responsavel):
+        """Insere usuários, responsáveis e alunos de um lote; retorna os responsáveis criados"""
+        pendentes = []
+        for _, l in lote:
+            email = l.responsavel_email
+            if email in novos and email not in responsaveis and email not in pendentes:
+                pendentes.append(email)
+
+        criados = {}
+        if pendentes:
+            usuarios = db.execute(
+                insert(User).returning(User.id, User.email),
+                [
+                    {
+                        "email": email,
+                        "senha_hash": hash_responsavel[email],
+                        "nome_completo": novos[email].responsavel_nome,
+                        "telefone": novos[email].responsavel_telefone,
+                        "tipo_usuario": TipoUsuario.RESPONSAVEL,
+                    }
+                    for email in pendentes
+                ],
+            ).all()
+            user_ids = {r.email: r.id for r in usuarios}
+            linhas_resp = db.execute(
+                insert(Responsavel).returning(Responsavel.id, Responsavel.user_id),
+                [
+                    {
+                        "user_id": user_ids[email],
+                        "cpf": novos[email].responsavel_cpf,
+                        "parentesco": novos[email].parentesco,
+                    }
+                    for email in pendentes
+                ],
+            ).all()
+            por_user = {r.user_id: r.id for r in linhas_resp}
+            criados = {email: por_user[user_ids[email]] for email in pendentes}
+
+        vinculos = {**responsaveis, **criados}
+        usuarios = db.execute(
+            insert(User).returning(User.id, User.email),
+            [
+                {
+                    "email": l.aluno_email,
+                    "senha_hash": hash_aluno[l.matricula],
+                    "nome_completo": l.aluno_nome,
+                    "tipo_usuario": TipoUsuario.ALUNO,
+                }
+                for _, l in lote
+            ],
+        ).all()
+        user_ids = {r.email: r.id for r in usuarios}
+        db.execute(
+            insert(Aluno),
+            [
+                {
+                    "user_id": user_ids[l.aluno_email],
+                    "responsavel_id": vinculos.get(l.responsavel_email),
+                    "turma_id": turmas[l.turma_codigo].id if l.turma_codigo else None,
+                    "escola_id": turmas[l.turma_codigo].escola_id if l.turma_codigo else None,
+                    "matricula": l.matricula,
+                    "data_nascimento": l.data_nascimento,
+                    "necessidades_especiais": l.necessidades_especiais,
+                    "descricao_necessidades": l.descricao_necessidades,
+                }
+                for _, l in lote
+            ],
+        )
+        return criados
+
+    @staticmethod
+    def _formatar_erros(erros):
+        return [{"linha": numero, "erros": msgs} for numero, msgs in sorted(erros.items())]
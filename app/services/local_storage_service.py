@@ -7,6 +7,7 @@ from typing import Optional
 import uuid
 import os
 from pathlib import Path
+from app.utils.prometheus import upload_bytes
 
 
 class LocalStorageService:
@@ -61,6 +62,7 @@ class LocalStorageService:
             content = await file.read()
             with open(file_path, "wb") as f:
                 f.write(content)
+            upload_bytes.inc(len(content), pasta=folder)
 
             # Resetar o ponteiro do arquivo
             await file.seek(0)
@@ -0,0 +1,162 @@
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case
+from sqlalchemy.dialects.postgresql import insert
+from datetime import date
+from app.models import MediaDisciplina, Aluno, User
+
+
+def periodo_letivo(data: date):
+    """Retorna (ano, período) de uma data; o período é o trimestre do ano"""
+    return data.year, (data.month - 1) // 3 + 1
+
+
+class MediaService:
+    """Manutenção incremental e consulta das médias ponderadas por disciplina"""
+
+    @staticmethod
+    def novos_deltas():
+        """Acumulador de deltas: chave -> [soma_ponderada, soma_pesos, total]"""
+        return defaultdict(lambda: [0.0, 0.0, 0])
+
+    @staticmethod
+    def acumular(deltas, aluno_id: int, disciplina_id: int, data_avaliacao: date,
+                 nota: float, peso: float, sinal: int = 1):
+        """Soma (sinal=1) ou retira (sinal=-1) a contribuição de uma nota"""
+        if nota is None:
+            return
+        peso = 1.0 if peso is None else peso
+        ano, periodo = periodo_letivo(data_avaliacao)
+        delta = deltas[(aluno_id, disciplina_id, ano, periodo)]
+        delta[0] += sinal * nota * peso
+        delta[1] += sinal * peso
+        delta[2] += sinal
+
+    @staticmethod
+    def aplicar_deltas(db: Session, deltas):
+        """Aplica os deltas acumulados em um único upsert.
+
+        Não faz commit: o chamador confirma junto com a alteração das notas,
+        mantendo médias e avaliações consistentes na mesma transação.
+        """
+        linhas = [
+            {
+                "aluno_id": aluno_id,
+                "disciplina_id": disciplina_id,
+                "ano": ano,
+                "periodo": periodo,
+                "soma_ponderada": soma,
+                "soma_pesos": pesos,
+                "total_avaliacoes": total,
+                "media": soma / pesos if pesos else None,
+            }
+            for (aluno_id, disciplina_id, ano, periodo), (soma, pesos, total) in deltas.items()
+            if soma or pesos or total
+        ]
+        if not linhas:
+            return
+
+        tabela = MediaDisciplina.__table__
+        stmt = insert(MediaDisciplina).values(linhas)
+        nova_soma = tabela.c.soma_ponderada + stmt.excluded.soma_ponderada
+        novos_pesos = tabela.c.soma_pesos + stmt.excluded.soma_pesos
+        # Tolerância para resíduos de ponto flutuante ao remover todas as notas
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_media_aluno_disciplina_periodo",
+            set_={
+                "soma_ponderada": nova_soma,
+                "soma_pesos": novos_pesos,
+                "total_avaliacoes": tabela.c.total_avaliacoes + stmt.excluded.total_avaliacoes,
+                "media": case((novos_pesos > 1e-9, nova_soma / novos_pesos), else_=None),
+                "atualizado_em": func.now(),
+            },
+        )
+        db.execute(stmt)
+
+    @staticmethod
+    def get_medias_aluno(db: Session, aluno_id: int, ano: int = None, periodo: int = None):
+        """Médias do aluno por disciplina e período"""
+        query = db.query(MediaDisciplina).filter(
+            MediaDisciplina.aluno_id == aluno_id,
+            MediaDisciplina.total_avaliacoes > 0
+        )
+
+        if ano:
+            query = query.filter(MediaDisciplina.ano == ano)
+        if periodo:
+            query = query.filter(MediaDisciplina.periodo == periodo)
+
+        return query.order_by(
+            MediaDisciplina.ano, MediaDisciplina.periodo, MediaDisciplina.disciplina_id
+        ).all()
+
+    @staticmethod
+    def get_ranking_turma(db: Session, turma_id: int, disciplina_id: int, ano: int,
+                          periodo: int, limit: int = 50):
+        """Classificação da turma em uma disciplina, direto da tabela de médias"""
+        posicao = func.rank().over(order_by=MediaDisciplina.media.desc()).label("posicao")
+
+        resultados = db.query(
+            posicao,
+            MediaDisciplina.aluno_id,
+            User.nome_completo,
+            MediaDisciplina.media
+        ).join(
+            Aluno, MediaDisciplina.aluno_id == Aluno.id
+        ).join(
+            User, Aluno.user_id == User.id
+        ).filter(
+            Aluno.turma_id == turma_id,
+            MediaDisciplina.disciplina_id == disciplina_id,
+            MediaDisciplina.ano == ano,
+            MediaDisciplina.periodo == periodo,
+            MediaDisciplina.media.isnot(None)
+        ).order_by(
+            MediaDisciplina.media.desc()
+        ).limit(limit).all()
+
+        return [
+            {
+                "posicao": r.posicao,
+                "aluno_id": r.aluno_id,
+                "nome": r.nome_completo,
+                "media": round(r.media, 2)
+            }
+            for r in resultados
+        ]
+
+    @staticmethod
+    def get_alunos_em_risco(db: Session, turma_id: int, ano: int, periodo: int,
+                            media_minima: float):
+        """Alunos da turma com média abaixo do mínimo em alguma disciplina"""
+        resultados = db.query(
+            MediaDisciplina.aluno_id,
+            User.nome_completo,
+            MediaDisciplina.disciplina_id,
+            MediaDisciplina.media
+        ).join(
+            Aluno, MediaDisciplina.aluno_id == Aluno.id
+        ).join(
+            User, Aluno.user_id == User.id
+        ).filter(
+            Aluno.turma_id == turma_id,
+            MediaDisciplina.ano == ano,
+            MediaDisciplina.periodo == periodo,
+            MediaDisciplina.media < media_minima
+        ).order_by(
+            User.nome_completo, MediaDisciplina.disciplina_id
+        ).all()
+
+        alunos = {}
+        for r in resultados:
+            aluno = alunos.setdefault(r.aluno_id, {
+                "aluno_id": r.aluno_id,
+                "nome": r.nome_completo,
+                "disciplinas": []
+            })
+            aluno["disciplinas"].append({
+                "disciplina_id": r.disciplina_id,
+                "media": round(r.media, 2)
+            })
+
+        return list(alunos.values())
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from app.models import MetricaEngajamento, User, TipoUsuario, Mensagem
 
 
@@ -37,7 +37,7 @@ class MetricsService:
     @staticmethod
     def get_engajamento_responsaveis(db: Session, dias: int = 30):
         """Calcula taxa de engajamento dos responsáveis"""
-        data_inicio = datetime.utcnow() - timedelta(days=dias)
+        data_inicio = datetime.now(timezone.utc) - timedelta(days=dias)
         
         # Total de responsáveis
         total_responsaveis = db.query(User).filter(
@@ -99,7 +99,7 @@ class MetricsService:
     @staticmethod
     def get_uso_por_perfil(db: Session, dias: int = 30):
         """Estatísticas de uso por tipo de usuário"""
-        data_inicio = datetime.utcnow() - timedelta(days=dias)
+        data_inicio = datetime.now(timezone.utc) - timedelta(days=dias)
         
         resultados = db.query(
             User.tipo_usuario,
@@ -125,7 +125,7 @@ class MetricsService:
     @staticmethod
     def get_acoes_mais_comuns(db: Session, dias: int = 30, limit: int = 10):
         """Retorna as ações mais comuns no período"""
-        data_inicio = datetime.utcnow() - timedelta(days=dias)
+        data_inicio = datetime.now(timezone.utc) - timedelta(days=dias)
         
         resultados = db.query(
             MetricaEngajamento.acao,
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, insert, update, bindparam, func
+from app.config import settings
+from app.models import Notificacao, TipoNotificacao, Turma
+from app.utils.prometheus import registro_metricas
+
+# Minutos em que notificações do mesmo tipo e turma são reunidas em um resumo (0 = nunca)
+JANELAS_AGRUPAMENTO = {
+    TipoNotificacao.INFORMACAO: settings.NOTIFICACOES_AGRUPAR_INFORMACAO_MINUTOS,
+    TipoNotificacao.LEMBRETE: settings.NOTIFICACOES_AGRUPAR_LEMBRETE_MINUTOS,
+    TipoNotificacao.AVISO: settings.NOTIFICACOES_AGRUPAR_AVISO_MINUTOS,
+    TipoNotificacao.ALERTA: settings.NOTIFICACOES_AGRUPAR_ALERTA_MINUTOS,
+}
+
+notificacoes_agrupadas = registro_metricas.contador(
+    "incluapp_notificacoes_agrupadas_total",
+    "Notificações reunidas em um resumo em vez de gerar uma linha nova", ("tipo",)
+)
+
+
+def _utc(momento: datetime) -> datetime:
+    # sqlite devolve datas sem fuso (gravadas em UTC)
+    return momento if momento.tzinfo else momento.replace(tzinfo=timezone.utc)
+
+
+class NotificacoesService:
+    """Entrega de notificações em lote, com agrupamento em resumos"""
+
+    @staticmethod
+    def entregar(db, linhas) -> int:
+        """Grava ``linhas`` (dicts com as colunas de Notificacao e, opcionalmente,
+        ``turma_id``) em lote, na transação de ``db`` (Session ou Connection).
+
+        Notificações de um tipo com janela de agrupamento e de uma turma são
+        reunidas, por usuário, em um resumo não lido aberto há menos que a
+        janela: a mensagem de cada item vira uma linha do resumo,
+        ``quantidade`` conta os itens e o resumo volta ao topo da lista. Lido
+        ou com a janela vencida, o próximo item abre um resumo novo. Retorna
+        quantas linhas foram inseridas.
+
+        Os resumos abertos são lidos com FOR UPDATE (em ordem de id): uma
+        entrega concorrente para a mesma chave (ex.: request e distribuição de
+        eventos) espera esta transação e relê o resumo já atualizado.
+        """
+        agora = datetime.now(timezone.utc)
+        avulsas = []
+        grupos = {}  # (usuario_id, chave) -> linhas
+        for linha in linhas:
+            linha = dict(linha)
+            turma_id = linha.pop("turma_id", None)
+            tipo = TipoNotificacao(linha.get("tipo", TipoNotificacao.INFORMACAO))
+            if turma_id is None or not JANELAS_AGRUPAMENTO[tipo]:
+                avulsas.append(linha)
+                continue
+            linha["tipo"] = tipo
+            chave = f"{tipo.value}:{turma_id}"
+            grupos.setdefault((linha["usuario_id"], chave), []).append(linha)
+
+        tabela = Notificacao.__table__
+        novas = list(avulsas)
+        resumos = []
+        if grupos:
+            abertos = {}
+            maior_janela = max(JANELAS_AGRUPAMENTO.values())
+            for r in db.execute(
+                select(
+                    tabela.c.id, tabela.c.usuario_id, tabela.c.chave_agrupamento, tabela.c.tipo,
+                    tabela.c.titulo, tabela.c.mensagem, tabela.c.quantidade, tabela.c.agrupada_desde,
+                ).where(
+                    tabela.c.usuario_id.in_({usuario_id for usuario_id, _ in grupos}),
+                    tabela.c.chave_agrupamento.in_({chave for _, chave in grupos}),
+                    tabela.c.lida == False,
+                    tabela.c.agrupada_desde >= agora - timedelta(minutes=maior_janela),
+                ).order_by(tabela.c.id).with_for_update()
+            ):
+                janela = timedelta(minutes=JANELAS_AGRUPAMENTO[r.tipo])
+                if _utc(r.agrupada_desde) >= agora - janela:
+                    abertos[(r.usuario_id, r.chave_agrupamento)] = r  # o mais recente prevalece
+
+            turmas = dict(db.execute(
+                select(Turma.id, Turma.nome).where(
+                    Turma.id.in_({int(chave.split(":")[1]) for _, chave in grupos})
+                )
+            ).all())
+
+            for (usuario_id, chave), itens in grupos.items():
+                aberto = abertos.get((usuario_id, chave))
+                if aberto is None and len(itens) == 1:
+                    novas.append({**itens[0], "chave_agrupamento": chave, "agrupada_desde": agora})
+                    continue
+
+                if aberto is not None:
+                    quantidade = aberto.quantidade + len(itens)
+                    topicos = aberto.mensagem if aberto.quantidade > 1 else f"• {aberto.mensagem}"
+                else:
+                    quantidade = len(itens)
+                    topicos = None
+                novos = "\n".join(f"• {item['mensagem']}" for item in itens)
+                turma = turmas.get(int(chave.split(":")[1]), "sua turma")
+                resumo = {
+                    "titulo": f"{quantidade} novidades - {turma}",
+                    "mensagem": f"{topicos}\n{novos}" if topicos else novos,
+                    "quantidade": quantidade,
+                }
+                notificacoes_agrupadas.inc(len(itens) - (aberto is None), tipo=itens[0]["tipo"].value)
+
+                if aberto is not None:
+                    resumos.append({f"b_{c}": v for c, v in resumo.items()} | {"b_id": aberto.id})
+                else:
+                    novas.append({
+                        **resumo,
+                        "usuario_id": usuario_id,
+                        "tipo": itens[0]["tipo"],
+                        "link_referencia": None,
+                        "chave_agrupamento": chave,
+                        "agrupada_desde": agora,
+                    })
+
+        if resumos:
+            db.execute(
+                update(tabela).where(tabela.c.id == bindparam("b_id")).values(
+                    titulo=bindparam("b_titulo"),
+                    mensagem=bindparam("b_mensagem"),
+                    quantidade=bindparam("b_quantidade"),
+                    link_referencia=None,
+                    criada_em=func.now(),
+                ),
+                resumos,
+            )
+        if novas:
+            # Mesmas chaves em todas as linhas para um único executemany
+            padrao = {
+                "usuario_id": None, "titulo": None, "mensagem": None,
+                "tipo": TipoNotificacao.INFORMACAO, "link_referencia": None,
+                "chave_agrupamento": None, "agrupada_desde": None, "quantidade": 1,
+            }
+            db.execute(insert(tabela), [{c: linha.get(c, v) for c, v in padrao.items()} for linha in novas])
+        return len(novas)
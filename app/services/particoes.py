@@ -0,0 +1,152 @@
+import gzip
+import os
+from datetime import date, datetime, timezone
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.config import settings
+from app.database import engine
+from app.utils.tarefas import TarefaPeriodica, lock_exclusivo
+
+TABELA_METRICAS = "metricas_engajamento"
+
+# Chave do advisory lock que garante uma manutenção por vez entre instâncias
+LOCK_MANUTENCAO = 720_301
+
+# Meses passados com partição quando não há retenção (METRICAS_RETENCAO_MESES = 0)
+MESES_ATRAS_SEM_RETENCAO = 24
+
+
+def somar_meses(mes: date, meses: int) -> date:
+    """Primeiro dia do mês ``meses`` à frente (ou atrás) de ``mes``"""
+    anos, indice = divmod(mes.month - 1 + meses, 12)
+    return date(mes.year + anos, indice + 1, 1)
+
+
+def nome_particao(tabela: str, mes: date) -> str:
+    return f"{tabela}_p{mes:%Y%m}"
+
+
+class ParticionamentoService:
+    """Partições mensais por intervalo (PostgreSQL) e sua retenção.
+
+    Recebe uma ``Connection`` em vez de uma ``Session``: o DDL e o COPY
+    precisam ficar na mesma conexão que segura o advisory lock.
+    """
+
+    @staticmethod
+    def listar_particoes(conn: Connection, tabela: str = TABELA_METRICAS):
+        """Partições mensais da tabela, com o mês inicial de cada uma.
+
+        Inclui partições já desanexadas e ainda não arquivadas (``anexada``
+        falso), para que um arquivamento interrompido seja retomado.
+        """
+        linhas = conn.execute(text("""
+            SELECT relname, relispartition
+            FROM pg_class
+            WHERE relkind = 'r' AND relname ~ :padrao
+            ORDER BY relname
+        """), {"padrao": f"^{tabela}_p[0-9]{{6}}$"}).all()
+
+        particoes = []
+        for nome, anexada in linhas:
+            sufixo = nome[-6:]
+            particoes.append({
+                "nome": nome,
+                "mes": date(int(sufixo[:4]), int(sufixo[4:]), 1),
+                "anexada": anexada,
+            })
+        return particoes
+
+    @staticmethod
+    def criar_particoes(conn: Connection, inicio: date, fim: date, tabela: str = TABELA_METRICAS):
+        """Cria as partições mensais de ``inicio`` até ``fim`` (inclusive) que ainda não existem"""
+        existentes = {p["mes"] for p in ParticionamentoService.listar_particoes(conn, tabela)}
+        criadas = []
+        mes = inicio.replace(day=1)
+        while mes <= fim:
+            if mes not in existentes:
+                nome = nome_particao(tabela, mes)
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {nome} PARTITION OF {tabela} "
+                    f"FOR VALUES FROM ('{mes.isoformat()} 00:00:00+00') "
+                    f"TO ('{somar_meses(mes, 1).isoformat()} 00:00:00+00')"
+                ))
+                criadas.append(nome)
+            mes = somar_meses(mes, 1)
+        conn.commit()
+        return criadas
+
+    @staticmethod
+    def arquivar_particoes(conn: Connection, antes_de: date, diretorio: str,
+                           tabela: str = TABELA_METRICAS):
+        """Desanexa as partições de meses anteriores a ``antes_de``, exporta cada uma
+        para ``<diretorio>/<particao>.csv.gz`` e só então a remove"""
+        os.makedirs(diretorio, exist_ok=True)
+        arquivadas = []
+        for particao in ParticionamentoService.listar_particoes(conn, tabela):
+            if particao["mes"] >= antes_de:
+                continue
+            nome = particao["nome"]
+            if particao["anexada"]:
+                conn.execute(text(f"ALTER TABLE {tabela} DETACH PARTITION {nome}"))
+                conn.commit()
+
+            destino = os.path.join(diretorio, f"{nome}.csv.gz")
+            temporario = destino + ".tmp"
+            linhas = conn.execute(text(f"SELECT count(*) FROM {nome}")).scalar()
+            cursor = conn.connection.cursor()
+            try:
+                with gzip.open(temporario, "wt", encoding="utf-8") as arquivo:
+                    cursor.copy_expert(f"COPY {nome} TO STDOUT WITH (FORMAT csv, HEADER)", arquivo)
+            finally:
+                cursor.close()
+            os.replace(temporario, destino)
+
+            conn.execute(text(f"DROP TABLE {nome}"))
+            conn.commit()
+            arquivadas.append({"particao": nome, "linhas": linhas, "arquivo": destino})
+        return arquivadas
+
+    @staticmethod
+    def executar_manutencao():
+        """Garante as partições da janela de retenção até os próximos meses e
+        aplica a retenção configurada.
+
+        Os meses passados são criados para aceitar métricas retroativas
+        (importações, ``seed_data.py --escala``); sem partição o INSERT falha.
+
+        Roda em uma instância por vez (advisory lock); as demais apenas retornam.
+        """
+        if engine.dialect.name != "postgresql":
+            return None
+
+        with engine.connect() as conn, lock_exclusivo(conn, LOCK_MANUTENCAO) as obtido:
+            if not obtido:
+                return None
+            mes_atual = datetime.now(timezone.utc).date().replace(day=1)
+            resultado = {
+                "criadas": ParticionamentoService.criar_particoes(
+                    conn,
+                    somar_meses(mes_atual, -(settings.METRICAS_RETENCAO_MESES or MESES_ATRAS_SEM_RETENCAO)),
+                    somar_meses(mes_atual, settings.METRICAS_MESES_ADIANTE),
+                ),
+                "arquivadas": [],
+            }
+            if settings.METRICAS_RETENCAO_MESES:
+                resultado["arquivadas"] = ParticionamentoService.arquivar_particoes(
+                    conn,
+                    somar_meses(mes_atual, -settings.METRICAS_RETENCAO_MESES),
+                    settings.ARQUIVO_DIRECTORY,
+                )
+            for particao in resultado["criadas"]:
+                print(f"Partição criada: {particao}")
+            for item in resultado["arquivadas"]:
+                print(f"Partição arquivada: {item['particao']} ({item['linhas']} linhas) em {item['arquivo']}")
+            return resultado
+
+
+manutencao_particoes = TarefaPeriodica(
+    "manutencao-particoes",
+    settings.MANUTENCAO_INTERVALO_HORAS * 3600,
+    ParticionamentoService.executar_manutencao,
+)
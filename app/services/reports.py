@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from datetime import datetime, timedelta
+from sqlalchemy import func, and_, case
+from datetime import datetime, timedelta, timezone
 from app.models import (
     MetricaEngajamento, User, Mensagem, EventoEscolar,
     Atividade, EntregaAtividade, PEI, IntervencaoPedagogica, Avaliacao, Aluno, Responsavel, Professor, Turma
 )
+from app.services.frequencia import FrequenciaService
 
 
 class ReportsService:
@@ -13,7 +14,7 @@ class ReportsService:
     @staticmethod
     def get_engajamento_geral(db: Session, dias: int = 30, escola_id: int = None):
         """Métricas gerais de uso do sistema"""
-        data_inicio = datetime.utcnow() - timedelta(days=dias)
+        data_inicio = datetime.now(timezone.utc) - timedelta(days=dias)
 
         # Base queries
         usuarios_query = db.query(func.count(func.distinct(MetricaEngajamento.usuario_id))).filter(
@@ -82,19 +83,19 @@ class ReportsService:
         query = db.query(
             Turma.id.label('turma_id'),
             Turma.nome.label('turma_nome'),
-            func.count(Aluno.id).label('total_alunos'),
-            func.sum(func.case((Aluno.pei_ativo == True, 1), else_=0)).label('alunos_com_pei'),
+            func.count(func.distinct(Aluno.id)).label('total_alunos'),
+            func.count(func.distinct(case((Aluno.pei_ativo == True, Aluno.id)))).label('alunos_com_pei'),
             func.avg(func.coalesce(Avaliacao.nota, 0)).label('media_geral'),
-            func.count(func.distinct(func.case((EntregaAtividade.status == 'entregue', EntregaAtividade.id)))).label('atividades_entregues'),
+            func.count(func.distinct(case((EntregaAtividade.concluida == True, EntregaAtividade.id)))).label('atividades_entregues'),
             func.count(func.distinct(Atividade.id)).label('total_atividades')
         ).select_from(Turma).outerjoin(
             Aluno, Turma.id == Aluno.turma_id
         ).outerjoin(
             Avaliacao, Aluno.id == Avaliacao.aluno_id
-        ).outerjoin(
-            EntregaAtividade, and_(EntregaAtividade.aluno_id == Aluno.id, EntregaAtividade.atividade_id == Atividade.id)
         ).outerjoin(
             Atividade, Atividade.turma_id == Turma.id
+        ).outerjoin(
+            EntregaAtividade, and_(EntregaAtividade.aluno_id == Aluno.id, EntregaAtividade.atividade_id == Atividade.id)
         )
 
         # Apply filters
@@ -104,6 +105,7 @@ class ReportsService:
             query = query.filter(Turma.id == turma_id)
 
         resultados = query.group_by(Turma.id, Turma.nome).all()
+        frequencias = FrequenciaService.get_taxas_por_turma(db, [r.turma_id for r in resultados])
 
         return [
             {
@@ -113,7 +115,7 @@ class ReportsService:
                 "alunos_com_pei": r.alunos_com_pei or 0,
                 "media_geral": round(r.media_geral, 2) if r.media_geral and r.media_geral > 0 else None,
                 "taxa_entrega_atividades": round((r.atividades_entregues / r.total_atividades * 100) if r.total_atividades and r.total_atividades > 0 else 0, 2),
-                "frequencia_media": 85.0  # Placeholder - would need attendance data
+                "frequencia_media": frequencias.get(r.turma_id)
             }
             for r in resultados
         ]
@@ -0,0 +1,175 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import case, exists, false, func, null
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models import User, TipoUsuario, Aluno, Professor, Responsavel, Turma, professor_turma
+from app.utils.prometheus import cache_consultas
+
+# Tipos que cada perfil pode procurar
+TIPOS_POR_PERFIL = {
+    TipoUsuario.GESTOR: ("alunos", "professores", "responsaveis"),
+    TipoUsuario.PROFESSOR: ("alunos", "professores", "responsaveis"),
+    TipoUsuario.RESPONSAVEL: ("professores",),
+    TipoUsuario.ALUNO: ("professores",),
+}
+
+TAMANHO_MINIMO = 2
+
+
+def _escapar_like(termo: str) -> str:
+    return termo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _ordem(nome: str, termo: str) -> int:
+    """0: nome começa com o termo; 1: alguma palavra começa; 2: contém"""
+    nome = nome.lower()
+    if nome.startswith(termo):
+        return 0
+    return 1 if f" {termo}" in nome else 2
+
+
+class CachePrefixos:
+    """LRU com TTL das sugestões por (escopo, termo).
+
+    Uma lista com menos itens que o limite é completa: consultas que estendem
+    o mesmo prefixo ("ana" -> "ana s") são respondidas filtrando-a em memória.
+    """
+
+    def __init__(self, max_itens: int, ttl: float):
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _valido(self, chave):
+        entrada = self._itens.get(chave)
+        if entrada is None:
+            return None
+        if time.monotonic() - entrada[0] > self.ttl:
+            del self._itens[chave]
+            return None
+        self._itens.move_to_end(chave)
+        return entrada
+
+    def obter(self, escopo, termo: str, limite: int, corresponde):
+        with self._lock:
+            entrada = self._valido((escopo, termo))
+            if entrada is not None:
+                return entrada[1]
+            for tamanho in range(len(termo) - 1, TAMANHO_MINIMO - 1, -1):
+                entrada = self._valido((escopo, termo[:tamanho]))
+                if entrada is not None and len(entrada[1]) < limite:
+                    return [r for r in entrada[1] if corresponde(r)]
+        return None
+
+    def guardar(self, escopo, termo: str, resultados):
+        if self.max_itens <= 0:
+            return
+        with self._lock:
+            self._itens[(escopo, termo)] = (time.monotonic(), resultados)
+            self._itens.move_to_end((escopo, termo))
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+
+cache_sugestoes = CachePrefixos(settings.SUGESTOES_CACHE_ITENS, settings.SUGESTOES_CACHE_SEGUNDOS)
+
+
+class SugestoesService:
+    """Autocompletar de alunos, professores e responsáveis por nome, matrícula ou CPF"""
+
+    @staticmethod
+    def _consultar(db: Session, tipo: str, termo: str, escolas, por_documento: bool, limite: int):
+        padrao = _escapar_like(termo)
+        nome = User.nome_completo.ilike(f"%{padrao}%", escape="\\")
+        ordem = case(
+            (User.nome_completo.ilike(f"{padrao}%", escape="\\"), 0),
+            (User.nome_completo.ilike(f"% {padrao}%", escape="\\"), 1),
+            else_=2,
+        )
+
+        if tipo == "alunos":
+            query = db.query(
+                User.id, User.nome_completo, User.tipo_usuario, Aluno.id, Aluno.matricula, Aluno.turma_id
+            ).join(Aluno, Aluno.user_id == User.id)
+            if escolas is not None:
+                query = query.join(Turma, Turma.id == Aluno.turma_id).filter(Turma.escola_id.in_(escolas))
+            documento = func.lower(Aluno.matricula).like(f"{padrao}%", escape="\\") if por_documento else false()
+
+        elif tipo == "professores":
+            query = db.query(
+                User.id, User.nome_completo, User.tipo_usuario, Professor.id, Professor.matricula, null()
+            ).join(Professor, Professor.user_id == User.id)
+            if escolas is not None:
+                query = query.filter(exists().where(
+                    professor_turma.c.professor_id == Professor.id,
+                    Turma.id == professor_turma.c.turma_id,
+                    Turma.escola_id.in_(escolas),
+                ))
+            documento = func.lower(Professor.matricula).like(f"{padrao}%", escape="\\") if por_documento else false()
+
+        else:
+            query = db.query(
+                User.id, User.nome_completo, User.tipo_usuario, Responsavel.id, Responsavel.cpf, null()
+            ).join(Responsavel, Responsavel.user_id == User.id)
+            if escolas is not None:
+                query = query.filter(exists().where(
+                    Aluno.responsavel_id == Responsavel.id,
+                    Turma.id == Aluno.turma_id,
+                    Turma.escola_id.in_(escolas),
+                ))
+            digitos = re.sub(r"\D", "", termo)
+            documento = Responsavel.cpf.like(f"{digitos}%") if por_documento and digitos else false()
+
+        linhas = query.filter(User.ativo == True, nome | documento).order_by(
+            ordem, User.nome_completo
+        ).limit(limite).all()
+
+        return [
+            {
+                "user_id": user_id,
+                "nome_completo": nome_completo,
+                "tipo_usuario": tipo_usuario,
+                "referencia_id": referencia_id,
+                # CPF só é devolvido a quem pode procurar por ele
+                "documento": documento_ if por_documento else None,
+                "turma_id": turma_id,
+            }
+            for user_id, nome_completo, tipo_usuario, referencia_id, documento_, turma_id in linhas
+        ]
+
+    @staticmethod
+    def sugerir(db: Session, tipo: str, termo: str, perfil: TipoUsuario, escolas, limite: int = 10):
+        """Top ``limite`` de ``tipo`` cujo nome contém ``termo`` (ou cujo documento começa
+        com ele), priorizando nomes que começam pelo termo.
+
+        ``escolas`` None = sem restrição de escola (gestores). Matrícula e CPF
+        só são considerados para professores e gestores.
+        """
+        termo = termo.strip().lower()
+        por_documento = perfil in (TipoUsuario.GESTOR, TipoUsuario.PROFESSOR)
+        if tipo == "responsaveis":
+            por_documento = perfil == TipoUsuario.GESTOR
+        escopo = (tipo, perfil, tuple(sorted(escolas)) if escolas is not None else None, limite)
+
+        def corresponde(item):
+            if termo in item["nome_completo"].lower():
+                return True
+            documento = item["documento"]
+            if tipo == "responsaveis":
+                digitos = re.sub(r"\D", "", termo)
+                return bool(documento and digitos and documento.startswith(digitos))
+            return bool(documento and documento.lower().startswith(termo))
+
+        resultados = cache_sugestoes.obter(escopo, termo, limite, corresponde)
+        if resultados is not None:
+            cache_consultas.inc(cache="sugestoes", resultado="hit")
+            return sorted(resultados, key=lambda r: (_ordem(r["nome_completo"], termo), r["nome_completo"]))
+
+        cache_consultas.inc(cache="sugestoes", resultado="miss")
+        resultados = SugestoesService._consultar(db, tipo, termo, escolas, por_documento, limite)
+        cache_sugestoes.guardar(escopo, termo, resultados)
+        return resultados
@@ -3,20 +3,34 @@ from app.utils.security import (
     verify_password,
     get_password_hash,
     create_access_token,
-    decode_access_token
+    create_refresh_token,
+    decode_access_token,
+    decode_refresh_token
 )
 from app.utils.dependencies import (
     get_current_user,
     get_current_active_user,
-    require_role
+    get_current_claims,
+    get_actor_context,
+    get_read_db,
+    ActorContext,
+    require_role,
+    require_role_claims
 )
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "create_access_token",
+    "create_refresh_token",
     "decode_access_token",
+    "decode_refresh_token",
     "get_current_user",
     "get_current_active_user",
-    "require_role"
+    "get_current_claims",
+    "get_actor_context",
+    "get_read_db",
+    "ActorContext",
+    "require_role",
+    "require_role_claims"
 ]
@@ -0,0 +1,85 @@
+"""
+Cache HTTP: ETags fortes e GET condicional
+
+``cache_condicional`` calcula o ETag a partir das versões das tabelas de que a
+resposta depende (ver app/models/versao_tabela.py), da rota e dos parâmetros.
+Se o cliente já tem essa versão (If-None-Match), responde 304 antes de
+consultar as linhas e serializar. Use apenas em respostas que não variam
+com o usuário autenticado além do escopo de escolas.
+
+A dependência autentica o request (``get_current_claims``, que também define
+o escopo) antes de calcular o ETag: sem credenciais a resposta é 401, nunca
+304, e o ETag já reflete as escolas do usuário.
+"""
+
+import hashlib
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from app.models import VersaoTabela, TABELAS_VERSIONADAS
+from app.schemas.user import TokenData
+from app.utils.dependencies import get_read_db, get_current_claims
+from app.utils.escopo_escola import escolas_do_request
+from app.utils.prometheus import cache_consultas
+
+# Políticas de Cache-Control usadas pelas rotas
+CACHE_CATALOGO = "private, max-age=300"  # escolas, disciplinas
+CACHE_CURTO = "private, max-age=60"  # turmas
+CACHE_REVALIDAR = "private, no-cache"  # sempre revalida (ETag), ex.: PEI
+
+
+def versoes_tabelas(db: Session, tabelas) -> dict:
+    """Versão atual de cada tabela (0 se nunca alterada)"""
+    linhas = db.query(VersaoTabela.tabela, VersaoTabela.versao).filter(
+        VersaoTabela.tabela.in_(tabelas)
+    ).all()
+    versoes = dict.fromkeys(tabelas, 0)
+    versoes.update(linhas)
+    return versoes
+
+
+def gerar_etag(request: Request, versoes: dict) -> str:
+    parametros = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    base = "|".join([
+        request.url.path,
+        parametros,
+        # O conteúdo varia com o escopo de escolas do usuário
+        repr(escolas_do_request.get()),
+        ",".join(f"{t}:{v}" for t, v in sorted(versoes.items())),
+    ])
+    return '"' + hashlib.sha256(base.encode()).hexdigest()[:32] + '"'
+
+
+def _corresponde(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Comparação fraca (RFC 9110 §13.1.2): ignora o prefixo W/
+    return any(
+        candidato.strip().removeprefix("W/") == etag
+        for candidato in if_none_match.split(",")
+    )
+
+
+def cache_condicional(*tabelas: str, cache_control: str = CACHE_REVALIDAR):
+    """Dependência de rota que aplica ETag/If-None-Match e Cache-Control"""
+    desconhecidas = set(tabelas) - TABELAS_VERSIONADAS
+    if desconhecidas:
+        raise ValueError(f"Tabelas sem versão: {', '.join(sorted(desconhecidas))}")
+
+    async def verificar(
+        request: Request,
+        response: Response,
+        claims: TokenData = Depends(get_current_claims),
+        db: Session = Depends(get_read_db),
+    ):
+        etag = gerar_etag(request, versoes_tabelas(db, tabelas))
+        cabecalhos = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _corresponde(if_none_match, etag):
+            cache_consultas.inc(cache="etag", resultado="hit")
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabecalhos)
+
+        cache_consultas.inc(cache="etag", resultado="miss")
+        response.headers.update(cabecalhos)
+
+    return verificar
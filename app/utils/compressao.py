@@ -0,0 +1,143 @@
+"""
+Compressão das respostas (brotli ou gzip, conforme Accept-Encoding)
+
+Respostas de tipo textual acima de COMPRESSAO_MINIMO_BYTES são comprimidas;
+as menores não compensam o custo. Corpos enviados em pedaços são comprimidos
+de forma incremental, e respostas que já têm Content-Encoding passam
+intactas. Brotli só é oferecido com o pacote ``brotli`` instalado.
+
+O ETag forte identifica bytes exatos, que mudam com a codificação: nas
+respostas negociadas ele é enfraquecido (W/"..."), o que continua válido
+para If-None-Match (ver app/utils/cache_http.py).
+"""
+
+import zlib
+from starlette.datastructures import Headers, MutableHeaders
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+NIVEL_GZIP = 6
+NIVEL_BROTLI = 4  # qualidade 4 comprime mais que gzip -6 em tempo parecido
+
+TIPOS_COMPRIMIVEIS = ("application/json", "text/", "application/xml", "application/javascript")
+
+
+def escolher_codificacao(accept_encoding: str):
+    """'br', 'gzip' ou None, respeitando os pesos q= do cliente"""
+    pesos = {}
+    for item in accept_encoding.split(","):
+        nome, _, parametros = item.strip().partition(";")
+        peso = 1.0
+        if parametros.strip().startswith("q="):
+            try:
+                peso = float(parametros.strip()[2:])
+            except ValueError:
+                peso = 0.0
+        pesos[nome.strip().lower()] = peso
+
+    candidatas = ["br", "gzip"] if brotli is not None else ["gzip"]
+    melhor = None
+    for codificacao in candidatas:
+        peso = pesos.get(codificacao, pesos.get("*", 0.0))
+        if peso > 0 and (melhor is None or peso > melhor[1]):
+            melhor = (codificacao, peso)
+    return melhor[0] if melhor else None
+
+
+class _Compressor:
+    """Compressão incremental, para corpos enviados em vários pedaços"""
+
+    def __init__(self, codificacao: str):
+        if codificacao == "br":
+            self._obj = brotli.Compressor(quality=NIVEL_BROTLI)
+            self._comprimir, self._finalizar = self._obj.process, self._obj.finish
+        else:
+            self._obj = zlib.compressobj(NIVEL_GZIP, zlib.DEFLATED, 31)  # 31 = formato gzip
+            self._comprimir, self._finalizar = self._obj.compress, self._obj.flush
+
+    def comprimir(self, dados: bytes, fim: bool) -> bytes:
+        saida = self._comprimir(dados)
+        return saida + self._finalizar() if fim else saida
+
+
+def _enfraquecer_etag(headers: MutableHeaders):
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+class CompressaoMiddleware:
+    """Middleware ASGI; fica por fora dos demais para comprimir a resposta final"""
+
+    def __init__(self, app, minimo: int = None):
+        self.app = app
+        self.minimo = settings.COMPRESSAO_MINIMO_BYTES if minimo is None else minimo
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.minimo <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        codificacao = escolher_codificacao(Headers(scope=scope).get("accept-encoding", ""))
+        if codificacao is None:
+            await self.app(scope, receive, send)
+            return
+
+        inicio = None
+        pendente = b""
+        compressor = None
+
+        async def enviar(message):
+            nonlocal inicio, pendente, compressor
+            if message["type"] == "http.response.start":
+                inicio = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            corpo = message.get("body", b"")
+            fim = not message.get("more_body", False)
+
+            if compressor is not None:
+                await send({"type": "http.response.body", "body": compressor.comprimir(corpo, fim), "more_body": not fim})
+                return
+            if inicio is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=inicio["headers"])
+            if inicio["status"] == 304:
+                # Mantém o ETag igual ao da resposta 200 negociada
+                _enfraquecer_etag(headers)
+            elif (
+                headers.get("content-type", "").startswith(TIPOS_COMPRIMIVEIS)
+                and "content-encoding" not in headers
+            ):
+                # O corpo pode chegar em pedaços (BaseHTTPMiddleware): acumula até
+                # saber se passa do mínimo
+                pendente += corpo
+                if len(pendente) < self.minimo and not fim:
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                corpo, pendente = pendente, b""
+                if len(corpo) >= self.minimo:
+                    compressor = _Compressor(codificacao)
+                    corpo = compressor.comprimir(corpo, fim)
+                    headers["Content-Encoding"] = codificacao
+                    _enfraquecer_etag(headers)
+                    if fim:
+                        headers["Content-Length"] = str(len(corpo))
+                    else:
+                        del headers["Content-Length"]
+                message = {"type": "http.response.body", "body": corpo, "more_body": not fim}
+
+            await send(inicio)
+            inicio = None
+            await send(message)
+
+        await self.app(scope, receive, enviar)
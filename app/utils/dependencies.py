@@ -1,9 +1,15 @@
-from fastapi import Depends, HTTPException, status
+from dataclasses import dataclass, field
+from typing import Optional, Set
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models import User, TipoUsuario
+from app.database import get_db, SessionLocal, ReplicaSessionLocal
+from app.models import User, TipoUsuario, Professor, Responsavel, Aluno, professor_turma
+from app.schemas.user import TokenData
 from app.utils.security import decode_access_token
+from app.utils.replica import estado_replica, escritas_recentes, sessoes_leitura
+from app.utils.escopo_escola import definir_escopo
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
@@ -30,6 +36,10 @@ async def get_current_user(
     user = db.query(User).filter(User.id == user_id, User.ativo == True).first()
     if user is None:
         raise credentials_exception
+
+    # Identifica o autor dos commits desta sessão (read-your-writes da réplica)
+    db.info["usuario_id"] = user.id
+    definir_escopo(user.tipo_usuario, payload.get("escolas", []), user.id)
     
     return user
 
@@ -52,3 +62,136 @@ def require_role(*allowed_roles: TipoUsuario):
         return current_user
     return role_checker
 
+
+@dataclass
+class ActorContext:
+    """Perfil do usuário autenticado, resolvido uma vez por request.
+
+    Reúne os vínculos usados nas checagens de autorização (turmas do
+    professor, filhos do responsável, turma do aluno) para que elas virem
+    testes de pertinência em vez de queries repetidas nos handlers.
+    """
+    user: User
+    professor_id: Optional[int] = None
+    turma_ids: Set[int] = field(default_factory=set)
+    responsavel_id: Optional[int] = None
+    filhos_ids: Set[int] = field(default_factory=set)
+    filhos_turma_ids: Set[int] = field(default_factory=set)
+    aluno_id: Optional[int] = None
+    aluno_turma_id: Optional[int] = None
+
+    def pode_ver_aluno(self, aluno_id: int) -> bool:
+        """Aluno só vê a si mesmo e responsável só vê os filhos; demais perfis veem todos"""
+        if self.user.tipo_usuario == TipoUsuario.ALUNO:
+            return self.aluno_id == aluno_id
+        if self.user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+            return aluno_id in self.filhos_ids
+        return True
+
+
+async def get_actor_context(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+) -> ActorContext:
+    """Resolve o perfil do usuário com no máximo uma query (cacheado por request pelo FastAPI).
+
+    O perfil é do próprio usuário e não passa pelo escopo por escola: filhos e
+    alunos ainda sem turma também entram.
+    """
+    ator = ActorContext(user=current_user)
+
+    if current_user.tipo_usuario == TipoUsuario.PROFESSOR:
+        linhas = db.query(Professor.id, professor_turma.c.turma_id).outerjoin(
+            professor_turma, professor_turma.c.professor_id == Professor.id
+        ).filter(Professor.user_id == current_user.id).execution_options(
+            sem_escopo_escola=True
+        ).all()
+        if linhas:
+            ator.professor_id = linhas[0][0]
+            ator.turma_ids = {turma_id for _, turma_id in linhas if turma_id is not None}
+
+    elif current_user.tipo_usuario == TipoUsuario.RESPONSAVEL:
+        linhas = db.query(Responsavel.id, Aluno.id, Aluno.turma_id).outerjoin(
+            Aluno, Aluno.responsavel_id == Responsavel.id
+        ).filter(Responsavel.user_id == current_user.id).execution_options(
+            sem_escopo_escola=True
+        ).all()
+        if linhas:
+            ator.responsavel_id = linhas[0][0]
+            ator.filhos_ids = {aluno_id for _, aluno_id, _ in linhas if aluno_id is not None}
+            ator.filhos_turma_ids = {turma_id for _, _, turma_id in linhas if turma_id is not None}
+
+    elif current_user.tipo_usuario == TipoUsuario.ALUNO:
+        aluno = db.query(Aluno.id, Aluno.turma_id).filter(
+            Aluno.user_id == current_user.id
+        ).execution_options(sem_escopo_escola=True).first()
+        if aluno:
+            ator.aluno_id, ator.aluno_turma_id = aluno.id, aluno.turma_id
+
+    return ator
+
+
+async def get_current_claims(token: str = Depends(oauth2_scheme)) -> TokenData:
+    """Obtém os claims do token JWT sem consultar o banco.
+
+    O access token é de curta duração e carrega papel e escolas do usuário,
+    então autorizações simples não precisam carregar o User.
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None or payload.get("role") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Não foi possível validar as credenciais",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    definir_escopo(payload["role"], payload.get("escolas", []), int(payload["sub"]))
+    return TokenData(
+        user_id=int(payload["sub"]),
+        email=payload.get("email"),
+        tipo_usuario=payload["role"],
+        escolas=payload.get("escolas", []),
+    )
+
+
+def get_read_db(claims: TokenData = Depends(get_current_claims)):
+    """Sessão para endpoints somente leitura.
+
+    Usa a réplica quando configurada, disponível e em dia, exceto para quem
+    escreveu há pouco (ver app/utils/replica.py); caso contrário, o primário.
+    Depende só dos claims do token: endpoints que não carregam o User (e
+    respostas vindas de cache) não tocam no banco.
+    """
+    if estado_replica.disponivel() and not escritas_recentes.recente(claims.user_id):
+        db = ReplicaSessionLocal()
+        db.info["replica"] = True
+    else:
+        db = SessionLocal()
+    sessoes_leitura.inc(destino="replica" if db.info.get("replica") else "primario")
+    try:
+        yield db
+    except OperationalError as e:
+        if db.info.get("replica"):
+            estado_replica.marcar_falha(e)
+        raise
+    finally:
+        db.close()
+
+
+def require_role_claims(*allowed_roles: TipoUsuario):
+    """Como require_role, mas decide apenas pelos claims do token (sem DB)"""
+    async def role_checker(claims: TokenData = Depends(get_current_claims)) -> TokenData:
+        if claims.tipo_usuario not in allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Você não tem permissão para acessar este recurso"
+            )
+        return claims
+    return role_checker
+
+
+async def get_chave_idempotencia(
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=100)
+) -> Optional[str]:
+    """Chave enviada pelo cliente para que repetir a mesma escrita não gere eventos de novo"""
+    return idempotency_key
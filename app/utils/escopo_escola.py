@@ -0,0 +1,80 @@
+"""
+Escopo por escola (multi-tenant) aplicado na camada de consulta
+
+As dependências de autenticação gravam as escolas do token no contexto do
+request (``definir_escopo``). Todo SELECT do ORM feito nesse request recebe,
+via ``with_loader_criteria``, o filtro ``escola_id IN (...)`` nas entidades
+ligadas a uma escola, inclusive em joins e carregamentos de relações.
+
+Alunos ainda sem turma (``escola_id`` nulo) continuam visíveis ao próprio
+aluno e ao seu responsável, mesmo sem escola no token.
+
+Gestores não têm vínculo com escola no modelo atual e enxergam a rede toda;
+fora de requests (tarefas, scripts) não há escopo. Consultas que precisam
+ignorar o escopo usam ``execution_options(sem_escopo_escola=True)``.
+"""
+
+from contextvars import ContextVar
+from sqlalchemy import event, or_, and_, select
+from sqlalchemy.orm import Session, with_loader_criteria
+from app.models import TipoUsuario, Turma, Aluno, Atividade, EventoEscolar, Responsavel
+
+# None = sem restrição
+escolas_do_request: ContextVar = ContextVar("escolas_do_request", default=None)
+usuario_do_request: ContextVar = ContextVar("usuario_do_request", default=None)
+
+
+def definir_escopo(tipo_usuario, escolas, usuario_id=None):
+    """Restringe as consultas do request atual às ``escolas`` (exceto para gestores)"""
+    if TipoUsuario(tipo_usuario) == TipoUsuario.GESTOR:
+        escolas_do_request.set(None)
+    else:
+        escolas_do_request.set(tuple(sorted(escolas or ())))
+    usuario_do_request.set(usuario_id)
+
+
+def _criterios(escolas, usuario_id):
+    return [
+        with_loader_criteria(Turma, lambda cls: cls.escola_id.in_(escolas), include_aliases=True),
+        # Alunos sem turma: só o próprio aluno e o seu responsável
+        with_loader_criteria(
+            Aluno,
+            lambda cls: or_(
+                cls.escola_id.in_(escolas),
+                and_(
+                    cls.escola_id.is_(None),
+                    or_(
+                        cls.user_id == usuario_id,
+                        cls.responsavel_id.in_(
+                            select(Responsavel.id).where(Responsavel.user_id == usuario_id)
+                        ),
+                    ),
+                ),
+            ),
+            include_aliases=True,
+        ),
+        with_loader_criteria(Atividade, lambda cls: cls.escola_id.in_(escolas), include_aliases=True),
+        # Eventos sem escola são da rede toda
+        with_loader_criteria(
+            EventoEscolar,
+            lambda cls: or_(cls.escola_id.is_(None), cls.escola_id.in_(escolas)),
+            include_aliases=True,
+        ),
+    ]
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _aplicar_escopo(orm_execute_state):
+    escolas = escolas_do_request.get()
+    if (
+        escolas is None
+        or not orm_execute_state.is_select
+        # Carregamentos de colunas e relações herdam o critério da consulta original
+        or orm_execute_state.is_column_load
+        or orm_execute_state.is_relationship_load
+        or orm_execute_state.execution_options.get("sem_escopo_escola", False)
+    ):
+        return
+    orm_execute_state.statement = orm_execute_state.statement.options(
+        *_criterios(escolas, usuario_do_request.get())
+    )
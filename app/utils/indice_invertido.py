@@ -0,0 +1,108 @@
+"""
+Índice invertido em memória
+
+Substituto da busca textual do PostgreSQL (tsvector) quando o banco não é
+PostgreSQL (ex.: sqlite). Aproxima o comportamento da
+configuração 'portuguese': minúsculas, sem acentos, sem stopwords e com um
+radical simplificado, de modo que "avaliações" encontre "avaliação".
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+
+PALAVRA = re.compile(r"\w+", re.UNICODE)
+
+STOPWORDS = {
+    "a", "ao", "aos", "as", "com", "como", "da", "das", "de", "do", "dos", "e", "em",
+    "na", "nas", "no", "nos", "o", "os", "ou", "para", "pela", "pelo", "por", "que",
+    "se", "sem", "um", "uma", "uns", "umas",
+}
+
+# Sufixos removidos do radical, do mais longo para o mais curto
+SUFIXOS = (
+    "amentos", "imentos", "amento", "imento", "acoes", "icoes", "mente", "acao", "icao",
+    "ados", "idos", "adas", "idas", "ado", "ido", "ada", "ida", "oes", "ais", "eis",
+    "es", "as", "os", "s", "a", "o", "e",
+)
+
+
+def normalizar(texto: str) -> str:
+    sem_acento = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+    return sem_acento.lower()
+
+
+def radical(palavra: str) -> str:
+    for sufixo in SUFIXOS:
+        if palavra.endswith(sufixo) and len(palavra) - len(sufixo) >= 3:
+            return palavra[: -len(sufixo)]
+    return palavra
+
+
+def termos(texto: str):
+    """Radicais das palavras de ``texto``, na ordem em que aparecem"""
+    return [
+        radical(p) for p in PALAVRA.findall(normalizar(texto or ""))
+        if p not in STOPWORDS
+    ]
+
+
+class IndiceInvertido:
+    """Termo -> {documento: peso acumulado}, com ranking tf-idf"""
+
+    def __init__(self):
+        self._postings = defaultdict(dict)
+        self._documentos = 0
+
+    def adicionar(self, chave, campos):
+        """Indexa ``campos``: lista de (texto, peso); títulos costumam ter peso maior"""
+        self._documentos += 1
+        for texto, peso in campos:
+            for termo in termos(texto):
+                docs = self._postings[termo]
+                docs[chave] = docs.get(chave, 0.0) + peso
+
+    def buscar(self, consulta: str, limite: int = 20):
+        """Documentos que contêm todos os termos da consulta, do mais relevante ao menos"""
+        procurados = set(termos(consulta))
+        if not procurados:
+            return []
+
+        candidatos = None
+        for termo in procurados:
+            docs = set(self._postings.get(termo, ()))
+            candidatos = docs if candidatos is None else candidatos & docs
+            if not candidatos:
+                return []
+
+        pontuacao = {}
+        for chave in candidatos:
+            pontuacao[chave] = sum(
+                self._postings[termo][chave] * math.log(1 + self._documentos / len(self._postings[termo]))
+                for termo in procurados
+            )
+        return sorted(pontuacao.items(), key=lambda item: item[1], reverse=True)[:limite]
+
+
+def destacar(texto: str, consulta: str, marcador=("<mark>", "</mark>"), contexto: int = 12) -> str:
+    """Trecho de ``texto`` em torno da primeira ocorrência, com os termos marcados
+    (equivalente simplificado do ts_headline). O trecho não é escapado: quem
+    o devolve como HTML escapa antes de trocar ``marcador`` por tags."""
+    procurados = set(termos(consulta))
+    palavras = list(PALAVRA.finditer(texto or ""))
+    posicoes = [
+        i for i, m in enumerate(palavras)
+        if radical(normalizar(m.group())) in procurados
+    ]
+    if not posicoes:
+        return " ".join(m.group() for m in palavras[: contexto * 2])
+
+    inicio = max(0, posicoes[0] - contexto)
+    fim = min(len(palavras), posicoes[0] + contexto + 1)
+    destacadas = set(posicoes)
+    partes = []
+    for i in range(inicio, fim):
+        palavra = palavras[i].group()
+        partes.append(f"{marcador[0]}{palavra}{marcador[1]}" if i in destacadas else palavra)
+    return " ".join(partes)
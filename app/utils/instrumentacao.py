@@ -0,0 +1,183 @@
+"""
+Instrumentação de requests: latência por rota, número de queries e tempo de banco
+
+Os eventos do engine do SQLAlchemy acumulam as queries no contexto do request
+atual (``ContextVar``, que acompanha o request também nas threads do pool de
+sync do FastAPI). O middleware publica os totais no header ``Server-Timing``,
+alimenta os histogramas por rota, registra requests lentos com suas queries e,
+em desenvolvimento, aponta padrões N+1 (a mesma query repetida muitas vezes).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.config import settings
+
+# Limites superiores (ms) dos buckets do histograma de latência
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class _ColetaRequest:
+    """Queries executadas durante um request"""
+
+    __slots__ = ("queries", "tempo_db")
+
+    def __init__(self):
+        self.queries = []
+        self.tempo_db = 0.0
+
+
+_coleta_atual: ContextVar = ContextVar("coleta_request", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _antes_da_query(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("inicio_query", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _depois_da_query(conn, cursor, statement, parameters, context, executemany):
+    inicio = conn.info["inicio_query"].pop()
+    coleta = _coleta_atual.get()
+    if coleta is not None:
+        duracao = time.perf_counter() - inicio
+        coleta.queries.append((statement, duracao))
+        coleta.tempo_db += duracao
+
+
+class MetricasRequests:
+    """Histogramas de latência e contadores de queries por rota e status"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self.em_andamento = 0
+
+    def registrar(self, metodo: str, rota: str, status: int,
+                  duracao_ms: float, queries: int, tempo_db_ms: float):
+        with self._lock:
+            chave = (metodo, rota, status)
+            r = self._series.get(chave)
+            if r is None:
+                r = self._series[chave] = {
+                    "buckets": [0] * (len(BUCKETS_MS) + 1),
+                    "total": 0,
+                    "soma_ms": 0.0,
+                    "queries": 0,
+                    "tempo_db_ms": 0.0,
+                }
+            r["buckets"][bisect_left(BUCKETS_MS, duracao_ms)] += 1
+            r["total"] += 1
+            r["soma_ms"] += duracao_ms
+            r["queries"] += queries
+            r["tempo_db_ms"] += tempo_db_ms
+
+    def snapshot(self) -> dict:
+        """Cópia dos contadores brutos, por (método, rota, status)"""
+        with self._lock:
+            return {
+                chave: {**r, "buckets": list(r["buckets"])}
+                for chave, r in self._series.items()
+            }
+
+    def resumo(self) -> list:
+        """Latência média/p95 estimada e queries por request de cada rota"""
+        por_rota = {}
+        for (metodo, rota, _), r in self.snapshot().items():
+            a = por_rota.setdefault(f"{metodo} {rota}", {
+                "buckets": [0] * (len(BUCKETS_MS) + 1),
+                "total": 0, "soma_ms": 0.0, "queries": 0, "tempo_db_ms": 0.0,
+            })
+            a["buckets"] = [x + y for x, y in zip(a["buckets"], r["buckets"])]
+            for campo in ("total", "soma_ms", "queries", "tempo_db_ms"):
+                a[campo] += r[campo]
+
+        resumo = []
+        for rota, r in sorted(por_rota.items()):
+            total = r["total"]
+            resumo.append({
+                "rota": rota,
+                "requests": total,
+                "latencia_media_ms": round(r["soma_ms"] / total, 2),
+                "latencia_p95_ms": self._percentil(r["buckets"], total, 0.95),
+                "queries_por_request": round(r["queries"] / total, 2),
+                "tempo_db_medio_ms": round(r["tempo_db_ms"] / total, 2),
+            })
+        return resumo
+
+    @staticmethod
+    def _percentil(buckets, total, p):
+        """Limite superior do bucket onde cai o percentil (None se acima do último)"""
+        alvo = total * p
+        acumulado = 0
+        for limite, quantidade in zip(BUCKETS_MS, buckets):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return limite
+        return None
+
+
+metricas_requests = MetricasRequests()
+
+
+class InstrumentacaoMiddleware(BaseHTTPMiddleware):
+    """Mede cada request e expõe os tempos no header ``Server-Timing``"""
+
+    async def dispatch(self, request, call_next):
+        coleta = _ColetaRequest()
+        token = _coleta_atual.set(coleta)
+        metricas_requests.em_andamento += 1
+        inicio = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+        finally:
+            _coleta_atual.reset(token)
+            metricas_requests.em_andamento -= 1
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+            tempo_db_ms = coleta.tempo_db * 1000
+
+            # Template da rota (ex.: /api/alunos/{aluno_id}) para não explodir a cardinalidade
+            route = request.scope.get("route")
+            caminho = route.path if route else "desconhecida"
+            metricas_requests.registrar(
+                request.method, caminho, status, duracao_ms, len(coleta.queries), tempo_db_ms
+            )
+        rota = f"{request.method} {caminho}"
+
+        response.headers["Server-Timing"] = (
+            f'app;dur={duracao_ms:.1f}, '
+            f'db;dur={tempo_db_ms:.1f};desc="{len(coleta.queries)} queries"'
+        )
+
+        if settings.SLOW_REQUEST_MS and duracao_ms >= settings.SLOW_REQUEST_MS:
+            self._registrar_lento(rota, duracao_ms, tempo_db_ms, coleta)
+        if settings.ENVIRONMENT == "development" and settings.N_MAIS_1_LIMITE:
+            self._detectar_n_mais_1(rota, coleta)
+
+        return response
+
+    @staticmethod
+    def _registrar_lento(rota, duracao_ms, tempo_db_ms, coleta):
+        print(
+            f"Request lento: {rota} {duracao_ms:.0f} ms "
+            f"({len(coleta.queries)} queries, {tempo_db_ms:.0f} ms no banco)"
+        )
+        for statement, duracao in sorted(coleta.queries, key=lambda q: q[1], reverse=True)[:10]:
+            print(f"  {duracao * 1000:8.1f} ms  {' '.join(statement.split())[:300]}")
+
+    @staticmethod
+    def _detectar_n_mais_1(rota, coleta):
+        repetidas = Counter(statement for statement, _ in coleta.queries)
+        for statement, vezes in repetidas.items():
+            if vezes >= settings.N_MAIS_1_LIMITE:
+                print(
+                    f"Possível N+1 em {rota}: query executada {vezes}x: "
+                    f"{' '.join(statement.split())[:200]}"
+                )
@@ -0,0 +1,131 @@
+"""
+Pool de processos dedicado ao hashing de senhas (bcrypt)
+
+O bcrypt é propositalmente caro em CPU. Executá-lo nas threads de request faz
+um pico de logins ocupar todos os workers; aqui o trabalho vai para um pool de
+processos de tamanho fixo, com fila limitada e contadores de profundidade.
+Importações em lote usam o mesmo pool, em blocos pequenos, para não
+monopolizá-lo.
+"""
+
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import HTTPException, status
+from app.config import settings
+from app.utils.security import pwd_context
+
+# Senhas por tarefa em hash_lote: um login espera no máximo um bloco
+SENHAS_POR_BLOCO = 8
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _hash_varios(passwords):
+    return [pwd_context.hash(p) for p in passwords]
+
+
+def _verify_and_update(password: str, hashed_password: str):
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+class PasswordPool:
+    """Executa hash/verificação de senhas fora das threads de request"""
+
+    def __init__(self, workers: int, max_fila: int, timeout: float):
+        self.workers = workers
+        self.max_fila = max_fila
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._vagas = threading.BoundedSemaphore(workers + max_fila) if workers else None
+        self._em_execucao = 0
+        self._total = 0
+        self._rejeitadas = 0
+        self._tempo_total = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _executar(self, fn, *args):
+        # Sem workers configurados (ex.: desenvolvimento), executa inline
+        if not self.workers:
+            return fn(*args)
+
+        if not self._vagas.acquire(timeout=self.timeout):
+            with self._lock:
+                self._rejeitadas += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Servidor ocupado, tente novamente em instantes",
+                headers={"Retry-After": "1"},
+            )
+
+        inicio = time.perf_counter()
+        with self._lock:
+            self._em_execucao += 1
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._em_execucao -= 1
+                self._total += 1
+                self._tempo_total += time.perf_counter() - inicio
+            self._vagas.release()
+
+    def hash(self, password: str) -> str:
+        """Gera o hash da senha no pool"""
+        return self._executar(_hash, password)
+
+    def hash_lote(self, passwords, paralelos: int = 0):
+        """Gera os hashes de várias senhas, na ordem recebida.
+
+        As senhas vão ao pool em blocos de SENHAS_POR_BLOCO, no máximo
+        ``paralelos`` (0 = todos os workers) por vez; cada bloco ocupa uma
+        vaga da fila como um login, que assim é atendido entre os blocos.
+        """
+        blocos = [
+            passwords[i:i + SENHAS_POR_BLOCO] for i in range(0, len(passwords), SENHAS_POR_BLOCO)
+        ]
+        if not self.workers:
+            return [h for bloco in blocos for h in _hash_varios(bloco)]
+
+        paralelos = min(paralelos or self.workers, self.workers)
+        with ThreadPoolExecutor(max_workers=paralelos) as envio:
+            hashes = envio.map(lambda bloco: self._executar(_hash_varios, bloco), blocos)
+            return [h for bloco in hashes for h in bloco]
+
+    def verify_and_update(self, password: str, hashed_password: str):
+        """Verifica a senha; retorna (ok, novo_hash) com novo_hash quando o custo mudou"""
+        return self._executar(_verify_and_update, password, hashed_password)
+
+    def stats(self) -> dict:
+        """Profundidade da fila e contadores acumulados"""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacidade_fila": self.max_fila,
+                "em_execucao": min(self._em_execucao, self.workers) if self.workers else 0,
+                "na_fila": max(self._em_execucao - self.workers, 0),
+                "total_processadas": self._total,
+                "rejeitadas": self._rejeitadas,
+                "tempo_medio_ms": round(self._tempo_total / self._total * 1000, 2) if self._total else 0,
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordPool(
+    workers=settings.PASSWORD_POOL_WORKERS,
+    max_fila=settings.PASSWORD_POOL_MAX_FILA,
+    timeout=settings.PASSWORD_POOL_TIMEOUT,
+)
@@ -0,0 +1,88 @@
+"""
+Sparse fieldsets (``fields=``) com projeção de colunas
+
+Sem ``fields`` a listagem segue o caminho normal (objetos ORM validados pelo
+``response_model``). Com ``fields=id,nome,escola.nome`` a consulta seleciona
+só essas colunas, junta as relações apenas se algum campo delas foi pedido e
+monta a resposta direto das linhas, sem identity map nem validação Pydantic.
+
+Os campos disponíveis são os do schema de resposta que correspondem a
+colunas do modelo; relações aninhadas (muitos-para-um) usam ``relacao.campo``,
+e só ``relacao`` pede todos os campos dela.
+"""
+
+from typing import Optional
+from fastapi import HTTPException, Query, status
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+
+def _colunas(modelo, schema, prefixo=""):
+    existentes = inspect(modelo).columns.keys()
+    return {
+        f"{prefixo}{campo}": getattr(modelo, campo)
+        for campo in schema.model_fields
+        if campo in existentes
+    }
+
+
+class Projecao:
+    """Colunas de uma listagem que podem ser pedidas em ``fields``"""
+
+    def __init__(self, modelo, schema, relacoes=None):
+        """``relacoes``: nome -> (modelo, condição de junção, schema)"""
+        self.modelo = modelo
+        self.colunas = _colunas(modelo, schema)
+        self.juncoes = {}
+        for nome, (alvo, condicao, schema_alvo) in (relacoes or {}).items():
+            self.juncoes[nome] = (alvo, condicao)
+            self.colunas.update(_colunas(alvo, schema_alvo, prefixo=f"{nome}."))
+
+    def campos(
+        self,
+        fields: Optional[str] = Query(
+            None, description="Campos a devolver, separados por vírgula (ex.: id,nome,escola.nome)"
+        ),
+    ):
+        """Dependência: lista de campos pedidos, ou None para a resposta completa"""
+        if not fields:
+            return None
+        campos = []
+        for campo in (c.strip() for c in fields.split(",")):
+            if campo in self.juncoes:
+                campos.extend(c for c in self.colunas if c.startswith(f"{campo}."))
+            elif campo in self.colunas:
+                campos.append(campo)
+            elif campo:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Campo inválido em fields: {campo}. Disponíveis: {', '.join(self.colunas)}",
+                )
+        return list(dict.fromkeys(campos))
+
+    def consulta(self, db: Session, campos):
+        """Query só com as colunas de ``campos``; filtros e paginação ficam com a rota"""
+        query = db.query(*(self.colunas[c].label(c) for c in campos)).select_from(self.modelo)
+        usadas = {c.split(".", 1)[0] for c in campos if "." in c}
+        for nome in usadas:
+            alvo, condicao = self.juncoes[nome]
+            query = query.outerjoin(alvo, condicao)
+        return query
+
+    @staticmethod
+    def montar(linhas, campos):
+        """Dicts da resposta; ``relacao.campo`` vira objeto aninhado (None se a relação é nula)"""
+        resultado = []
+        for linha in linhas:
+            item = {}
+            for campo, valor in zip(campos, linha):
+                relacao, _, sub = campo.partition(".")
+                if sub:
+                    item.setdefault(relacao, {})[sub] = valor
+                else:
+                    item[campo] = valor
+            for chave, valor in item.items():
+                if isinstance(valor, dict) and all(v is None for v in valor.values()):
+                    item[chave] = None
+            resultado.append(item)
+        return resultado
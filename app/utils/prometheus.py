@@ -0,0 +1,152 @@
+"""
+Exposição de métricas no formato texto do Prometheus
+
+Os contadores são simples dicionários protegidos por lock e o texto só é
+montado quando ``/metrics`` é consultado, então a coleta pode ficar ligada em
+produção. Cada processo do uvicorn mantém seus próprios contadores.
+"""
+
+import threading
+from app.database import engine
+from app.utils.instrumentacao import BUCKETS_MS, metricas_requests
+from app.utils.password_pool import password_pool
+from app.utils.revogacao import revogacao_tokens
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatar_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escapar(v)}"' for k, v in labels.items()) + "}"
+
+
+def _formatar_valor(valor) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class Contador:
+    """Contador monotônico com labels, exportado como ``counter``"""
+
+    def __init__(self, nome: str, ajuda: str, labels=()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.labels = tuple(labels)
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def inc(self, valor: float = 1, **labels):
+        chave = tuple(labels.get(l, "") for l in self.labels)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+    def amostras(self):
+        with self._lock:
+            valores = dict(self._valores)
+        return [("", dict(zip(self.labels, chave)), v) for chave, v in valores.items()]
+
+
+class RegistroMetricas:
+    """Reúne contadores e coletores e gera o texto de exposição"""
+
+    def __init__(self):
+        self._contadores = []
+        self._coletores = []
+
+    def contador(self, nome: str, ajuda: str, labels=()) -> Contador:
+        contador = Contador(nome, ajuda, labels)
+        self._contadores.append(contador)
+        return contador
+
+    def coletor(self, funcao):
+        """Registra uma função que devolve ``[(nome, tipo, ajuda, amostras)]`` na coleta"""
+        self._coletores.append(funcao)
+        return funcao
+
+    def exportar(self) -> str:
+        familias = [(c.nome, "counter", c.ajuda, c.amostras()) for c in self._contadores]
+        for coletor in self._coletores:
+            try:
+                familias.extend(coletor())
+            except Exception as e:
+                print(f"Erro ao coletar métricas em {coletor.__name__}: {e}")
+
+        linhas = []
+        for nome, tipo, ajuda, amostras in familias:
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+            for sufixo, labels, valor in amostras:
+                linhas.append(f"{nome}{sufixo}{_formatar_labels(labels)} {_formatar_valor(valor)}")
+        return "\n".join(linhas) + "\n"
+
+
+registro_metricas = RegistroMetricas()
+
+upload_bytes = registro_metricas.contador(
+    "incluapp_upload_bytes_total", "Bytes gravados por uploads", ("pasta",)
+)
+cache_consultas = registro_metricas.contador(
+    "incluapp_cache_requests_total", "Consultas aos caches em memória", ("cache", "resultado")
+)
+
+
+@registro_metricas.coletor
+def _coletar_requests():
+    latencia, queries, tempo_db = [], [], []
+    for (metodo, rota, status), r in metricas_requests.snapshot().items():
+        labels = {"method": metodo, "route": rota, "status": status}
+        acumulado = 0
+        for limite, quantidade in zip(BUCKETS_MS + (float("inf"),), r["buckets"]):
+            acumulado += quantidade
+            le = limite / 1000 if limite != float("inf") else limite
+            latencia.append(("_bucket", {**labels, "le": _formatar_valor(le)}, acumulado))
+        latencia.append(("_sum", labels, r["soma_ms"] / 1000))
+        latencia.append(("_count", labels, r["total"]))
+        queries.append(("", labels, r["queries"]))
+        tempo_db.append(("", labels, r["tempo_db_ms"] / 1000))
+
+    return [
+        ("incluapp_http_request_duration_seconds", "histogram",
+         "Latência dos requests por rota e status", latencia),
+        ("incluapp_db_queries_total", "counter",
+         "Queries SQL executadas pelos requests", queries),
+        ("incluapp_db_query_seconds_total", "counter",
+         "Tempo gasto no banco pelos requests", tempo_db),
+        ("incluapp_http_requests_in_progress", "gauge",
+         "Requests em andamento", [("", {}, metricas_requests.em_andamento)]),
+    ]
+
+
+@registro_metricas.coletor
+def _coletar_pool_banco():
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return []
+    return [
+        ("incluapp_db_pool_size", "gauge", "Conexões permanentes do pool", [("", {}, pool.size())]),
+        ("incluapp_db_pool_checked_out", "gauge", "Conexões em uso", [("", {}, pool.checkedout())]),
+        ("incluapp_db_pool_overflow", "gauge", "Conexões além do tamanho do pool", [("", {}, pool.overflow())]),
+    ]
+
+
+@registro_metricas.coletor
+def _coletar_filas():
+    senhas = password_pool.stats()
+    return [
+        ("incluapp_password_pool_in_progress", "gauge",
+         "Hashes de senha em execução", [("", {}, senhas["em_execucao"])]),
+        ("incluapp_password_pool_queued", "gauge",
+         "Hashes de senha aguardando na fila", [("", {}, senhas["na_fila"])]),
+        ("incluapp_password_pool_processed_total", "counter",
+         "Hashes de senha processados", [("", {}, senhas["total_processadas"])]),
+        ("incluapp_password_pool_rejected_total", "counter",
+         "Hashes de senha recusados por fila cheia", [("", {}, senhas["rejeitadas"])]),
+        ("incluapp_revoked_tokens", "gauge",
+         "Tokens revogados mantidos em memória", [("", {}, len(revogacao_tokens))]),
+        ("incluapp_revoked_tokens_pending", "gauge",
+         "Revogações ainda não persistidas", [("", {}, revogacao_tokens.pendentes())]),
+    ]
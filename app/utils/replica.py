@@ -0,0 +1,150 @@
+"""
+Roteamento de leituras para a réplica (DATABASE_REPLICA_URL)
+
+Endpoints somente leitura usam ``get_read_db``, que entrega uma sessão da
+réplica enquanto ela responde e seu atraso de replicação está abaixo de
+REPLICA_MAX_ATRASO_SEGUNDOS; fora disso, a leitura vai para o primário.
+
+Read-your-writes: commits com escrita feitos por um usuário autenticado são
+registrados, e esse usuário lê do primário por REPLICA_LEITURA_PROPRIA_SEGUNDOS.
+O registro é por processo; com várias instâncias, use afinidade de sessão no
+balanceador ou uma janela maior que o atraso máximo aceito.
+"""
+
+import threading
+import time
+from sqlalchemy import event, text
+from app.config import settings
+from app.database import SessionLocal, replica_engine
+from app.utils.prometheus import registro_metricas
+
+# Atraso de replay; zero quando a réplica já aplicou tudo o que recebeu
+# (sem isso um primário ocioso pareceria uma réplica atrasada)
+SQL_ATRASO = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+sessoes_leitura = registro_metricas.contador(
+    "incluapp_db_read_sessions_total", "Sessões de leitura por destino", ("destino",)
+)
+
+
+class EstadoReplica:
+    """Disponibilidade e atraso da réplica, verificados no máximo a cada ``intervalo`` segundos"""
+
+    def __init__(self, engine, intervalo: float, max_atraso: float):
+        self.engine = engine
+        self.intervalo = intervalo
+        self.max_atraso = max_atraso
+        self.atraso = None
+        self.ultimo_erro = None
+        self._disponivel = False
+        self._verificado_em = None
+        self._lock = threading.Lock()
+
+    def verificar(self):
+        try:
+            with self.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    atraso = float(conn.execute(text(SQL_ATRASO)).scalar())
+                else:
+                    conn.execute(text("SELECT 1"))
+                    atraso = 0.0
+            self.atraso = atraso
+            self.ultimo_erro = None
+            self._disponivel = atraso <= self.max_atraso
+        except Exception as e:
+            self.atraso = None
+            self.ultimo_erro = str(e)
+            self._disponivel = False
+        self._verificado_em = time.monotonic()
+
+    def disponivel(self) -> bool:
+        """Uma única thread refaz a verificação vencida; as demais usam o último resultado"""
+        if self.engine is None:
+            return False
+        vencida = self._verificado_em is None or time.monotonic() - self._verificado_em >= self.intervalo
+        if vencida and self._lock.acquire(blocking=False):
+            try:
+                self.verificar()
+            finally:
+                self._lock.release()
+        return self._disponivel
+
+    def marcar_falha(self, erro: Exception):
+        """Tira a réplica de uso até a próxima verificação"""
+        self._disponivel = False
+        self.ultimo_erro = str(erro)
+        self._verificado_em = time.monotonic()
+
+
+class EscritasRecentes:
+    """Momento do último commit com escrita de cada usuário"""
+
+    def __init__(self, janela: float):
+        self.janela = janela
+        self._ultimas = {}
+        self._limpo_em = time.monotonic()
+        self._lock = threading.Lock()
+
+    def registrar(self, usuario_id: int):
+        agora = time.monotonic()
+        with self._lock:
+            self._ultimas[usuario_id] = agora
+            if agora - self._limpo_em > self.janela:
+                self._ultimas = {u: t for u, t in self._ultimas.items() if agora - t < self.janela}
+                self._limpo_em = agora
+
+    def recente(self, usuario_id: int) -> bool:
+        momento = self._ultimas.get(usuario_id)
+        return momento is not None and time.monotonic() - momento < self.janela
+
+
+estado_replica = EstadoReplica(
+    replica_engine, settings.REPLICA_VERIFICACAO_SEGUNDOS, settings.REPLICA_MAX_ATRASO_SEGUNDOS
+)
+escritas_recentes = EscritasRecentes(settings.REPLICA_LEITURA_PROPRIA_SEGUNDOS)
+
+
+if replica_engine is not None:
+    # get_current_user grava o id do usuário em session.info["usuario_id"]
+
+    @event.listens_for(SessionLocal, "after_flush")
+    def _marcar_flush(session, flush_context):
+        session.info["escreveu"] = True
+
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _marcar_execucao(orm_execute_state):
+        # update()/delete() em massa e insert() não passam pelo flush
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info["escreveu"] = True
+
+    @event.listens_for(SessionLocal, "after_commit")
+    def _registrar_escrita(session):
+        usuario_id = session.info.get("usuario_id")
+        if session.info.pop("escreveu", False) and usuario_id is not None:
+            escritas_recentes.registrar(usuario_id)
+
+    @event.listens_for(SessionLocal, "after_rollback")
+    def _descartar_escrita(session):
+        session.info.pop("escreveu", None)
+
+
+@registro_metricas.coletor
+def _coletar_replica():
+    if replica_engine is None:
+        return []
+    metricas = [
+        ("incluapp_db_replica_available", "gauge",
+         "Réplica de leitura em uso (1) ou leituras no primário (0)",
+         [("", {}, int(estado_replica._disponivel))]),
+    ]
+    if estado_replica.atraso is not None:
+        metricas.append(("incluapp_db_replica_lag_seconds", "gauge",
+                         "Atraso de replicação na última verificação",
+                         [("", {}, estado_replica.atraso)]))
+    return metricas
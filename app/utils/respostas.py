@@ -0,0 +1,27 @@
+"""
+Classe de resposta JSON padrão da aplicação (orjson)
+
+Rotas com ``response_model`` continuam no caminho rápido do FastAPI, que
+serializa direto para bytes com o Pydantic. Nas rotas que devolvem dicts e
+listas, o FastAPI passa o retorno pelo ``jsonable_encoder`` antes de
+``RespostaJSON``; as de payload grande (relatórios, listagens montadas à mão)
+devolvem ``RespostaJSON(...)`` diretamente e pulam essa etapa, já que o
+orjson serializa datetime, date, UUID e Enum nativamente.
+"""
+
+from decimal import Decimal
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def _padrao(valor):
+    # Agregações do PostgreSQL (avg, sum de numeric) chegam como Decimal
+    if isinstance(valor, Decimal):
+        return float(valor)
+    return jsonable_encoder(valor)
+
+
+class RespostaJSON(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_padrao, option=orjson.OPT_NON_STR_KEYS)
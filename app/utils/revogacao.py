@@ -0,0 +1,120 @@
+"""
+Lista de revogação de refresh tokens
+
+Mantida em memória como um dicionário compacto (16 bytes do jti -> expiração
+em epoch) para que a checagem no refresh não vá ao banco. Uma thread persiste
+periodicamente as novas revogações em ``tokens_revogados``, carrega as feitas
+por outras instâncias e descarta as já expiradas.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.dialects.postgresql import insert
+from app.config import settings
+from app.database import SessionLocal
+from app.models import TokenRevogado
+
+
+class RevogacaoTokens:
+    """Conjunto de jtis (ou famílias) revogados até a expiração"""
+
+    def __init__(self, intervalo: int):
+        self.intervalo = intervalo
+        self._revogados = {}
+        self._pendentes = []
+        self._lock = threading.Lock()
+        self._ultima_sync = None
+        self._parar = threading.Event()
+        self._thread = None
+
+    def revogar(self, jti: str, expira: int):
+        """Revoga um jti até sua expiração (epoch, como no claim ``exp``)"""
+        with self._lock:
+            self._revogados[bytes.fromhex(jti)] = expira
+            self._pendentes.append((jti, expira))
+
+    def esta_revogado(self, *jtis: str) -> bool:
+        """Verifica em memória se algum dos jtis informados foi revogado"""
+        agora = time.time()
+        for jti in jtis:
+            try:
+                expira = self._revogados.get(bytes.fromhex(jti))
+            except (TypeError, ValueError):
+                continue
+            if expira and expira > agora:
+                return True
+        return False
+
+    def sincronizar(self):
+        """Persiste as revogações pendentes, carrega as de outras instâncias e limpa as expiradas"""
+        with self._lock:
+            pendentes, self._pendentes = self._pendentes, []
+
+        db = SessionLocal()
+        try:
+            if pendentes:
+                stmt = insert(TokenRevogado).values([
+                    {"jti": jti, "expira_em": datetime.fromtimestamp(expira, timezone.utc)}
+                    for jti, expira in pendentes
+                ]).on_conflict_do_nothing(index_elements=["jti"])
+                db.execute(stmt)
+
+            agora = datetime.now(timezone.utc)
+            db.query(TokenRevogado).filter(TokenRevogado.expira_em < agora).delete(
+                synchronize_session=False
+            )
+            db.commit()
+
+            query = db.query(TokenRevogado.jti, TokenRevogado.expira_em)
+            if self._ultima_sync is not None:
+                # Margem de um intervalo cobre diferenças de relógio com o banco
+                margem = timedelta(seconds=self.intervalo)
+                query = query.filter(TokenRevogado.revogado_em >= self._ultima_sync - margem)
+            novos = query.all()
+            self._ultima_sync = agora
+        except Exception as e:
+            db.rollback()
+            # Devolve as pendentes para a próxima tentativa
+            with self._lock:
+                self._pendentes[:0] = pendentes
+            print(f"Erro ao sincronizar tokens revogados: {e}")
+            return
+        finally:
+            db.close()
+
+        limite = time.time()
+        with self._lock:
+            for r in novos:
+                self._revogados[bytes.fromhex(r.jti)] = int(r.expira_em.timestamp())
+            for chave in [k for k, v in self._revogados.items() if v <= limite]:
+                del self._revogados[chave]
+
+    def _loop(self):
+        while not self._parar.wait(self.intervalo):
+            self.sincronizar()
+
+    def iniciar(self):
+        """Carrega a lista do banco e inicia a sincronização periódica"""
+        self.sincronizar()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="revogacao-tokens", daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        """Interrompe a sincronização periódica e persiste o que estiver pendente"""
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.sincronizar()
+
+    def pendentes(self) -> int:
+        """Revogações ainda não persistidas no banco"""
+        return len(self._pendentes)
+
+    def __len__(self):
+        return len(self._revogados)
+
+
+revogacao_tokens = RevogacaoTokens(intervalo=settings.REVOGACAO_SYNC_SEGUNDOS)
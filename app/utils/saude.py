@@ -0,0 +1,114 @@
+"""
+Checagens de prontidão (readiness) da API
+
+Verifica banco (ping com tempo limite), saturação do pool de conexões, se o
+banco está na revisão head das migrações e o espaço livre no volume de
+uploads. O resultado fica em cache por alguns segundos para que as sondas do
+Docker e do balanceador não gerem carga no banco.
+"""
+
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from pathlib import Path
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from app.config import settings
+from app.database import engine
+from app.utils.prometheus import cache_consultas
+
+DIRETORIO_MIGRACOES = Path(__file__).resolve().parents[2] / "alembic"
+
+
+class VerificacaoProntidao:
+    """Executa as checagens de prontidão e guarda o último resultado"""
+
+    def __init__(self, cache_segundos: float):
+        self.cache_segundos = cache_segundos
+        self._lock = threading.Lock()
+        self._resultado = None
+        self._verificado_em = 0.0
+        self._heads = None
+        # Uma thread dedicada permite abandonar um ping travado sem bloquear o request
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ping-banco")
+
+    def verificar(self) -> dict:
+        """Retorna o resultado em cache ou refaz as checagens se ele expirou"""
+        with self._lock:
+            if self._resultado and time.monotonic() - self._verificado_em < self.cache_segundos:
+                cache_consultas.inc(cache="prontidao", resultado="hit")
+                return self._resultado
+            cache_consultas.inc(cache="prontidao", resultado="miss")
+
+            checagens = {
+                "banco": self._checar_banco(),
+                "pool_conexoes": self._checar_pool(),
+                "uploads": self._checar_uploads(),
+            }
+            self._resultado = {
+                "status": "ready" if all(c["ok"] for c in checagens.values()) else "not_ready",
+                "checagens": checagens,
+            }
+            self._verificado_em = time.monotonic()
+            return self._resultado
+
+    def _migracoes_head(self):
+        if self._heads is None:
+            self._heads = set(ScriptDirectory(str(DIRETORIO_MIGRACOES)).get_heads())
+        return self._heads
+
+    def _ping(self):
+        inicio = time.perf_counter()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            atual = set(MigrationContext.configure(conn).get_current_heads())
+        return (time.perf_counter() - inicio) * 1000, atual
+
+    def _checar_banco(self) -> dict:
+        try:
+            latencia_ms, atual = self._executor.submit(self._ping).result(
+                timeout=settings.PRONTIDAO_DB_TIMEOUT
+            )
+        except TimeoutError:
+            return {"ok": False, "erro": f"Sem resposta em {settings.PRONTIDAO_DB_TIMEOUT}s"}
+        except Exception as e:
+            return {"ok": False, "erro": e.__class__.__name__}
+
+        head = self._migracoes_head()
+        resultado = {
+            "ok": atual == head,
+            "latencia_ms": round(latencia_ms, 1),
+            "revisao_atual": sorted(atual),
+            "revisao_head": sorted(head),
+        }
+        if atual != head:
+            resultado["erro"] = "Banco fora da revisão head das migrações"
+        return resultado
+
+    def _checar_pool(self) -> dict:
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            return {"ok": True}
+        capacidade = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        em_uso = pool.checkedout()
+        uso = em_uso / capacidade if capacidade else 0
+        return {
+            "ok": uso < settings.PRONTIDAO_POOL_MAX_USO,
+            "em_uso": em_uso,
+            "capacidade": capacidade,
+        }
+
+    def _checar_uploads(self) -> dict:
+        try:
+            livre_mb = shutil.disk_usage(settings.UPLOAD_DIRECTORY).free / (1024 * 1024)
+        except OSError as e:
+            return {"ok": False, "erro": e.__class__.__name__}
+        return {
+            "ok": livre_mb >= settings.PRONTIDAO_UPLOAD_MIN_LIVRE_MB,
+            "livre_mb": round(livre_mb),
+        }
+
+
+verificacao_prontidao = VerificacaoProntidao(cache_segundos=settings.PRONTIDAO_CACHE_SEGUNDOS)
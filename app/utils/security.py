@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -5,7 +6,9 @@ from passlib.context import CryptContext
 from app.config import settings
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -31,11 +34,44 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def create_refresh_token(user_id: int, familia: Optional[str] = None) -> tuple:
+    """Cria um refresh token; retorna (token, jti, expiração).
+
+    A família identifica a cadeia de rotações iniciada em um login, permitindo
+    revogar todos os descendentes se um token já usado for reapresentado.
+    """
+    jti = uuid.uuid4().hex
+    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {
+        "sub": str(user_id),
+        "type": "refresh",
+        "jti": jti,
+        "fam": familia or jti,
+        "exp": expire,
+    }
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return encoded_jwt, jti, expire
+
+
 def decode_access_token(token: str) -> Optional[dict]:
-    """Decodifica um token JWT"""
+    """Decodifica um token JWT de acesso"""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    # Refresh tokens não podem ser usados como token de acesso
+    if payload.get("type") == "refresh":
+        return None
+    return payload
+
+
+def decode_refresh_token(token: str) -> Optional[dict]:
+    """Decodifica um refresh token JWT"""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    if payload.get("type") != "refresh" or not payload.get("jti"):
+        return None
+    return payload
 
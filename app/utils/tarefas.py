@@ -0,0 +1,82 @@
+"""
+Tarefas periódicas em thread de fundo
+
+Cada instância da API roda suas próprias tarefas; as que alteram o banco
+devem se coordenar com um advisory lock para rodar em uma instância por vez.
+"""
+
+import threading
+from contextlib import contextmanager
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+class TarefaPeriodica:
+    """Executa ``funcao`` a cada ``intervalo`` segundos em uma thread daemon.
+
+    ``despertar()`` antecipa a próxima execução (ex.: assim que há trabalho novo).
+    """
+
+    def __init__(self, nome: str, intervalo: float, funcao, executar_ao_iniciar: bool = True):
+        self.nome = nome
+        self.intervalo = intervalo
+        self.funcao = funcao
+        self.executar_ao_iniciar = executar_ao_iniciar
+        self._parar = threading.Event()
+        self._acordar = threading.Event()
+        self._thread = None
+
+    def _executar(self):
+        try:
+            self.funcao()
+        except Exception as e:
+            print(f"Erro na tarefa periódica {self.nome}: {e}")
+
+    def _loop(self):
+        if self.executar_ao_iniciar:
+            self._executar()
+        while True:
+            self._acordar.wait(self.intervalo)
+            self._acordar.clear()
+            if self._parar.is_set():
+                return
+            self._executar()
+
+    def iniciar(self):
+        if self._thread is None:
+            self._parar.clear()
+            self._acordar.clear()
+            self._thread = threading.Thread(target=self._loop, name=self.nome, daemon=True)
+            self._thread.start()
+
+    def despertar(self):
+        self._acordar.set()
+
+    def parar(self):
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+@contextmanager
+def lock_exclusivo(conn: Connection, chave: int):
+    """Advisory lock de sessão do PostgreSQL; produz False se outra instância já o detém.
+
+    Em outros bancos (ex.: sqlite) não há advisory locks; o banco é local a
+    uma instância e o lock é sempre concedido.
+    """
+    if conn.dialect.name != "postgresql":
+        yield True
+        return
+
+    obtido = conn.execute(text("SELECT pg_try_advisory_lock(:chave)"), {"chave": chave}).scalar()
+    conn.commit()
+    try:
+        yield obtido
+    finally:
+        if obtido:
+            conn.rollback()
+            conn.execute(text("SELECT pg_advisory_unlock(:chave)"), {"chave": chave})
+            conn.commit()
@@ -0,0 +1,13 @@
+"""
+Suíte de benchmark da API
+
+Execute a partir da raiz do projeto:
+    python -m scripts.benchmark gerar --escolas 2 --alunos-por-turma 25 --mensagens 5000
+    python -m scripts.benchmark executar --saida baseline.json
+    python -m scripts.benchmark executar --comparar baseline.json
+
+`gerar` popula o banco configurado em DATABASE_URL com dados sintéticos e
+grava um manifesto com as credenciais usadas pelos cenários. `executar` roda
+os cenários contra a aplicação em processo (ASGI) ou contra uma API em
+execução (--url) e registra throughput e percentis de latência em JSON.
+"""
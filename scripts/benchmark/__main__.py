@@ -0,0 +1,161 @@
+"""
+CLI da suíte de benchmark (veja scripts/benchmark/__init__.py)
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import httpx
+
+from scripts.benchmark.cenarios import CENARIOS
+
+# Métricas comparadas com o baseline: (campo, maior_e_pior)
+COMPARACOES = [("p95_ms", True), ("p99_ms", True), ("throughput_rps", False)]
+
+
+def comando_gerar(args):
+    from app.database import SessionLocal
+    from scripts.benchmark.gerador import gerar
+
+    db = SessionLocal()
+    try:
+        manifesto = gerar(
+            db,
+            prefixo=args.prefixo,
+            escolas=args.escolas,
+            turmas_por_escola=args.turmas_por_escola,
+            alunos_por_turma=args.alunos_por_turma,
+            mensagens=args.mensagens,
+            notificacoes=args.notificacoes,
+            metricas=args.metricas,
+            lote=args.lote,
+        )
+    finally:
+        db.close()
+
+    with open(args.manifesto, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, indent=2, ensure_ascii=False)
+    print(f"✅ Dados gerados; manifesto em {args.manifesto}")
+
+
+async def _executar_cenarios(args, manifesto):
+    if args.url:
+        cliente = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from app.main import app
+        cliente = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    resultados = {}
+    async with cliente:
+        for nome in args.cenarios:
+            resultados[nome] = await CENARIOS[nome](cliente, manifesto, args.requests, args.concorrencia)
+            r = resultados[nome]
+            print(
+                f"{nome:<15} {r['throughput_rps']:8.1f} req/s   p50 {r['p50_ms']:8.1f} ms   "
+                f"p95 {r['p95_ms']:8.1f} ms   p99 {r['p99_ms']:8.1f} ms   erros {r['erros']}"
+            )
+    return resultados
+
+
+def _versao_git():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _comparar(resultados, baseline, tolerancia):
+    """Imprime as regressões em relação ao baseline; retorna True se houver alguma"""
+    regressoes = []
+    for nome, atual in resultados.items():
+        anterior = baseline.get("cenarios", {}).get(nome)
+        if not anterior:
+            continue
+        for campo, maior_e_pior in COMPARACOES:
+            antes, agora = anterior.get(campo), atual.get(campo)
+            if not antes or agora is None:
+                continue
+            variacao = (agora - antes) / antes
+            if (variacao > tolerancia) if maior_e_pior else (variacao < -tolerancia):
+                regressoes.append(f"{nome}.{campo}: {antes} -> {agora} ({variacao:+.0%})")
+
+    if regressoes:
+        print(f"\n❌ Regressões acima de {tolerancia:.0%}:")
+        for r in regressoes:
+            print(f"  {r}")
+    else:
+        print(f"\n✅ Sem regressões acima de {tolerancia:.0%} em relação ao baseline")
+    return bool(regressoes)
+
+
+def comando_executar(args):
+    with open(args.manifesto, encoding="utf-8") as f:
+        manifesto = json.load(f)
+
+    resultados = asyncio.run(_executar_cenarios(args, manifesto))
+    relatorio = {
+        "gerado_em": datetime.now(timezone.utc).isoformat(),
+        "git": _versao_git(),
+        "alvo": args.url or "asgi",
+        "requests": args.requests,
+        "concorrencia": args.concorrencia,
+        "dados": {k: manifesto[k] for k in ("responsaveis", "alunos", "mensagens", "notificacoes", "metricas")},
+        "cenarios": resultados,
+    }
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if _comparar(resultados, baseline, args.tolerancia):
+            sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m scripts.benchmark", description="Benchmark da API")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    gerar = sub.add_parser("gerar", help="Popula o banco com dados sintéticos")
+    gerar.add_argument("--prefixo", default="bench", help="Prefixo dos emails e códigos gerados")
+    gerar.add_argument("--escolas", type=int, default=2)
+    gerar.add_argument("--turmas-por-escola", type=int, default=4)
+    gerar.add_argument("--alunos-por-turma", type=int, default=25)
+    gerar.add_argument("--mensagens", type=int, default=5000)
+    gerar.add_argument("--notificacoes", type=int, default=5000)
+    gerar.add_argument("--metricas", type=int, default=20000)
+    gerar.add_argument("--lote", type=int, default=1000, help="Linhas por insert")
+    gerar.add_argument("--manifesto", default="benchmark_manifesto.json")
+    gerar.set_defaults(funcao=comando_gerar)
+
+    executar = sub.add_parser("executar", help="Executa os cenários de carga")
+    executar.add_argument("--url", help="URL de uma API em execução (padrão: app em processo via ASGI)")
+    executar.add_argument("--cenarios", type=lambda v: v.split(","), default=list(CENARIOS),
+                          help=f"Lista separada por vírgulas ({', '.join(CENARIOS)})")
+    executar.add_argument("--requests", type=int, default=200, help="Requests por cenário")
+    executar.add_argument("--concorrencia", type=int, default=16)
+    executar.add_argument("--manifesto", default="benchmark_manifesto.json")
+    executar.add_argument("--saida", help="Arquivo JSON onde gravar os resultados (ex.: baseline.json)")
+    executar.add_argument("--comparar", help="Baseline JSON para detectar regressões")
+    executar.add_argument("--tolerancia", type=float, default=0.2,
+                          help="Variação aceita antes de acusar regressão (0.2 = 20%%)")
+    executar.set_defaults(funcao=comando_executar)
+
+    args = parser.parse_args()
+    if args.comando == "executar":
+        desconhecidos = set(args.cenarios) - set(CENARIOS)
+        if desconhecidos:
+            parser.error(f"Cenários desconhecidos: {', '.join(sorted(desconhecidos))}")
+    args.funcao(args)
+
+
+if __name__ == "__main__":
+    main()
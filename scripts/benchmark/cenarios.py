@@ -0,0 +1,149 @@
+"""
+Cenários de carga
+
+Cada cenário recebe um ``httpx.AsyncClient`` (ASGI em processo ou HTTP), o
+manifesto gerado por ``gerar`` e o número de requests/concorrência, e devolve
+o resultado de ``medir``. Logins de preparação não entram na medição.
+"""
+import asyncio
+import base64
+import time
+from scripts.benchmark.gerador import email
+
+CENARIOS = {}
+
+# PNG 1x1 usado no cenário de upload
+PNG_1X1 = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+
+def cenario(nome):
+    def registrar(funcao):
+        CENARIOS[nome] = funcao
+        return funcao
+    return registrar
+
+
+def _percentil(ordenadas, p):
+    if not ordenadas:
+        return None
+    return round(ordenadas[min(int(len(ordenadas) * p), len(ordenadas) - 1)] * 1000, 2)
+
+
+async def medir(total: int, concorrencia: int, chamada) -> dict:
+    """Executa ``chamada(i)`` ``total`` vezes com até ``concorrencia`` em paralelo"""
+    vagas = asyncio.Semaphore(concorrencia)
+    latencias, erros = [], []
+
+    async def executar(i):
+        async with vagas:
+            inicio = time.perf_counter()
+            try:
+                resposta = await chamada(i)
+                if resposta.status_code >= 400:
+                    erros.append(resposta.status_code)
+            except Exception as e:
+                erros.append(e.__class__.__name__)
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(executar(i) for i in range(total)))
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "requests": total,
+        "erros": len(erros),
+        "duracao_s": round(duracao, 3),
+        "throughput_rps": round(total / duracao, 2),
+        "p50_ms": _percentil(latencias, 0.50),
+        "p95_ms": _percentil(latencias, 0.95),
+        "p99_ms": _percentil(latencias, 0.99),
+        "max_ms": round(latencias[-1] * 1000, 2) if latencias else None,
+    }
+
+
+async def _login(cliente, usuario: str, senha: str) -> dict:
+    resposta = await cliente.post("/api/auth/login", data={"username": usuario, "password": senha})
+    resposta.raise_for_status()
+    return {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+
+
+async def _logins(cliente, usuarios, senha):
+    return await asyncio.gather(*(_login(cliente, u, senha) for u in usuarios))
+
+
+def _responsaveis(manifesto, quantidade):
+    n = min(quantidade, manifesto["responsaveis"])
+    return [email(manifesto["prefixo"], "resp", i) for i in range(n)]
+
+
+@cenario("login")
+async def pico_de_login(cliente, manifesto, total, concorrencia):
+    """Pico de logins de responsáveis distintos (custo do bcrypt)"""
+    usuarios = _responsaveis(manifesto, total)
+
+    async def chamada(i):
+        return await cliente.post("/api/auth/login", data={
+            "username": usuarios[i % len(usuarios)], "password": manifesto["senha"]
+        })
+    return await medir(total, concorrencia, chamada)
+
+
+@cenario("caixa_entrada")
+async def polling_caixa_entrada(cliente, manifesto, total, concorrencia):
+    """Responsáveis consultando a caixa de entrada e o contador de notificações"""
+    headers = await _logins(cliente, _responsaveis(manifesto, 50), manifesto["senha"])
+
+    async def chamada(i):
+        h = headers[i % len(headers)]
+        if i % 2:
+            return await cliente.get("/api/notificacoes/nao-lidas/count", headers=h)
+        return await cliente.get("/api/mensagens/", params={"limit": 20}, headers=h)
+    return await medir(total, concorrencia, chamada)
+
+
+@cenario("broadcast")
+async def broadcast_turma(cliente, manifesto, total, concorrencia):
+    """Professor enviando um comunicado para os responsáveis de uma turma"""
+    h = await _login(cliente, email(manifesto["prefixo"], "prof", 0), manifesto["senha"])
+    destinatarios = manifesto["destinatarios_broadcast"]
+
+    async def chamada(i):
+        return await cliente.post("/api/mensagens/broadcast", headers=h, json={
+            "destinatarios_ids": destinatarios,
+            "assunto": f"Comunicado {i}",
+            "conteudo": "Comunicado gerado pelo benchmark.",
+        })
+    return await medir(total, concorrencia, chamada)
+
+
+@cenario("dashboard")
+async def dashboard_gestor(cliente, manifesto, total, concorrencia):
+    """Carregamento do painel do gestor (relatórios e métricas agregadas)"""
+    h = await _login(cliente, manifesto["gestor"], manifesto["senha"])
+    rotas = [
+        "/api/relatorios/engajamento-geral",
+        "/api/relatorios/desempenho-alunos",
+        "/api/relatorios/comunicacao",
+        "/api/metricas/uso-por-perfil",
+    ]
+
+    async def chamada(i):
+        return await cliente.get(rotas[i % len(rotas)], headers=h)
+    return await medir(total, concorrencia, chamada)
+
+
+@cenario("upload")
+async def upload_foto(cliente, manifesto, total, concorrencia):
+    """Envio de fotos de perfil"""
+    headers = await _logins(cliente, _responsaveis(manifesto, 20), manifesto["senha"])
+
+    async def chamada(i):
+        return await cliente.post(
+            "/upload/profile-picture",
+            headers=headers[i % len(headers)],
+            files={"file": ("foto.png", PNG_1X1, "image/png")},
+        )
+    return await medir(total, concorrencia, chamada)
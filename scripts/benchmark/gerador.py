@@ -0,0 +1,314 @@
+"""
+Gerador de dados sintéticos para o benchmark e para o seed em escala
+
+Todos os usuários compartilham um único hash de senha. Cadastros são
+inseridos em lotes (executemany); mensagens, notificações e métricas são
+gravadas com COPY no PostgreSQL (executemany nos demais bancos), em lotes
+gerados sob demanda para que dezenas de milhões de linhas não fiquem em
+memória. A atividade segue distribuições próximas das de produção: poucos
+usuários concentram a maior parte das ações, dias úteis pesam mais que fins
+de semana e há picos de manhã, no almoço e à noite.
+"""
+import csv
+import io
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models import (
+    User, TipoUsuario, Escola, Turma, Turno, Professor, Responsavel, Aluno,
+    GestorEscolar, Mensagem, TipoMidia, Notificacao, TipoNotificacao,
+    MetricaEngajamento, professor_turma
+)
+from app.utils.security import get_password_hash
+
+SENHA = "bench123"
+DOMINIO = "incluapp.test"
+
+# (acao, categoria, peso)
+ACOES = [
+    ("login", "acesso", 30),
+    ("visualizar_mensagem", "comunicacao", 30),
+    ("enviar_mensagem", "comunicacao", 8),
+    ("visualizar_atividade", "atividade", 15),
+    ("visualizar_avaliacao", "avaliacao", 10),
+    ("visualizar_evento", "evento", 7),
+]
+DISPOSITIVOS = [("mobile", 65), ("desktop", 25), ("tablet", 10)]
+
+# Peso relativo de cada hora do dia (0h-23h) e de cada dia da semana (seg-dom)
+PESOS_HORA = [1, 1, 1, 1, 1, 2, 6, 12, 9, 6, 6, 8, 11, 9, 6, 6, 7, 9, 12, 14, 13, 9, 5, 2]
+PESOS_DIA_SEMANA = [10, 10, 10, 10, 9, 3, 2]
+FUSO_ESCOLAS = timezone(timedelta(hours=-3))  # horário de Brasília
+
+
+def _acumulados(pesos):
+    total, acumulados = 0, []
+    for peso in pesos:
+        total += peso
+        acumulados.append(total)
+    return acumulados
+
+
+def email(prefixo: str, papel: str, n: int) -> str:
+    return f"{prefixo}.{papel}{n}@{DOMINIO}"
+
+
+def _inserir(db: Session, tabela, linhas, lote: int, retornar=None):
+    """Insere ``linhas`` em lotes; com ``retornar``, devolve a coluna na ordem das linhas"""
+    ids = []
+    for inicio in range(0, len(linhas), lote):
+        parte = linhas[inicio:inicio + lote]
+        if retornar is None:
+            db.execute(insert(tabela), parte)
+        else:
+            stmt = insert(tabela).returning(retornar, sort_by_parameter_order=True)
+            ids.extend(r[0] for r in db.execute(stmt, parte))
+    return ids
+
+
+def _valor_copy(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    if hasattr(valor, "name"):  # Enum: o banco guarda o nome do membro
+        return valor.name
+    return valor
+
+
+def _gravar_em_massa(db: Session, tabela, colunas, total: int, fabrica, lote: int):
+    """Grava ``total`` linhas produzidas em lotes por ``fabrica(inicio, quantidade)``.
+
+    No PostgreSQL usa COPY (formato CSV) na conexão da sessão; nos demais
+    bancos, executemany. Há um commit por lote.
+    """
+    usar_copy = db.bind.dialect.name == "postgresql"
+    sql_copy = f"COPY {tabela.name} ({', '.join(colunas)}) FROM STDIN WITH (FORMAT csv)"
+    inicio_gravacao = time.perf_counter()
+    proximo_aviso = 1_000_000
+
+    for inicio in range(0, total, lote):
+        linhas = fabrica(inicio, min(lote, total - inicio))
+        if usar_copy:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows([_valor_copy(v) for v in linha] for linha in linhas)
+            buffer.seek(0)
+            cursor = db.connection().connection.cursor()
+            cursor.copy_expert(sql_copy, buffer)
+            cursor.close()
+        else:
+            db.execute(insert(tabela), [dict(zip(colunas, linha)) for linha in linhas])
+        db.commit()
+
+        gravadas = inicio + len(linhas)
+        if gravadas >= proximo_aviso:
+            print(f"  {tabela.name}: {gravadas:,} linhas ({time.perf_counter() - inicio_gravacao:.0f}s)")
+            proximo_aviso += 1_000_000
+
+
+class _Relogio:
+    """Sorteia instantes nos últimos ``dias`` respeitando os pesos por dia da semana e hora"""
+
+    def __init__(self, rnd: random.Random, agora: datetime, dias: int):
+        self.rnd = rnd
+        self.agora = agora.astimezone(FUSO_ESCOLAS)
+        meia_noite = self.agora.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.dias = [meia_noite - timedelta(days=d) for d in range(dias)]
+        self.dias_acumulados = _acumulados([PESOS_DIA_SEMANA[d.weekday()] for d in self.dias])
+        self.horas_acumuladas = _acumulados(PESOS_HORA)
+
+    def sortear(self, quantidade: int):
+        rnd = self.rnd
+        dias = rnd.choices(self.dias, cum_weights=self.dias_acumulados, k=quantidade)
+        horas = rnd.choices(range(24), cum_weights=self.horas_acumuladas, k=quantidade)
+        instantes = []
+        for dia, hora in zip(dias, horas):
+            instante = dia + timedelta(seconds=hora * 3600 + rnd.randrange(3600))
+            instantes.append(instante if instante <= self.agora else instante - timedelta(days=1))
+        return instantes
+
+
+def _pesos_atividade(rnd: random.Random, quantidade: int, fator: float = 1.0):
+    """Pesos no estilo Zipf, embaralhados: poucos usuários muito ativos, muitos pouco ativos"""
+    pesos = [fator / (posicao ** 0.8) for posicao in range(1, quantidade + 1)]
+    rnd.shuffle(pesos)
+    return pesos
+
+
+def gerar(db: Session, prefixo: str = "bench", escolas: int = 2, turmas_por_escola: int = 4,
+          alunos_por_turma: int = 25, mensagens: int = 5000, notificacoes: int = 5000,
+          metricas: int = 20000, lote: int = 1000, semente: int = 42) -> dict:
+    """Popula o banco e retorna o manifesto usado pelos cenários"""
+    rnd = random.Random(semente)
+    if db.query(User.id).filter(User.email == email(prefixo, "gestor", 0)).first():
+        raise ValueError(f"Já existem dados de benchmark com o prefixo '{prefixo}'")
+
+    senha_hash = get_password_hash(SENHA)
+    agora = datetime.now(timezone.utc)
+    ano = date.today().year
+
+    def usuario(papel, tipo, n):
+        return {
+            "email": email(prefixo, papel, n),
+            "senha_hash": senha_hash,
+            "nome_completo": f"{papel.capitalize()} {n}",
+            "tipo_usuario": tipo,
+            "ativo": True,
+        }
+
+    # Gestor
+    gestor_id, = _inserir(db, User.__table__, [usuario("gestor", TipoUsuario.GESTOR, 0)], lote, User.id)
+    _inserir(db, GestorEscolar.__table__, [{"user_id": gestor_id, "matricula": f"{prefixo}-G0"}], lote)
+
+    # Escolas e turmas
+    escola_ids = _inserir(db, Escola.__table__, [
+        {"nome": f"Escola {prefixo} {e}"} for e in range(escolas)
+    ], lote, Escola.id)
+    turmas = [
+        {
+            "escola_id": escola_id,
+            "nome": f"{6 + t % 4}º Ano {chr(65 + t // 4)}",
+            "codigo": f"{prefixo}-{e}-{t}",
+            "ano_letivo": ano,
+            "serie": f"{6 + t % 4}º ano",
+            "turno": Turno.MATUTINO if t % 2 == 0 else Turno.VESPERTINO,
+            "capacidade": alunos_por_turma,
+        }
+        for e, escola_id in enumerate(escola_ids) for t in range(turmas_por_escola)
+    ]
+    turma_ids = _inserir(db, Turma.__table__, turmas, lote, Turma.id)
+
+    # Um professor por turma, lecionando também na turma seguinte da mesma escola
+    prof_user_ids = _inserir(db, User.__table__, [
+        usuario("prof", TipoUsuario.PROFESSOR, n) for n in range(len(turma_ids))
+    ], lote, User.id)
+    prof_ids = _inserir(db, Professor.__table__, [
+        {"user_id": uid, "matricula": f"{prefixo}-P{n}"} for n, uid in enumerate(prof_user_ids)
+    ], lote, Professor.id)
+    vinculos = []
+    for n, prof_id in enumerate(prof_ids):
+        e, t = divmod(n, turmas_por_escola)
+        vinculos.append({"professor_id": prof_id, "turma_id": turma_ids[n]})
+        if turmas_por_escola > 1:
+            vinculos.append({
+                "professor_id": prof_id,
+                "turma_id": turma_ids[e * turmas_por_escola + (t + 1) % turmas_por_escola],
+            })
+    _inserir(db, professor_turma, vinculos, lote)
+
+    # Responsáveis: ~15% dos alunos são irmãos de um aluno anterior da mesma escola
+    total_alunos = len(turma_ids) * alunos_por_turma
+    dono = []
+    total_resp = 0
+    for i in range(total_alunos):
+        inicio_escola = i - i % (turmas_por_escola * alunos_por_turma)
+        if i > inicio_escola and rnd.random() < 0.15:
+            dono.append(dono[rnd.randrange(max(inicio_escola, i - alunos_por_turma * 2), i)])
+        else:
+            dono.append(total_resp)
+            total_resp += 1
+
+    resp_user_ids = _inserir(db, User.__table__, [
+        usuario("resp", TipoUsuario.RESPONSAVEL, n) for n in range(total_resp)
+    ], lote, User.id)
+    resp_ids = _inserir(db, Responsavel.__table__, [
+        {"user_id": uid, "parentesco": rnd.choice(["Mãe", "Mãe", "Pai", "Avó", "Tutor"])}
+        for uid in resp_user_ids
+    ], lote, Responsavel.id)
+
+    aluno_user_ids = _inserir(db, User.__table__, [
+        usuario("aluno", TipoUsuario.ALUNO, n) for n in range(total_alunos)
+    ], lote, User.id)
+    _inserir(db, Aluno.__table__, [
+        {
+            "user_id": uid,
+            "responsavel_id": resp_ids[dono[n]],
+            "turma_id": turma_ids[n // alunos_por_turma],
+            "escola_id": escola_ids[n // alunos_por_turma // turmas_por_escola],
+            "matricula": f"{prefixo}-A{n}",
+            "data_nascimento": date(ano - 12, 1, 1) + timedelta(days=rnd.randrange(1460)),
+            "necessidades_especiais": rnd.random() < 0.08,
+        }
+        for n, uid in enumerate(aluno_user_ids)
+    ], lote)
+    db.commit()
+
+    relogio = _Relogio(rnd, agora, 90)
+    pesos_resp = _acumulados(_pesos_atividade(rnd, len(resp_user_ids)))
+    pesos_prof = _acumulados(_pesos_atividade(rnd, len(prof_user_ids)))
+
+    # Mensagens: a maioria de professores para responsáveis; leitura em algumas horas
+    def mensagens_lote(inicio, quantidade):
+        profs = rnd.choices(prof_user_ids, cum_weights=pesos_prof, k=quantidade)
+        resps = rnd.choices(resp_user_ids, cum_weights=pesos_resp, k=quantidade)
+        linhas = []
+        for i, prof, resp, enviada in zip(range(inicio, inicio + quantidade), profs, resps,
+                                          relogio.sortear(quantidade)):
+            remetente, destinatario = (prof, resp) if rnd.random() < 0.8 else (resp, prof)
+            lida = rnd.random() < 0.7
+            lida_em = enviada + timedelta(hours=min(rnd.lognormvariate(1.1, 1.2), 24 * 14)) if lida else None
+            linhas.append((
+                remetente, destinatario, f"Assunto {i}", "Mensagem gerada para benchmark.",
+                TipoMidia.TEXTO, enviada, lida_em if lida_em and lida_em <= agora else None, lida,
+            ))
+        return linhas
+    _gravar_em_massa(db, Mensagem.__table__, [
+        "remetente_id", "destinatario_id", "assunto", "conteudo", "tipo_midia",
+        "enviada_em", "lida_em", "confirmacao_leitura",
+    ], mensagens, mensagens_lote, lote)
+
+    tipos_notificacao = list(TipoNotificacao)
+    def notificacoes_lote(inicio, quantidade):
+        usuarios = rnd.choices(resp_user_ids, cum_weights=pesos_resp, k=quantidade)
+        linhas = []
+        for i, usuario_id, criada in zip(range(inicio, inicio + quantidade), usuarios,
+                                         relogio.sortear(quantidade)):
+            # Notificações antigas tendem a já ter sido lidas
+            lida = rnd.random() < min(0.95, 0.3 + (agora - criada).days / 30)
+            linhas.append((
+                usuario_id, f"Notificação {i}", "Notificação gerada para benchmark.",
+                rnd.choice(tipos_notificacao), lida, criada,
+                criada + timedelta(hours=rnd.randrange(1, 72)) if lida else None,
+            ))
+        return linhas
+    _gravar_em_massa(db, Notificacao.__table__, [
+        "usuario_id", "titulo", "mensagem", "tipo", "lida", "criada_em", "lida_em",
+    ], notificacoes, notificacoes_lote, lote)
+
+    # Métricas: professores são individualmente mais ativos que responsáveis
+    usuarios_ativos = resp_user_ids + prof_user_ids
+    pesos_ativos = _acumulados(
+        _pesos_atividade(rnd, len(resp_user_ids)) + _pesos_atividade(rnd, len(prof_user_ids), fator=3.0)
+    )
+    acoes_acumuladas = _acumulados([peso for _, _, peso in ACOES])
+    dispositivos = [d for d, _ in DISPOSITIVOS]
+    dispositivos_acumulados = _acumulados([peso for _, peso in DISPOSITIVOS])
+    def metricas_lote(inicio, quantidade):
+        usuarios = rnd.choices(usuarios_ativos, cum_weights=pesos_ativos, k=quantidade)
+        acoes = rnd.choices(ACOES, cum_weights=acoes_acumuladas, k=quantidade)
+        aparelhos = rnd.choices(dispositivos, cum_weights=dispositivos_acumulados, k=quantidade)
+        return [
+            (usuario_id, acao, categoria, round(rnd.lognormvariate(4.5, 1.0), 1), instante, aparelho)
+            for usuario_id, (acao, categoria, _), aparelho, instante
+            in zip(usuarios, acoes, aparelhos, relogio.sortear(quantidade))
+        ]
+    _gravar_em_massa(db, MetricaEngajamento.__table__, [
+        "usuario_id", "acao", "categoria", "tempo_sessao", "timestamp", "dispositivo",
+    ], metricas, metricas_lote, lote)
+
+    # Destinatários do broadcast: responsáveis da primeira turma
+    primeira_turma = sorted({resp_user_ids[dono[n]] for n in range(min(alunos_por_turma, total_alunos))})
+    return {
+        "prefixo": prefixo,
+        "senha": SENHA,
+        "gestor": email(prefixo, "gestor", 0),
+        "professores": len(prof_user_ids),
+        "responsaveis": total_resp,
+        "alunos": total_alunos,
+        "escolas": escola_ids,
+        "turmas": turma_ids,
+        "destinatarios_broadcast": primeira_turma,
+        "mensagens": mensagens,
+        "notificacoes": notificacoes,
+        "metricas": metricas,
+    }
@@ -0,0 +1,91 @@
+"""
+Benchmark de throughput de login
+Execute: python scripts/benchmark_login.py [--logins 200] [--concorrencia 16]
+         python scripts/benchmark_login.py --url http://localhost:8000 --email gestor@escola.com --senha gestor123
+
+Sem --url, compara a verificação de senha inline (como nas threads de request)
+com a verificação no pool de processos. Com --url, dispara logins concorrentes
+contra uma API em execução.
+"""
+import sys
+import os
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+# Adiciona o diretório raiz ao path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.utils.security import pwd_context
+from app.utils.password_pool import PasswordPool
+
+
+def medir(nome, funcao, logins, concorrencia):
+    """Executa `funcao` `logins` vezes com `concorrencia` threads e imprime o resultado"""
+    latencias = []
+
+    def chamada(_):
+        inicio = time.perf_counter()
+        funcao()
+        latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as threads:
+        list(threads.map(chamada, range(logins)))
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    p95 = latencias[int(len(latencias) * 0.95) - 1]
+    print(
+        f"{nome:<28} {logins / duracao:8.1f} logins/s   "
+        f"p50 {statistics.median(latencias) * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms"
+    )
+
+
+def benchmark_local(args):
+    senha = "senha-benchmark"
+    hash_senha = pwd_context.hash(senha)
+    print(f"bcrypt rounds={settings.BCRYPT_ROUNDS}  logins={args.logins}  concorrencia={args.concorrencia}\n")
+
+    medir("inline (threads de request)", lambda: pwd_context.verify(senha, hash_senha),
+          args.logins, args.concorrencia)
+
+    pool = PasswordPool(workers=args.workers, max_fila=args.logins, timeout=60)
+    pool.verify_and_update(senha, hash_senha)  # aquece os processos
+    medir(f"pool de processos ({args.workers})", lambda: pool.verify_and_update(senha, hash_senha),
+          args.logins, args.concorrencia)
+    print(f"\n{pool.stats()}")
+    pool.shutdown()
+
+
+def benchmark_http(args):
+    import requests
+
+    def login():
+        resposta = requests.post(
+            f"{args.url}/api/auth/login",
+            data={"username": args.email, "password": args.senha},
+            timeout=60,
+        )
+        resposta.raise_for_status()
+
+    print(f"{args.url}  logins={args.logins}  concorrencia={args.concorrencia}\n")
+    medir("POST /api/auth/login", login, args.logins, args.concorrencia)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de throughput de login")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_POOL_WORKERS or os.cpu_count())
+    parser.add_argument("--url", help="URL base de uma API em execução")
+    parser.add_argument("--email")
+    parser.add_argument("--senha")
+    args = parser.parse_args()
+
+    if args.url:
+        benchmark_http(args)
+    else:
+        benchmark_local(args)
@@ -0,0 +1,130 @@
+"""
+Micro-benchmark de serialização e compressão das respostas JSON
+Execute: python scripts/benchmark_serializacao.py [--repeticoes 200] [--itens 100]
+
+Compara, em payloads parecidos com os de list_alunos (AlunoResponse com o
+usuário aninhado), list_responsaveis_turma e relatórios:
+  - JSONResponse: jsonable_encoder + json.dumps (caminho anterior das rotas sem response_model)
+  - RespostaJSON: jsonable_encoder + orjson (classe padrão atual, app/utils/respostas.py)
+  - RespostaJSON direto: orjson sem jsonable_encoder (rotas que devolvem RespostaJSON)
+  - response_model: validação + dump_json do Pydantic (rotas com response_model)
+e mostra o tamanho e o tempo de compressão com gzip e brotli.
+"""
+import sys
+import os
+import time
+import argparse
+import statistics
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import List
+
+# Adiciona o diretório raiz ao path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.models import TipoUsuario
+from app.schemas.aluno import AlunoResponse
+from app.utils.respostas import RespostaJSON
+from app.utils.compressao import _Compressor, brotli
+
+
+def gerar_alunos(n):
+    """Objetos com os atributos de Aluno/User, como os devolvidos pelo ORM"""
+    agora = datetime.now(timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i, user_id=1000 + i, responsavel_id=500 + i // 2, turma_id=1 + i // 30,
+            matricula=f"2026{i:05d}", data_nascimento=date(2015, 1 + i % 12, 1 + i % 28),
+            necessidades_especiais=i % 7 == 0,
+            descricao_necessidades="Baixa visão; material ampliado" if i % 7 == 0 else None,
+            pei_ativo=i % 7 == 0,
+            user=SimpleNamespace(
+                id=1000 + i, email=f"aluno{i}@escola.com", nome_completo=f"Aluno Exemplo {i}",
+                telefone="(11) 99999-0000", tipo_usuario=TipoUsuario.ALUNO, ativo=True, criado_em=agora,
+            ),
+        )
+        for i in range(n)
+    ]
+
+
+def gerar_responsaveis(n):
+    return [
+        {
+            "id": i, "user_id": 2000 + i, "nome_completo": f"Responsável Exemplo {i}",
+            "email": f"resp{i}@email.com", "telefone": "(11) 98888-0000", "parentesco": "Mãe",
+            "alunos": [{"id": 2 * i, "nome": f"Aluno Exemplo {2 * i}", "matricula": f"2026{2 * i:05d}"}],
+        }
+        for i in range(n)
+    ]
+
+
+def gerar_relatorio(n):
+    return {
+        "turma_id": 1,
+        "gerado_em": datetime.now(timezone.utc),
+        "alunos": [
+            {
+                "aluno_id": i, "nome": f"Aluno Exemplo {i}",
+                "medias": {f"disciplina_{d}": round(5 + (i * d) % 50 / 10, 2) for d in range(8)},
+                "frequencia_percentual": 100 - i % 15,
+                "em_risco": i % 9 == 0,
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def medir(nome, funcao, repeticoes):
+    """Executa `funcao` `repeticoes` vezes e imprime a mediana; devolve o último resultado"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    mediana = statistics.median(tempos)
+    print(f"  {nome:<34} {mediana * 1000:8.3f} ms   {1 / mediana:9.0f} respostas/s")
+    return resultado
+
+
+def comprimir(corpo, codificacao):
+    return _Compressor(codificacao).comprimir(corpo, fim=True)
+
+
+def benchmark(args):
+    adaptador = TypeAdapter(List[AlunoResponse])
+    alunos = gerar_alunos(args.itens)
+    payloads = {
+        f"list_alunos ({args.itens} AlunoResponse)": adaptador.validate_python(alunos, from_attributes=True),
+        f"list_responsaveis_turma ({args.itens})": gerar_responsaveis(args.itens),
+        f"relatório de turma ({args.itens} alunos)": gerar_relatorio(args.itens),
+    }
+    codificacoes = ["gzip"] + (["br"] if brotli is not None else [])
+
+    for nome, payload in payloads.items():
+        print(f"\n{nome}")
+        corpo = medir("JSONResponse (json.dumps)", lambda: JSONResponse(jsonable_encoder(payload)).body,
+                      args.repeticoes)
+        medir("RespostaJSON (orjson)", lambda: RespostaJSON(jsonable_encoder(payload)).body, args.repeticoes)
+        if not nome.startswith("list_alunos"):
+            medir("RespostaJSON direto", lambda: RespostaJSON(payload).body, args.repeticoes)
+        else:
+            medir("response_model (Pydantic dump_json)",
+                  lambda: adaptador.dump_json(adaptador.validate_python(alunos, from_attributes=True)),
+                  args.repeticoes)
+
+        print(f"  {'tamanho sem compressão':<34} {len(corpo):8d} bytes")
+        for codificacao in codificacoes:
+            comprimido = medir(f"{codificacao}", lambda: comprimir(corpo, codificacao), args.repeticoes)
+            print(f"  {'':<34} {len(comprimido):8d} bytes ({len(comprimido) / len(corpo):.0%})")
+    if brotli is None:
+        print("\nbrotli não instalado: apenas gzip medido (pip install brotli)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark de serialização e compressão")
+    parser.add_argument("--repeticoes", type=int, default=200)
+    parser.add_argument("--itens", type=int, default=100)
+    benchmark(parser.parse_args())
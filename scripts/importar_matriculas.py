@@ -0,0 +1,48 @@
+"""
+Script para importar alunos e responsáveis em lote a partir de um CSV
+Execute: python scripts/importar_matriculas.py alunos.csv [--gravar] [--ignorar-erros]
+
+Colunas obrigatórias: aluno_nome, aluno_email, aluno_senha, matricula
+Colunas opcionais: turma_codigo, data_nascimento, necessidades_especiais,
+descricao_necessidades, responsavel_nome, responsavel_email, responsavel_senha,
+responsavel_telefone, responsavel_cpf, parentesco
+"""
+import sys
+import os
+import json
+import argparse
+
+# Adiciona o diretório raiz ao path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.importacao import ImportacaoService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importação de matrículas via CSV")
+    parser.add_argument("arquivo", help="Caminho do arquivo CSV (UTF-8)")
+    parser.add_argument("--gravar", action="store_true", help="Grava no banco (padrão: apenas valida)")
+    parser.add_argument("--ignorar-erros", action="store_true", help="Importa as linhas válidas mesmo havendo erros")
+    parser.add_argument("--lote", type=int, default=500, help="Linhas por transação")
+    args = parser.parse_args()
+
+    with open(args.arquivo, encoding="utf-8-sig") as f:
+        conteudo = f.read()
+
+    db = SessionLocal()
+    try:
+        relatorio = ImportacaoService.importar(
+            db, conteudo, dry_run=not args.gravar,
+            ignorar_erros=args.ignorar_erros, tamanho_lote=args.lote
+        )
+    finally:
+        db.close()
+
+    print(json.dumps(relatorio, indent=2, ensure_ascii=False))
+    if relatorio["erros"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
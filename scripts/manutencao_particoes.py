@@ -0,0 +1,44 @@
+"""
+Script para a manutenção das partições mensais de metricas_engajamento
+Execute: python scripts/manutencao_particoes.py [--listar]
+
+Cria as partições dos próximos METRICAS_MESES_ADIANTE meses e arquiva (em
+ARQUIVO_DIRECTORY) as anteriores a METRICAS_RETENCAO_MESES. A API já executa
+a mesma rotina periodicamente; o script serve para rodá-la sob demanda.
+"""
+import sys
+import os
+import json
+import argparse
+
+# Adiciona o diretório raiz ao path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import engine
+from app.services.particoes import ParticionamentoService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manutenção das partições de métricas")
+    parser.add_argument("--listar", action="store_true", help="Apenas lista as partições existentes")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        print("❌ O particionamento exige PostgreSQL")
+        sys.exit(1)
+
+    if args.listar:
+        with engine.connect() as conn:
+            particoes = ParticionamentoService.listar_particoes(conn)
+        print(json.dumps(particoes, indent=2, default=str))
+        return
+
+    resultado = ParticionamentoService.executar_manutencao()
+    if resultado is None:
+        print("⚠️  Outra instância está executando a manutenção")
+        sys.exit(1)
+    print(json.dumps(resultado, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
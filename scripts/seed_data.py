@@ -1,15 +1,21 @@
 """
 Script para popular o banco de dados com dados de exemplo
 Execute: python scripts/seed_data.py
+
+Modo escala (volumes de produção, sem os usuários de exemplo):
+    python scripts/seed_data.py --escala --escolas 20 --alunos 20000 --mensagens 2M --metricas 20M
 """
 import sys
 import os
+import math
+import time
+import argparse
 from datetime import date, datetime, timedelta
 
 # Adiciona o diretório raiz ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import SessionLocal
+from app.database import SessionLocal, engine
 from app.models import (
     User, TipoUsuario, Professor, Responsavel, Aluno, GestorEscolar,
     Disciplina, Turma, Turno, NivelLiteraciaDigital
@@ -166,7 +172,71 @@ def seed_database():
         db.close()
 
 
+def quantidade(valor: str) -> int:
+    """Converte quantidades como 20000, 500k, 2M ou 1.5M"""
+    multiplicadores = {"k": 1_000, "m": 1_000_000}
+    valor = valor.strip().lower().replace("_", "")
+    if valor and valor[-1] in multiplicadores:
+        return int(float(valor[:-1]) * multiplicadores[valor[-1]])
+    return int(valor)
+
+
+def seed_escala(args):
+    """Popula o banco com volumes de produção usando o gerador do benchmark"""
+    from scripts.benchmark.gerador import gerar
+
+    # Turmas de até ~30 alunos, distribuídas igualmente entre as escolas
+    turmas_por_escola = max(1, math.ceil(args.alunos / args.escolas / 30))
+    alunos_por_turma = max(1, math.ceil(args.alunos / (args.escolas * turmas_por_escola)))
+
+    # O echo de SQL do ambiente de desenvolvimento dominaria o tempo com milhões de linhas
+    engine.echo = False
+
+    db = SessionLocal()
+    inicio = time.perf_counter()
+    try:
+        manifesto = gerar(
+            db,
+            prefixo=args.prefixo,
+            escolas=args.escolas,
+            turmas_por_escola=turmas_por_escola,
+            alunos_por_turma=alunos_por_turma,
+            mensagens=args.mensagens,
+            notificacoes=args.notificacoes,
+            metricas=args.metricas,
+            lote=args.lote,
+        )
+    except Exception as e:
+        print(f"\n❌ Erro ao popular banco de dados: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"\n✅ Banco populado em {time.perf_counter() - inicio:.0f}s")
+    print(f"Escolas: {len(manifesto['escolas'])}  Turmas: {len(manifesto['turmas'])}  "
+          f"Professores: {manifesto['professores']}  Responsáveis: {manifesto['responsaveis']}  "
+          f"Alunos: {manifesto['alunos']}")
+    print(f"Mensagens: {manifesto['mensagens']:,}  Notificações: {manifesto['notificacoes']:,}  "
+          f"Métricas: {manifesto['metricas']:,}")
+    print(f"\nTodos os usuários usam a senha '{manifesto['senha']}' (ex.: {manifesto['gestor']})")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Popula o banco de dados")
+    parser.add_argument("--escala", action="store_true", help="Gera volumes de produção em vez dos dados de exemplo")
+    parser.add_argument("--escolas", type=int, default=20)
+    parser.add_argument("--alunos", type=quantidade, default=20000)
+    parser.add_argument("--mensagens", type=quantidade, default=2_000_000)
+    parser.add_argument("--notificacoes", type=quantidade, default=1_000_000)
+    parser.add_argument("--metricas", type=quantidade, default=20_000_000)
+    parser.add_argument("--lote", type=quantidade, default=50_000, help="Linhas por COPY/insert")
+    parser.add_argument("--prefixo", default="seed", help="Prefixo dos emails e códigos gerados")
+    args = parser.parse_args()
+
     print("🌱 Iniciando seed do banco de dados...")
-    seed_database()
+    if args.escala:
+        seed_escala(args)
+    else:
+        seed_database()
 
@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+# Banco sqlite descartável; precisa estar definido antes de importar a app
+_banco = os.path.join(tempfile.mkdtemp(), "testes.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_banco}"
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("PASSWORD_POOL_WORKERS", "0")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, engine, SessionLocal
+from app.main import app as aplicacao
+from app.models import User
+from app.utils.security import get_password_hash
+
+SENHA = "senha123"
+
+
+@pytest.fixture()
+def db():
+    Base.metadata.create_all(engine)
+    sessao = SessionLocal()
+    try:
+        yield sessao
+    finally:
+        sessao.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture()
+def client(db):
+    # Sem o contexto ``with``, os eventos de startup (tarefas de fundo) não rodam
+    return TestClient(aplicacao)
+
+
+@pytest.fixture()
+def criar_usuario(db):
+    def criar(email, tipo):
+        usuario = User(
+            email=email, nome_completo=email.split("@")[0], tipo_usuario=tipo,
+            senha_hash=get_password_hash(SENHA),
+        )
+        db.add(usuario)
+        db.flush()
+        return usuario
+    return criar
+
+
+@pytest.fixture()
+def autenticar(client):
+    def autenticar(email):
+        resposta = client.post("/api/auth/login", data={"username": email, "password": SENHA})
+        return {"Authorization": f"Bearer {resposta.json()['access_token']}"}
+    return autenticar
@@ -0,0 +1,27 @@
+from app.models import Mensagem, TipoUsuario
+from app.services.busca import _html_destacado, INICIO_DESTAQUE, FIM_DESTAQUE
+
+
+def test_destaque_escapa_o_texto():
+    fragmento = f'<img src=x onerror="alert(1)"> {INICIO_DESTAQUE}reunião{FIM_DESTAQUE}'
+    assert _html_destacado(fragmento) == (
+        "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>reunião</mark>"
+    )
+
+
+def test_busca_nao_devolve_html_do_remetente(db, client, criar_usuario, autenticar):
+    remetente = criar_usuario("prof@x.com", TipoUsuario.PROFESSOR)
+    destinatario = criar_usuario("resp@x.com", TipoUsuario.RESPONSAVEL)
+    db.add(Mensagem(
+        remetente_id=remetente.id, destinatario_id=destinatario.id,
+        assunto="<script>alert(1)</script> Reunião de pais",
+        conteudo='<img src=x onerror="alert(1)"> A reunião será na sexta',
+    ))
+    db.commit()
+
+    resposta = client.get("/api/busca/", params={"q": "reunião"}, headers=autenticar("resp@x.com"))
+    assert resposta.status_code == 200
+    [resultado] = resposta.json()
+    for campo in ("titulo", "trecho"):
+        assert "<mark>" in resultado[campo]
+        assert "<script" not in resultado[campo] and "<img" not in resultado[campo]
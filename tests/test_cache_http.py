@@ -0,0 +1,13 @@
+from app.models import Escola, TipoUsuario
+
+
+def test_etag_exige_autenticacao(db, client, criar_usuario, autenticar):
+    db.add(Escola(nome="Escola 1"))
+    criar_usuario("gestor@x.com", TipoUsuario.GESTOR)
+    db.commit()
+    headers = autenticar("gestor@x.com")
+
+    etag = client.get("/api/escolas/", headers=headers).headers["etag"]
+
+    assert client.get("/api/escolas/", headers={**headers, "If-None-Match": etag}).status_code == 304
+    assert client.get("/api/escolas/", headers={"If-None-Match": etag}).status_code == 401
@@ -0,0 +1,34 @@
+from datetime import date
+from app.models import Escola, Turma, Turno, Disciplina, Atividade, Aluno, Notificacao, TipoUsuario
+
+
+def test_reenviar_notas_nao_notifica_de_novo(db, client, criar_usuario, autenticar):
+    db.add(Escola(id=1, nome="Escola 1"))
+    db.flush()
+    db.add_all([
+        Turma(id=1, nome="1A", codigo="1A", escola_id=1, ano_letivo=2026, serie="1", turno=Turno.MATUTINO),
+        Disciplina(id=1, nome="Matemática", codigo="MAT"),
+    ])
+    db.flush()
+    atividade = Atividade(turma_id=1, disciplina_id=1, titulo="Lista 1", descricao="-", data_entrega=date(2026, 11, 1))
+    alunos = [
+        Aluno(user_id=criar_usuario(f"aluno{i}@x.com", TipoUsuario.ALUNO).id, matricula=f"M{i}", turma_id=1)
+        for i in range(2)
+    ]
+    criar_usuario("gestor@x.com", TipoUsuario.GESTOR)
+    db.add_all([atividade, *alunos])
+    db.commit()
+    headers = autenticar("gestor@x.com")
+    url = f"/api/atividades/{atividade.id}/entregas/notas"
+    lote = {"notas": [{"aluno_id": alunos[0].id, "nota": 8}, {"aluno_id": alunos[1].id, "nota": 6}]}
+
+    assert client.post(url, headers=headers, json=lote).json()["notificacoes_criadas"] == 2
+    assert client.post(url, headers=headers, json=lote).json()["notificacoes_criadas"] == 0
+
+    lote["notas"][1]["nota"] = 7
+    assert client.post(url, headers=headers, json=lote).json()["total_avaliadas"] == 2
+
+    # Só o aluno cuja nota mudou recebe outro aviso (que pode entrar no resumo da turma)
+    def avisos(aluno):
+        return sum(n.quantidade for n in db.query(Notificacao).filter(Notificacao.usuario_id == aluno.user_id))
+    assert [avisos(aluno) for aluno in alunos] == [1, 2]
@@ -0,0 +1,57 @@
+from app.models import Escola, Turma, Turno, Aluno, Responsavel, Professor, TipoUsuario, professor_turma
+
+
+def _cenario(db, criar_usuario):
+    """Responsável com um filho na escola 1 e outro ainda sem turma; professor da escola 2"""
+    db.add_all([Escola(id=1, nome="Escola 1"), Escola(id=2, nome="Escola 2")])
+    db.flush()
+    db.add_all([
+        Turma(id=1, nome="1A", codigo="1A", escola_id=1, ano_letivo=2026, serie="1", turno=Turno.MATUTINO),
+        Turma(id=2, nome="2A", codigo="2A", escola_id=2, ano_letivo=2026, serie="2", turno=Turno.MATUTINO),
+    ])
+    db.flush()
+
+    responsavel = Responsavel(user_id=criar_usuario("resp@x.com", TipoUsuario.RESPONSAVEL).id)
+    db.add(responsavel)
+    db.flush()
+    com_turma = Aluno(
+        user_id=criar_usuario("aluno1@x.com", TipoUsuario.ALUNO).id, matricula="M1",
+        turma_id=1, responsavel_id=responsavel.id,
+    )
+    sem_turma = Aluno(
+        user_id=criar_usuario("aluno2@x.com", TipoUsuario.ALUNO).id, matricula="M2",
+        responsavel_id=responsavel.id,
+    )
+    professor = Professor(user_id=criar_usuario("prof@x.com", TipoUsuario.PROFESSOR).id, matricula="P1")
+    db.add_all([com_turma, sem_turma, professor])
+    db.flush()
+    db.execute(professor_turma.insert().values(professor_id=professor.id, turma_id=2))
+    db.commit()
+    return com_turma.id, sem_turma.id
+
+
+def test_responsavel_ve_filho_sem_turma(db, client, criar_usuario, autenticar):
+    com_turma, sem_turma = _cenario(db, criar_usuario)
+    headers = autenticar("resp@x.com")
+
+    resposta = client.get("/api/alunos/", headers=headers)
+    assert resposta.status_code == 200
+    assert {a["id"] for a in resposta.json()} == {com_turma, sem_turma}
+
+    assert client.get(f"/api/alunos/{sem_turma}", headers=headers).status_code == 200
+    assert client.get(f"/api/atividades/pendentes/aluno/{sem_turma}", headers=headers).status_code == 200
+
+
+def test_aluno_sem_turma_ve_os_proprios_dados(db, client, criar_usuario, autenticar):
+    _, sem_turma = _cenario(db, criar_usuario)
+    headers = autenticar("aluno2@x.com")
+
+    assert client.get(f"/api/atividades/pendentes/aluno/{sem_turma}", headers=headers).status_code == 200
+
+
+def test_aluno_sem_turma_fora_do_escopo_de_outras_escolas(db, client, criar_usuario, autenticar):
+    com_turma, sem_turma = _cenario(db, criar_usuario)
+    headers = autenticar("prof@x.com")
+
+    ids = {a["id"] for a in client.get("/api/alunos/", headers=headers).json()}
+    assert com_turma not in ids and sem_turma not in ids
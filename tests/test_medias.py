@@ -0,0 +1,16 @@
+from app.models import Aluno, Responsavel, TipoUsuario
+
+
+def test_medias_restritas_aos_filhos_do_responsavel(db, client, criar_usuario, autenticar):
+    responsavel = Responsavel(user_id=criar_usuario("resp@x.com", TipoUsuario.RESPONSAVEL).id)
+    db.add(responsavel)
+    db.flush()
+    filho = Aluno(user_id=criar_usuario("filho@x.com", TipoUsuario.ALUNO).id, matricula="M1",
+                  responsavel_id=responsavel.id)
+    outro = Aluno(user_id=criar_usuario("outro@x.com", TipoUsuario.ALUNO).id, matricula="M2")
+    db.add_all([filho, outro])
+    db.commit()
+    headers = autenticar("resp@x.com")
+
+    assert client.get(f"/api/avaliacoes/aluno/{filho.id}/medias", headers=headers).status_code == 200
+    assert client.get(f"/api/avaliacoes/aluno/{outro.id}/medias", headers=headers).status_code == 403